@@ -0,0 +1,4 @@
+'''
+Inicializando modulo.
+'''
+from .occupancy import OccupancyAnalytics
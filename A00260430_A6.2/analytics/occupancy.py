@@ -0,0 +1,225 @@
+'''
+Codigo fuente de la clase OccupancyAnalytics, reportes de ocupacion de los
+hoteles calculados con NumPy.
+
+La ocupacion de un hotel en un anio se copia del estado de Hotel (ver
+Hotel.occupancy_snapshot) a una matriz booleana cuartos x dias y los
+reportes se calculan con operaciones vectorizadas sobre la matriz, sin
+recorrer cuartos ni dias en Python.
+
+NumPy es opcional: si no esta instalado los reportes regresan
+NUMPY_NOT_AVAILABLE.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import datetime
+from hotel import Hotel
+from hotel.room_calendar import DAYS_PER_YEAR
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+OK_STATUS = 0
+NUMPY_NOT_AVAILABLE = -401
+INVALID_FIELD = -410
+DAYS_PER_WEEK = 7
+
+
+def _valid_year(year) -> bool:
+    '''
+    Función privada que indica si el anio es un entero valido para datetime.
+    '''
+    return (isinstance(year, int)
+            and datetime.MINYEAR <= year <= datetime.MAXYEAR)
+
+
+class OccupancyAnalytics():
+    '''
+    Clase OccupancyAnalytics. Los reportes son de un hotel y un anio; las
+    tasas de ocupacion son noches vendidas entre noches disponibles.
+
+    Metodos privados
+    + _load - obtiene la matriz de ocupacion y las reservaciones
+    + _rates - tasa de ocupacion de periodos de dias
+
+    Metodos publicos
+    + occupancy_by_day - tasa de ocupacion de cada dia
+    + occupancy_by_week - tasa de ocupacion de cada semana (desde el 1 de enero)
+    + occupancy_by_month - tasa de ocupacion de cada mes
+    + nights_sold - noches vendidas en el anio
+    + peak_days - dias con mas cuartos ocupados
+    + length_of_stay_histogram - numero de estancias por noches
+    + customer_nights - noches por cliente
+    + utilization - tasa de ocupacion del anio de cada hotel
+    '''
+    def __init__(self, hotel: Hotel = None):
+        self.hotel = hotel if hotel is not None else Hotel()
+
+    def _load(self, name: str, year: int) -> tuple:
+        '''
+        Metodo privado que obtiene la matriz booleana cuartos x dias del
+        anio (365 o 366 dias) y las reservaciones del hotel.
+
+        Regresa una tupla (err, matriz, reservaciones)
+        '''
+        if numpy is None:
+            return NUMPY_NOT_AVAILABLE, None, None
+        if not _valid_year(year):
+            return INVALID_FIELD, None, None
+
+        status, snapshot = self.hotel.occupancy_snapshot(name, year)
+        if status != OK_STATUS:
+            return status, None, None
+
+        days = datetime.date(year, 12, 31).timetuple().tm_yday
+        matrix = numpy.frombuffer(snapshot['occupied'], dtype=numpy.uint8)
+        matrix = matrix.reshape(snapshot['rooms'], DAYS_PER_YEAR)[:, :days]
+        return OK_STATUS, matrix.astype(bool), snapshot['bookings']
+
+    def _rates(self, name: str, year: int, starts: list) -> tuple[int, list]:
+        '''
+        Metodo privado que calcula la tasa de ocupacion de los periodos que
+        empiezan en los dias (base 0) indicados.
+        '''
+        status, matrix, _ = self._load(name, year)
+        if status != OK_STATUS:
+            return status, []
+
+        starts = numpy.array(starts)
+        sold = numpy.add.reduceat(matrix.sum(axis=0), starts)
+        lengths = numpy.diff(numpy.append(starts, matrix.shape[1]))
+        return OK_STATUS, (sold / (lengths * matrix.shape[0])).tolist()
+
+    def occupancy_by_day(self, name: str, year: int) -> tuple[int, list]:
+        '''
+        Metodo publico para obtener la tasa de ocupacion de cada dia del
+        anio.
+
+        Regresa una tupla (err, lista de tasas)
+        '''
+        status, matrix, _ = self._load(name, year)
+        if status != OK_STATUS:
+            return status, []
+
+        return OK_STATUS, matrix.mean(axis=0).tolist()
+
+    def occupancy_by_week(self, name: str, year: int) -> tuple[int, list]:
+        '''
+        Metodo publico para obtener la tasa de ocupacion de cada semana de 7
+        dias contados desde el 1 de enero (la ultima semana es mas corta).
+
+        Regresa una tupla (err, lista de tasas)
+        '''
+        if not _valid_year(year):
+            return INVALID_FIELD, []
+        days = datetime.date(year, 12, 31).timetuple().tm_yday
+        return self._rates(name, year, list(range(0, days, DAYS_PER_WEEK)))
+
+    def occupancy_by_month(self, name: str, year: int) -> tuple[int, list]:
+        '''
+        Metodo publico para obtener la tasa de ocupacion de cada mes.
+
+        Regresa una tupla (err, lista de 12 tasas)
+        '''
+        if not _valid_year(year):
+            return INVALID_FIELD, []
+        return self._rates(name, year, [
+            datetime.date(year, month, 1).timetuple().tm_yday - 1
+            for month in range(1, 13)
+        ])
+
+    def nights_sold(self, name: str, year: int) -> tuple[int, int]:
+        '''
+        Metodo publico para obtener las noches vendidas (cuartos ocupados por
+        dia) en el anio.
+
+        Regresa una tupla (err, noches)
+        '''
+        status, matrix, _ = self._load(name, year)
+        if status != OK_STATUS:
+            return status, 0
+
+        return OK_STATUS, int(matrix.sum())
+
+    def peak_days(self, name: str, year: int, top: int = 5) -> tuple[int, list]:
+        '''
+        Metodo publico para obtener los top dias con mas cuartos ocupados; los
+        empates se ordenan por fecha.
+
+        Regresa una tupla (err, lista de [fecha ISO, cuartos ocupados])
+        '''
+        status, matrix, _ = self._load(name, year)
+        if status != OK_STATUS:
+            return status, []
+
+        sold = matrix.sum(axis=0)
+        first_day = datetime.date(year, 1, 1).toordinal()
+        return OK_STATUS, [
+            [datetime.date.fromordinal(first_day + int(day)).isoformat(),
+             int(sold[day])]
+            for day in numpy.argsort(-sold, kind='stable')[:top]
+        ]
+
+    def length_of_stay_histogram(self, name: str, year: int) -> tuple[int, dict]:
+        '''
+        Metodo publico para obtener el numero de estancias por noches. Una
+        estancia que cruza el fin de anio cuenta con sus noches del anio.
+
+        Regresa una tupla (err, {noches: estancias})
+        '''
+        status, _, bookings = self._load(name, year)
+        if status != OK_STATUS:
+            return status, {}
+
+        counts = numpy.bincount(
+            numpy.array([booking[2] for booking in bookings], dtype=numpy.int64)
+        )
+        return OK_STATUS, {
+            int(nights): int(counts[nights]) for nights in numpy.flatnonzero(counts)
+        }
+
+    def customer_nights(self, name: str, year: int) -> tuple[int, dict]:
+        '''
+        Metodo publico para obtener las noches reservadas por cada cliente en
+        el anio.
+
+        Regresa una tupla (err, {numero de cliente: noches})
+        '''
+        status, _, bookings = self._load(name, year)
+        if status != OK_STATUS or not bookings:
+            return status, {}
+
+        customers, inverse = numpy.unique(
+            numpy.array([booking[3] for booking in bookings]), return_inverse=True
+        )
+        nights = numpy.bincount(
+            inverse,
+            weights=numpy.array([booking[2] for booking in bookings])
+        )
+        return OK_STATUS, {
+            str(customer_no): int(total)
+            for customer_no, total in zip(customers, nights)
+        }
+
+    def utilization(self, year: int, names=None) -> tuple[int, dict]:
+        '''
+        Metodo publico para obtener la tasa de ocupacion del anio de cada
+        hotel (por omision de todos los hoteles).
+
+        Regresa una tupla (err, {hotel: tasa})
+        '''
+        result = {}
+        if names is None:
+            names = sorted(self.hotel.hotel_dicc)
+
+        for name in names:
+            status, matrix, _ = self._load(name, year)
+            if status != OK_STATUS:
+                return status, {}
+            result[name] = float(matrix.mean())
+
+        return OK_STATUS, result
@@ -1,4 +1,5 @@
-'''
-Inicializando modulo.
-'''
-from .customer import Customer
\ No newline at end of file
+'''
+Inicializando modulo.
+'''
+from .customer import Customer
+from .async_customer import AsyncCustomer
\ No newline at end of file
@@ -0,0 +1,97 @@
+'''
+Codigo fuente de la clase AsyncCustomer, version asincrona (asyncio) de
+Customer.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+from persistence import new_executor, run_blocking
+from .customer import Customer
+
+
+class AsyncCustomer():
+    '''
+    Clase AsyncCustomer. Cada metodo publico de Customer tiene aqui una
+    version con async que lo ejecuta en el executor (ver
+    persistence.async_io), de modo que los candados y archivos no bloquean el
+    ciclo de eventos.
+
+    Si no se recibe customer se crea uno con el store indicado. Si no se
+    recibe executor se crea uno con new_executor; las llamadas pueden correr
+    en paralelo porque Customer toma su propio candado.
+
+    Metodos publicos
+    + create_customer, delete_customer, display_customer_info
+    + modify_customer_info, import_customers, find_customers
+    + list_customers_born_before, flush
+    '''
+    def __init__(self, customer: Customer = None, store=None, executor=None):
+        self.customer = customer if customer is not None else Customer(store=store)
+        self.executor = executor or new_executor('customer')
+
+    async def create_customer(self, *args, **kwargs) -> tuple[int, str]:
+        '''
+        Version asincrona de Customer.create_customer.
+        '''
+        return await run_blocking(
+            self.executor, self.customer.create_customer, *args, **kwargs
+        )
+
+    async def delete_customer(self, *args, **kwargs) -> tuple[int, None]:
+        '''
+        Version asincrona de Customer.delete_customer.
+        '''
+        return await run_blocking(
+            self.executor, self.customer.delete_customer, *args, **kwargs
+        )
+
+    async def display_customer_info(self, *args, **kwargs) -> tuple[int, dict]:
+        '''
+        Version asincrona de Customer.display_customer_info.
+        '''
+        return await run_blocking(
+            self.executor, self.customer.display_customer_info, *args, **kwargs
+        )
+
+    async def modify_customer_info(self, *args, **kwargs) -> tuple[int, dict]:
+        '''
+        Version asincrona de Customer.modify_customer_info.
+        '''
+        return await run_blocking(
+            self.executor, self.customer.modify_customer_info, *args, **kwargs
+        )
+
+    async def import_customers(self, *args, **kwargs) -> tuple[int, dict]:
+        '''
+        Version asincrona de Customer.import_customers.
+        '''
+        return await run_blocking(
+            self.executor, self.customer.import_customers, *args, **kwargs
+        )
+
+    async def find_customers(self, *args, **kwargs) -> tuple[int, dict]:
+        '''
+        Version asincrona de Customer.find_customers.
+        '''
+        return await run_blocking(
+            self.executor, self.customer.find_customers, *args, **kwargs
+        )
+
+    async def list_customers_born_before(
+            self, *args, **kwargs) -> tuple[int, dict]:
+        '''
+        Version asincrona de Customer.list_customers_born_before.
+        '''
+        return await run_blocking(
+            self.executor, self.customer.list_customers_born_before,
+            *args, **kwargs
+        )
+
+    async def flush(self, *args, **kwargs) -> tuple[int, None]:
+        '''
+        Version asincrona de Customer.flush.
+        '''
+        return await run_blocking(
+            self.executor, self.customer.flush, *args, **kwargs
+        )
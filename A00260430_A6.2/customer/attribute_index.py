@@ -0,0 +1,98 @@
+'''
+Codigo fuente de la clase AttributeIndex. Esta clase guarda indices
+secundarios de los clientes por telefono, documento de identificacion y
+apellidos, para buscar clientes sin recorrer todo el diccionario.
+
+El indice no se guarda: se construye al leer customer.json y se actualiza en
+cada cambio.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import unicodedata
+
+
+INDEXED_FIELDS = ('phone_no', 'id_doc_no', 'surname')
+
+
+def normalize_surname(surname: str) -> str:
+    '''
+    Función que normaliza los apellidos para buscarlos: sin acentos, sin
+    distinguir mayusculas y con un solo espacio entre palabras.
+    '''
+    surname = unicodedata.normalize('NFKD', str(surname))
+    surname = ''.join(char for char in surname if not unicodedata.combining(char))
+    return ' '.join(surname.casefold().split())
+
+
+class AttributeIndex():
+    '''
+    Clase AttributeIndex. La estructura es un diccionario por campo
+    {campo: {valor: set(numero de cliente)}}; los apellidos se guardan
+    normalizados (ver normalize_surname).
+
+    Metodos publicos
+    + add - agrega un cliente a los indices
+    + remove - quita un cliente de los indices
+    + rebuild - vuelve a construir los indices desde el diccionario de clientes
+    + find - obtiene los numeros de cliente que cumplen todos los criterios
+    '''
+
+    def __init__(self, customers: dict = None):
+        self.fields = {}
+        self.rebuild(customers or {})
+
+    @staticmethod
+    def _value(field: str, value):
+        '''
+        Metodo privado que regresa el valor con el que se indexa un campo.
+        '''
+        if field == 'surname':
+            return normalize_surname(value)
+        return value
+
+    def add(self, customer_no: str, customer_data):
+        '''
+        Agrega el cliente con sus datos (CustomerRecord) a los indices.
+        '''
+        for field in INDEXED_FIELDS:
+            value = self._value(field, getattr(customer_data, field))
+            self.fields[field].setdefault(value, set()).add(customer_no)
+
+    def remove(self, customer_no: str, customer_data):
+        '''
+        Quita el cliente de los indices; customer_data son los datos con los
+        que se agrego.
+        '''
+        for field in INDEXED_FIELDS:
+            value = self._value(field, getattr(customer_data, field))
+            customers = self.fields[field].get(value)
+            if customers is None:
+                continue
+            customers.discard(customer_no)
+            if not customers:
+                del self.fields[field][value]
+
+    def rebuild(self, customers: dict):
+        '''
+        Vuelve a construir los indices con todos los clientes.
+        '''
+        self.fields = {field: {} for field in INDEXED_FIELDS}
+        for customer_no, customer_data in customers.items():
+            self.add(customer_no, customer_data)
+
+    def find(self, criteria: dict) -> set:
+        '''
+        Regresa el conjunto de numeros de cliente que cumplen todos los
+        criterios {campo: valor}. Se parte del conjunto mas pequeño.
+        '''
+        matches = sorted(
+            (self.fields[field].get(self._value(field, value), set())
+             for field, value in criteria.items()),
+            key=len
+        )
+        result = set(matches[0])
+        for customers in matches[1:]:
+            result &= customers
+        return result
@@ -1,251 +1,709 @@
-'''
-Codigo fuente de la clase Customer. Esta clase usa la clase Persistence.
-
-La clase Customer implementa los metodos create_customer, delete_customer,
-display_customer_info, modify_customer_info
-
-Historia
-Fecha           Descripcion del cambio                      Author
-17-02-2024      Version inicial                             A00260430
-'''
-import re
-from persistence import update_data_store, load_data_store
-
-
-OK_STATUS = 0
-ERROR_STATUS = -109
-DUPLICATE_CUSTOMER = -101
-CUSTOMER_NOT_FOUND = -102
-INVALID_FIELD = -110
-CUSTOMER_ENTITY = 'customer'
-
-
-class Customer():
-    '''
-    Clase Customer. Esta clase crea un diccionario con datos contenidos en un archivo
-    con formato JSON nombrado customer.json.
-
-    La estructura del cliente es un diccionario con los campos
-    - names (nombres)
-    - surname (apellidos)
-    - id_doc_no (no. documento de identificacion alfanumerico)
-    - phone_no (no telefono numerico)
-    - year_dob (anio de nacimiento)
-
-    Metodos privados
-    + _validate_customer_data - verifica que los datos sean del tipo correcto
-
-    Metodos publicos
-    + create_customer - crea un nuevo registro del cliente.
-    + delete_customer - borra un registro existente del cliente
-    + display_customer - obtiene los datos de un registro existente del cliente
-    + modify_custimer - actualiza los datos de un registro existente del cliente
-    '''
-    def __init__(self):
-        self.loaded_data, self.customer_dicc = load_data_store(CUSTOMER_ENTITY)
-
-    def _validate_customer_data(
-            self,
-            partial: bool,
-            names: str,
-            surname: str,
-            id_doc_no: str,
-            phone_no: str,
-            year_dob: int):
-        '''
-        Este metodo valida los campos del cliente.
-
-        El metodo retorna una tupla (err, field_list)
-        '''
-        status = OK_STATUS
-        field_list = {}
-        if (
-             (names is None or not isinstance(names, str) or names == '')
-             and partial):
-            status = INVALID_FIELD
-        field_list['names'] = (
-            bool(isinstance(names, str)),
-            names
-        )
-        if (
-             (surname is None or not isinstance(surname, str) or surname == '')
-             and partial):
-            status = INVALID_FIELD
-        field_list['surname'] = (
-            bool(isinstance(surname, str)),
-            surname
-        )
-        if (
-             (id_doc_no is None or not isinstance(id_doc_no, str) or id_doc_no == '')
-             and not bool(re.match('^[a-zA-Z0-9]+$', id_doc_no))
-             and partial):
-            status = INVALID_FIELD
-        field_list['id_doc_no'] = (
-            bool(isinstance(id_doc_no, str)
-                 and bool(re.match('^[a-zA-Z0-9]+$', id_doc_no))),
-            id_doc_no
-        )
-        if (
-             (phone_no is None or not isinstance(phone_no, str) or phone_no == '')
-             and not bool(re.match('^[0-9]+$', phone_no))
-             and partial):
-            status = INVALID_FIELD
-        field_list['phone_no'] = (
-            bool(isinstance(phone_no, str)
-                 and bool(re.match('^[0-9]+$', phone_no))),
-            phone_no
-        )
-        if (
-             (year_dob is None or not isinstance(year_dob, int) or year_dob <= 0)
-             and partial):
-            status = INVALID_FIELD
-        field_list['year_dob'] = (
-            bool(isinstance(year_dob, int)),
-            year_dob
-        )
-
-        return status, field_list
-
-    def create_customer(
-            self,
-            names: str,
-            surname: str,
-            id_doc_no: str,
-            phone_no: str,
-            year_dob: int) -> tuple[int, str]:
-        '''
-        Este metodo crea un cliente en el diccionario de clientes. El diccionario
-        de clientes es almacenado en el archivo customer.json
-
-        El metodo retorna una tupla (err, customer_no)
-        '''
-        status = OK_STATUS
-        status_persist = OK_STATUS
-
-        status, cust_field_list = self._validate_customer_data(
-            False,
-            names,
-            surname,
-            id_doc_no,
-            phone_no,
-            year_dob
-        )
-        if status == OK_STATUS:
-            customer_key = id_doc_no + '|' + phone_no + '|' + str(year_dob)
-            if customer_key in self.customer_dicc:
-                status = DUPLICATE_CUSTOMER
-                customer_key = None
-            else:
-                customer_data = {}
-                customer_data['names'] = cust_field_list['names'][1]
-                customer_data['surname'] = cust_field_list['surname'][1]
-                customer_data['id_doc_no'] = cust_field_list['id_doc_no'][1]
-                customer_data['phone_no'] = cust_field_list['phone_no'][1]
-                customer_data['year_dob'] = cust_field_list['year_dob'][1]
-                self.customer_dicc[customer_key] = customer_data
-                status_persist, _ = update_data_store(CUSTOMER_ENTITY, self.customer_dicc)
-
-        return int(status + status_persist), customer_key
-
-    def delete_customer(self, customer_no: str):
-        '''
-        Este metodo remueve un cliente en el diccionario de clientes.
-
-        El diccionario de clientes es almacenado en el archivo customer.json
-
-        Regresa una tupla (err, None)
-        '''
-        status = OK_STATUS
-        status_persist = OK_STATUS
-
-        if customer_no in self.customer_dicc:
-            self.customer_dicc.pop(customer_no)
-            status_persist, _ = update_data_store(CUSTOMER_ENTITY, self.customer_dicc)
-        else:
-            status = CUSTOMER_NOT_FOUND
-
-        return int(status + status_persist), None
-
-    def display_customer_info(self, customer_no: str):
-        '''
-        Este metodo depliega los datos de un cliente en el diccionario de
-        clientes.
-
-        El diccionario de clientes es almacenado en el archivo customer.json
-
-        Regresa una tupla (err, diccionario)
-        '''
-        status = OK_STATUS
-        customer_data = {}
-
-        if customer_no in self.customer_dicc:
-            customer_data = self.customer_dicc[customer_no]
-        else:
-            status = CUSTOMER_NOT_FOUND
-
-        return int(status), customer_data
-
-    def modify_customer_info(
-            self,
-            customer_no: str,
-            names: str,
-            surname: str,
-            id_doc_no: str,
-            phone_no: str,
-            year_dob: int,):
-        '''
-        Este metodo modifica los datos de un cliente en el diccionario de
-        clientes.
-
-        El diccionario de clientes es almacenado en el archivo customer.json
-
-        Regresa una tupla (err, diccionario)
-        '''
-        status = OK_STATUS
-        status_persist = OK_STATUS
-        customer_data = {}
-
-        status, cust_field_list = self._validate_customer_data(
-            True,
-            names,
-            surname,
-            id_doc_no,
-            phone_no,
-            year_dob
-        )
-
-        if status == OK_STATUS:
-            if customer_no in self.customer_dicc:
-                if cust_field_list['names'][0]:
-                    customer_data['names'] = cust_field_list['names'][1]
-                else:
-                    customer_data['names'] = self.customer_dicc[customer_no]['names']
-                if cust_field_list['surname'][0]:
-                    customer_data['surname'] = cust_field_list['surname'][1]
-                else:
-                    customer_data['surname'] = self.customer_dicc[customer_no]['surname']
-                if cust_field_list['id_doc_no'][0]:
-                    customer_data['id_doc_no'] = cust_field_list['id_doc_no'][1]
-                else:
-                    customer_data['id_doc_no'] = \
-                        self.customer_dicc[customer_no]['id_doc_no']
-                if cust_field_list['phone_no'][0]:
-                    customer_data['phone_no'] = cust_field_list['phone_no'][1]
-                else:
-                    customer_data['phone_no'] = \
-                        self.customer_dicc[customer_no]['phone_no']
-                if cust_field_list['year_dob'][0]:
-                    customer_data['year_dob'] = cust_field_list['year_dob'][1]
-                else:
-                    customer_data['year_dob'] = \
-                        self.customer_dicc[customer_no]['year_dob']
-                self.customer_dicc[customer_no] = customer_data
-                status_persist, _ = update_data_store(
-                    CUSTOMER_ENTITY, self.customer_dicc
-                )
-            else:
-                status = CUSTOMER_NOT_FOUND
-        else:
-            status = INVALID_FIELD
-
-        return int(status + status_persist), customer_data
+'''
+Codigo fuente de la clase Customer. Esta clase usa la clase Persistence.
+
+La clase Customer implementa los metodos create_customer, delete_customer,
+display_customer_info, modify_customer_info
+
+Historia
+Fecha           Descripcion del cambio                      Author
+17-02-2024      Version inicial                             A00260430
+18-10-2026      Modo con diario (journal) de cambios        A00260430
+18-10-2026      Escritura solo con cambios y diferida       A00260430
+18-10-2026      Recarga del archivo cambiado por otros      A00260430
+18-10-2026      Almacenamiento configurable (store)         A00260430
+18-10-2026      Uso compartido entre hilos (candado)        A00260430
+18-10-2026      Importacion masiva de clientes              A00260430
+18-10-2026      Busqueda por indices secundarios            A00260430
+18-10-2026      Registros compactos (CustomerRecord)        A00260430
+18-10-2026      Almacenamiento y snapshot en columnas       A00260430
+18-10-2026      Cambios descartados si falla la escritura   A00260430
+18-10-2026      Escritura diferida por tiempo y al terminar A00260430
+'''
+import atexit
+import random
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from persistence import VERSION_CONFLICT as STORE_VERSION_CONFLICT
+from persistence import get_default_store
+from persistence import JSON_FORMAT, COLUMNAR_FORMAT, is_columns
+from .attribute_index import INDEXED_FIELDS, AttributeIndex
+from .customer_record import CustomerRecord
+from .customer_columns import CustomerColumns
+from .customer_import import (
+    ID_DOC_PATTERN, PHONE_PATTERN, chunks, normalize_rows, read_rows
+)
+
+
+OK_STATUS = 0
+ERROR_STATUS = -109
+DUPLICATE_CUSTOMER = -101
+CUSTOMER_NOT_FOUND = -102
+INVALID_FIELD = -110
+VERSION_CONFLICT = -150
+CONFLICT_RETRIES = 8
+CONFLICT_BACKOFF_MS = 5
+CUSTOMER_ENTITY = 'customer'
+IMPORT_CHUNK_ROWS = 10000
+
+# Instancias cuyos cambios pendientes se guardan al terminar el programa
+_INSTANCES = weakref.WeakSet()
+
+
+def _close_all():
+    '''
+    Función privada que guarda los cambios pendientes de todas las
+    instancias al terminar el programa (atexit).
+    '''
+    for instance in list(_INSTANCES):
+        instance.close()
+
+
+atexit.register(_close_all)
+
+
+class Customer():
+    '''
+    Clase Customer. Esta clase crea un diccionario con datos contenidos en un archivo
+    con formato JSON nombrado customer.json.
+
+    La estructura del cliente es un diccionario con los campos
+    - names (nombres)
+    - surname (apellidos)
+    - id_doc_no (no. documento de identificacion alfanumerico)
+    - phone_no (no telefono numerico)
+    - year_dob (anio de nacimiento)
+
+    En memoria cada cliente es un CustomerRecord (con __slots__); los
+    archivos y los metodos publicos siguen usando diccionarios.
+
+    Con fmt='columnar' los clientes se guardan en memoria en columnas (ver
+    CustomerColumns), con names y surname codificados con diccionario, y el
+    snapshot se guarda en customer.col (ver persistence.columnar_snapshot),
+    que se lee con una sola lectura. Con un store que solo guarda registros
+    delta, como SQLiteStore, solo se usan las columnas en memoria.
+
+    Si la clase se crea con journaled=True cada cambio se agrega como un
+    registro delta al diario customer.journal en lugar de reescribir
+    customer.json.
+
+    Solo se escribe cuando hay cambios. Con flush_every y flush_ms la
+    escritura se difiere hasta acumular N cambios o hasta que pasen T
+    milisegundos desde la ultima escritura; con flush_ms un temporizador
+    guarda los cambios pendientes aunque no lleguen mas cambios. flush
+    guarda los cambios pendientes en cualquier momento y close (que tambien
+    se llama al terminar el programa) los guarda y cancela el temporizador;
+    con flush_every > 1 y sin flush_ms los ultimos cambios solo se guardan
+    con flush o close.
+
+    Antes de cada operacion se compara el sello de version de customer.json
+    (ver persistence.data_store_stamp); si otro proceso lo cambio se vuelve a
+    leer y los cambios pendientes de esta instancia se aplican de nuevo. Las
+    escrituras son condicionales (ver flush), por lo que no reemplazan lo
+    que otro proceso escribio despues de la ultima lectura.
+
+    Los datos se guardan con el store indicado (por omision el de
+    persistence.set_default_store, archivos JSON). Con un store que solo
+    guarda registros delta, como SQLiteStore, la clase usa el modo con
+    diario.
+
+    Una instancia se puede usar desde varios hilos: las operaciones toman el
+    candado de la instancia mientras leen o cambian el diccionario y al
+    escribir. Todos los clientes estan en un solo archivo, por lo que sus
+    escrituras se hacen una a la vez.
+
+    Los clientes tambien se indexan por phone_no, id_doc_no y apellidos
+    normalizados (ver AttributeIndex) para buscarlos con find_customers sin
+    recorrer el diccionario.
+
+    Metodos privados
+    + _validate_customer_data - verifica que los datos sean del tipo correcto
+    + _persist - guarda los cambios (diario o archivo completo)
+    + _refresh - vuelve a leer customer.json si lo cambio otro proceso
+    + _backoff - espera aleatoria antes de reintentar una escritura
+    + _schedule_flush / _timed_flush - escritura diferida por temporizador
+    + _rebuild / _apply_records / _encode - conversion de y a los archivos
+
+    Metodos publicos
+    + create_customer - crea un nuevo registro del cliente.
+    + delete_customer - borra un registro existente del cliente
+    + display_customer - obtiene los datos de un registro existente del cliente
+    + modify_custimer - actualiza los datos de un registro existente del cliente
+    + import_customers - crea clientes en lote desde un archivo o iterable
+    + find_customers - busca clientes por telefono, documento o apellidos
+    + list_customers_born_before - obtiene los clientes nacidos antes de un anio
+    + flush - guarda los cambios pendientes
+    + close - guarda los cambios pendientes y cancela el temporizador
+    '''
+    def __init__(
+            self,
+            journaled: bool = False,
+            flush_every: int = 1,
+            flush_ms: int = 0,
+            fmt: str = JSON_FORMAT,
+            store=None):
+        self.store = store or get_default_store()
+        self.journaled = journaled or self.store.journaled
+        self.columnar = fmt == COLUMNAR_FORMAT
+        self.fmt = fmt if not self.store.journaled else JSON_FORMAT
+        self.flush_every = flush_every
+        self.flush_ms = flush_ms
+        # Numero de cambios aplicados en memoria y registros aun no guardados
+        self.version = 0
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self._timer = None
+        self._lock = threading.RLock()
+        self._stamp = self.store.stamp(CUSTOMER_ENTITY, self.fmt)
+        self.loaded_data, self.customer_dicc = self.store.load(
+            CUSTOMER_ENTITY,
+            self._rebuild,
+            self.fmt
+        )
+        self.attribute_index = AttributeIndex(self.customer_dicc)
+        _INSTANCES.add(self)
+
+    def _refresh(self):
+        '''
+        Metodo privado que vuelve a leer customer.json (y su diario) si su
+        sello de version cambio desde la ultima lectura o escritura de esta
+        instancia. Los registros pendientes se aplican sobre los datos leidos.
+        '''
+        stamp = self.store.stamp(CUSTOMER_ENTITY, self.fmt)
+        if stamp == self._stamp:
+            return
+        self._stamp = stamp
+        self.loaded_data, data = self.store.load(
+            CUSTOMER_ENTITY, self._rebuild, self.fmt
+        )
+        self.customer_dicc.clear()
+        self.customer_dicc.update(self._apply_records(data, self._pending))
+        self.attribute_index.rebuild(self.customer_dicc)
+
+    def _rebuild(self, data: dict, records: list) -> dict:
+        '''
+        Metodo privado que convierte el snapshot leido (diccionario de
+        customer.json o estado en columnas de customer.col) a CustomerRecord
+        o a CustomerColumns y aplica los registros del diario.
+        '''
+        if is_columns(data):
+            customers = CustomerColumns.from_columns(data)
+            if not self.columnar:
+                customers = dict(customers.items())
+        else:
+            customers = CustomerColumns() if self.columnar else {}
+            for customer_no, customer_data in data.items():
+                customers[customer_no] = CustomerRecord.from_dict(customer_data)
+        return self._apply_records(customers, records)
+
+    @staticmethod
+    def _apply_records(data: dict, records: list) -> dict:
+        '''
+        Metodo privado que aplica registros del diario sobre el diccionario
+        de CustomerRecord.
+
+        - ['put', numero de cliente, datos]
+        - ['delete', numero de cliente]
+        '''
+        for record in records:
+            if record[0] == 'put':
+                data[record[1]] = CustomerRecord.from_dict(record[2])
+            elif record[0] == 'delete':
+                data.pop(record[1], None)
+        return data
+
+    def _encode(self) -> dict:
+        '''
+        Metodo privado que convierte los clientes al formato del archivo.
+        '''
+        if self.fmt == COLUMNAR_FORMAT:
+            return self.customer_dicc.to_columns()
+        return {
+            customer_no: customer_data.to_dict()
+            for customer_no, customer_data in self.customer_dicc.items()
+        }
+
+    def _persist(self, records: list) -> tuple[int, None]:
+        '''
+        Metodo privado para registrar los cambios de una operacion. Sin
+        registros no se escribe nada; los registros se guardan con flush
+        segun la politica de escritura diferida.
+        '''
+        if not records:
+            return OK_STATUS, None
+
+        self.version += 1
+        self._pending.extend(records)
+        if (len(self._pending) >= self.flush_every
+                or (self.flush_ms
+                    and (time.monotonic() - self._last_flush) * 1000
+                    >= self.flush_ms)):
+            return self.flush()
+
+        self._schedule_flush()
+        return OK_STATUS, None
+
+    def _schedule_flush(self):
+        '''
+        Metodo privado que, con flush_ms, programa un temporizador que guarda
+        los cambios pendientes en flush_ms milisegundos (si no hay uno ya
+        programado).
+        '''
+        with self._lock:
+            if not self.flush_ms or self._timer is not None:
+                return
+            self._timer = threading.Timer(self.flush_ms / 1000, self._timed_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_flush(self):
+        '''
+        Metodo privado que ejecuta el temporizador: guarda los cambios
+        pendientes y, si quedan pendientes por un conflicto, se programa de
+        nuevo.
+        '''
+        with self._lock:
+            self._timer = None
+            status, _ = self.flush()
+            if status != OK_STATUS:
+                print(
+                    '[ERROR] - An exception ocurred',
+                    f'while flushing customers: {status}'
+                )
+            if self._pending:
+                self._schedule_flush()
+
+    def close(self) -> tuple[int, None]:
+        '''
+        Metodo publico que cancela el temporizador de escritura diferida y
+        guarda los cambios pendientes (ver flush). Se llama al terminar el
+        programa para cada instancia que sigue en uso.
+
+        Regresa una tupla (err, None)
+        '''
+        with self._lock:
+            timer, self._timer = self._timer, None
+            if timer is not None:
+                timer.cancel()
+            return self.flush()
+
+    def flush(self, retries: int = CONFLICT_RETRIES) -> tuple[int, None]:
+        '''
+        Metodo publico para guardar los cambios pendientes. En modo con diario
+        solo se agregan los registros delta; en otro caso se reescribe
+        customer.json.
+
+        La escritura se hace solo si nadie mas cambio customer.json desde que
+        se leyo (ver persistence.commit_data_store). Si otro proceso lo
+        cambio, se vuelve a leer, los registros pendientes se aplican de
+        nuevo sobre los datos leidos y se reintenta hasta retries veces,
+        esperando un tiempo aleatorio creciente entre intentos. Si no se
+        logra escribir los registros quedan pendientes y se regresa
+        VERSION_CONFLICT. Si la escritura falla por otro error los cambios
+        pendientes se descartan y customer.json se vuelve a leer.
+
+        Regresa una tupla (err, None)
+        '''
+        with self._lock:
+            for attempt in range(retries + 1):
+                if not self._pending:
+                    return OK_STATUS, None
+                records = self._pending
+                self._last_flush = time.monotonic()
+
+                if not self.journaled:
+                    status, stamp = self.store.commit(
+                        CUSTOMER_ENTITY,
+                        self._stamp,
+                        data=self._encode(),
+                        fmt=self.fmt
+                    )
+                else:
+                    status, stamp = self.store.commit(
+                        CUSTOMER_ENTITY, self._stamp, records=records, fmt=self.fmt
+                    )
+                if status != STORE_VERSION_CONFLICT:
+                    break
+                # _refresh lee los datos del otro proceso y aplica de nuevo
+                # los registros pendientes
+                self._refresh()
+                if attempt < retries:
+                    self._backoff(attempt)
+            else:
+                return VERSION_CONFLICT, None
+
+            self._pending = []
+            if status != OK_STATUS:
+                # Los cambios no se guardaron: se descartan y se vuelve a
+                # leer customer.json para que la memoria sea igual al archivo
+                self._stamp = None
+                self._refresh()
+                return status, None
+            self._stamp = stamp
+
+            # El sello guardado es el del commit; si el checkpoint se hace,
+            # el siguiente _refresh vuelve a leer el archivo compactado
+            if self.journaled and self.store.checkpoint_due(stamp):
+                status, _ = self.store.checkpoint(
+                    CUSTOMER_ENTITY,
+                    self._encode(),
+                    self.fmt,
+                    expected_stamp=stamp
+                )
+                if status == STORE_VERSION_CONFLICT:
+                    status = OK_STATUS
+
+            return status, None
+
+    @staticmethod
+    def _backoff(attempt: int):
+        '''
+        Metodo privado que espera un tiempo aleatorio, que crece al doble con
+        cada intento, antes de reintentar despues de un conflicto.
+        '''
+        time.sleep(random.uniform(0, CONFLICT_BACKOFF_MS * 2 ** attempt) / 1000)
+
+    def _validate_customer_data(
+            self,
+            partial: bool,
+            names: str,
+            surname: str,
+            id_doc_no: str,
+            phone_no: str,
+            year_dob: int):
+        '''
+        Este metodo valida los campos del cliente.
+
+        El metodo retorna una tupla (err, field_list)
+        '''
+        status = OK_STATUS
+        field_list = {}
+        if (
+             (names is None or not isinstance(names, str) or names == '')
+             and partial):
+            status = INVALID_FIELD
+        field_list['names'] = (
+            bool(isinstance(names, str)),
+            names
+        )
+        if (
+             (surname is None or not isinstance(surname, str) or surname == '')
+             and partial):
+            status = INVALID_FIELD
+        field_list['surname'] = (
+            bool(isinstance(surname, str)),
+            surname
+        )
+        if (
+             (id_doc_no is None or not isinstance(id_doc_no, str) or id_doc_no == '')
+             and not bool(ID_DOC_PATTERN.match(id_doc_no))
+             and partial):
+            status = INVALID_FIELD
+        field_list['id_doc_no'] = (
+            bool(isinstance(id_doc_no, str)
+                 and bool(ID_DOC_PATTERN.match(id_doc_no))),
+            id_doc_no
+        )
+        if (
+             (phone_no is None or not isinstance(phone_no, str) or phone_no == '')
+             and not bool(PHONE_PATTERN.match(phone_no))
+             and partial):
+            status = INVALID_FIELD
+        field_list['phone_no'] = (
+            bool(isinstance(phone_no, str)
+                 and bool(PHONE_PATTERN.match(phone_no))),
+            phone_no
+        )
+        if (
+             (year_dob is None or not isinstance(year_dob, int) or year_dob <= 0)
+             and partial):
+            status = INVALID_FIELD
+        field_list['year_dob'] = (
+            bool(isinstance(year_dob, int)),
+            year_dob
+        )
+
+        return status, field_list
+
+    def create_customer(
+            self,
+            names: str,
+            surname: str,
+            id_doc_no: str,
+            phone_no: str,
+            year_dob: int) -> tuple[int, str]:
+        '''
+        Este metodo crea un cliente en el diccionario de clientes. El diccionario
+        de clientes es almacenado en el archivo customer.json
+
+        El metodo retorna una tupla (err, customer_no)
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+
+        status, cust_field_list = self._validate_customer_data(
+            False,
+            names,
+            surname,
+            id_doc_no,
+            phone_no,
+            year_dob
+        )
+        if status == OK_STATUS:
+            with self._lock:
+                self._refresh()
+                customer_key = id_doc_no + '|' + phone_no + '|' + str(year_dob)
+                if customer_key in self.customer_dicc:
+                    status = DUPLICATE_CUSTOMER
+                    customer_key = None
+                else:
+                    customer_data = {}
+                    customer_data['names'] = cust_field_list['names'][1]
+                    customer_data['surname'] = cust_field_list['surname'][1]
+                    customer_data['id_doc_no'] = cust_field_list['id_doc_no'][1]
+                    customer_data['phone_no'] = cust_field_list['phone_no'][1]
+                    customer_data['year_dob'] = cust_field_list['year_dob'][1]
+                    customer_record = CustomerRecord.from_dict(customer_data)
+                    self.customer_dicc[customer_key] = customer_record
+                    self.attribute_index.add(customer_key, customer_record)
+                    status_persist, _ = self._persist(
+                        [['put', customer_key, customer_data]]
+                    )
+
+        return int(status + status_persist), customer_key
+
+    def delete_customer(self, customer_no: str):
+        '''
+        Este metodo remueve un cliente en el diccionario de clientes.
+
+        El diccionario de clientes es almacenado en el archivo customer.json
+
+        Regresa una tupla (err, None)
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+
+        with self._lock:
+            self._refresh()
+            if customer_no in self.customer_dicc:
+                self.attribute_index.remove(
+                    customer_no, self.customer_dicc.pop(customer_no)
+                )
+                status_persist, _ = self._persist([['delete', customer_no]])
+            else:
+                status = CUSTOMER_NOT_FOUND
+
+        return int(status + status_persist), None
+
+    def display_customer_info(self, customer_no: str):
+        '''
+        Este metodo depliega los datos de un cliente en el diccionario de
+        clientes.
+
+        El diccionario de clientes es almacenado en el archivo customer.json
+
+        Regresa una tupla (err, diccionario)
+        '''
+        status = OK_STATUS
+        customer_data = {}
+
+        with self._lock:
+            self._refresh()
+            if customer_no in self.customer_dicc:
+                customer_data = self.customer_dicc[customer_no].to_dict()
+            else:
+                status = CUSTOMER_NOT_FOUND
+
+        return int(status), customer_data
+
+    def modify_customer_info(
+            self,
+            customer_no: str,
+            names: str,
+            surname: str,
+            id_doc_no: str,
+            phone_no: str,
+            year_dob: int,):
+        '''
+        Este metodo modifica los datos de un cliente en el diccionario de
+        clientes.
+
+        El diccionario de clientes es almacenado en el archivo customer.json
+
+        Regresa una tupla (err, diccionario)
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+        customer_data = {}
+
+        status, cust_field_list = self._validate_customer_data(
+            True,
+            names,
+            surname,
+            id_doc_no,
+            phone_no,
+            year_dob
+        )
+
+        if status == OK_STATUS:
+            with self._lock:
+                self._refresh()
+                if customer_no in self.customer_dicc:
+                    stored_data = self.customer_dicc[customer_no].to_dict()
+                    if cust_field_list['names'][0]:
+                        customer_data['names'] = cust_field_list['names'][1]
+                    else:
+                        customer_data['names'] = stored_data['names']
+                    if cust_field_list['surname'][0]:
+                        customer_data['surname'] = cust_field_list['surname'][1]
+                    else:
+                        customer_data['surname'] = stored_data['surname']
+                    if cust_field_list['id_doc_no'][0]:
+                        customer_data['id_doc_no'] = cust_field_list['id_doc_no'][1]
+                    else:
+                        customer_data['id_doc_no'] = stored_data['id_doc_no']
+                    if cust_field_list['phone_no'][0]:
+                        customer_data['phone_no'] = cust_field_list['phone_no'][1]
+                    else:
+                        customer_data['phone_no'] = stored_data['phone_no']
+                    if cust_field_list['year_dob'][0]:
+                        customer_data['year_dob'] = cust_field_list['year_dob'][1]
+                    else:
+                        customer_data['year_dob'] = stored_data['year_dob']
+                    records = []
+                    if customer_data != stored_data:
+                        records.append(['put', customer_no, customer_data])
+                    self.attribute_index.remove(
+                        customer_no, self.customer_dicc[customer_no]
+                    )
+                    customer_record = CustomerRecord.from_dict(customer_data)
+                    self.customer_dicc[customer_no] = customer_record
+                    self.attribute_index.add(customer_no, customer_record)
+                    status_persist, _ = self._persist(records)
+                else:
+                    status = CUSTOMER_NOT_FOUND
+        else:
+            status = INVALID_FIELD
+
+        return int(status + status_persist), customer_data
+
+    def import_customers(
+            self,
+            path_or_iter,
+            workers: int = 0,
+            chunk_rows: int = IMPORT_CHUNK_ROWS) -> tuple[int, dict]:
+        '''
+        Este metodo crea clientes en lote desde un archivo CSV o JSON lines, o
+        desde un iterable de renglones (ver customer_import.read_rows).
+
+        Los renglones se validan y normalizan en bloques de chunk_rows; con
+        workers > 1 los bloques se procesan en un pool de workers procesos.
+        Los clientes se agregan en el orden de los renglones; un renglon no
+        valido o cuya llave id_doc_no|phone_no|year_dob ya existe (o se
+        repite en el lote) se reporta y no se agrega. Todos los clientes se
+        guardan con una sola escritura al final. Si el archivo no se puede
+        leer no se crea ningun cliente y se regresa ERROR_STATUS. Si la
+        escritura final falla (por ejemplo, VERSION_CONFLICT) los clientes
+        del lote se descartan, se regresa el err y 0 clientes creados.
+
+        Regresa una tupla (err, {'created': no. clientes creados,
+        'errors': lista de [no. renglon, err]})
+        '''
+        blocks = chunks(read_rows(path_or_iter), chunk_rows)
+        try:
+            if workers > 1:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(normalize_rows, blocks))
+            else:
+                results = [normalize_rows(block) for block in blocks]
+        except OSError as error:
+            print(
+                '[ERROR] - An exception ocurred',
+                f'while reading customers from {path_or_iter}: {error}'
+            )
+            return ERROR_STATUS, {'created': 0, 'errors': []}
+
+        created = 0
+        errors = []
+        imported = []
+        with self._lock:
+            self._refresh()
+            row_no = 0
+            for result in results:
+                for row in result:
+                    row_no += 1
+                    if row is None:
+                        errors.append([row_no, INVALID_FIELD])
+                        continue
+                    customer_key, customer_data = row
+                    if customer_key in self.customer_dicc:
+                        errors.append([row_no, DUPLICATE_CUSTOMER])
+                        continue
+                    customer_record = CustomerRecord.from_dict(customer_data)
+                    self.customer_dicc[customer_key] = customer_record
+                    self.attribute_index.add(customer_key, customer_record)
+                    imported.append(['put', customer_key, customer_data])
+                    created += 1
+
+            self._pending.extend(imported)
+            if created:
+                self.version += 1
+            status, _ = self.flush()
+            if status != OK_STATUS:
+                # El lote no se guardo: se quitan sus registros pendientes y
+                # se vuelve a leer customer.json (con los demas pendientes)
+                imported_ids = {id(record) for record in imported}
+                self._pending = [
+                    record for record in self._pending
+                    if id(record) not in imported_ids
+                ]
+                self._stamp = None
+                self._refresh()
+                created = 0
+
+        return status, {'created': created, 'errors': errors}
+
+    def find_customers(self, **criteria) -> tuple[int, dict]:
+        '''
+        Este metodo busca los clientes que cumplen todos los criterios, por
+        ejemplo find_customers(phone_no='5551', surname='romo'). Los criterios
+        validos son phone_no, id_doc_no y surname; los apellidos se comparan
+        sin acentos ni mayusculas.
+
+        Regresa una tupla (err, {numero de cliente: datos})
+        '''
+        if not criteria or any(field not in INDEXED_FIELDS for field in criteria):
+            return INVALID_FIELD, {}
+
+        with self._lock:
+            self._refresh()
+            return OK_STATUS, {
+                customer_no: self.customer_dicc[customer_no].to_dict()
+                for customer_no in sorted(self.attribute_index.find(criteria))
+            }
+
+    def list_customers_born_before(self, year: int) -> tuple[int, dict]:
+        '''
+        Este metodo obtiene los clientes nacidos antes del anio indicado. Con
+        fmt='columnar' solo se recorre la columna year_dob.
+
+        Regresa una tupla (err, {numero de cliente: datos})
+        '''
+        if not isinstance(year, int):
+            return INVALID_FIELD, {}
+
+        with self._lock:
+            self._refresh()
+            if self.columnar:
+                customer_nos = self.customer_dicc.born_before(year)
+            else:
+                customer_nos = [
+                    customer_no
+                    for customer_no, customer_data in self.customer_dicc.items()
+                    if customer_data.year_dob < year
+                ]
+            return OK_STATUS, {
+                customer_no: self.customer_dicc[customer_no].to_dict()
+                for customer_no in sorted(customer_nos)
+            }
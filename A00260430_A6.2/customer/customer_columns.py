@@ -0,0 +1,166 @@
+'''
+Codigo fuente de la clase CustomerColumns, almacenamiento en columnas de los
+clientes en memoria, alternativo al diccionario de CustomerRecord.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import itertools
+import sys
+from array import array
+from collections.abc import MutableMapping
+from persistence import COLUMNS_MARKER, COLUMNS_VERSION, encode_column
+from .customer_record import CustomerRecord
+
+
+class _StringColumn():
+    '''
+    Clase privada con una columna de textos codificada con diccionario: cada
+    valor distinto se guarda una sola vez y cada renglon guarda su codigo.
+    '''
+    def __init__(self, values: list = None, codes: array = None):
+        self.values = list(values or [])
+        self.index = {value: code for code, value in enumerate(self.values)}
+        self.codes = array('I', codes or [])
+
+    def code(self, value: str) -> int:
+        '''
+        Regresa el codigo del valor, agregandolo si es nuevo.
+        '''
+        code = self.index.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(sys.intern(value))
+            self.index[value] = code
+        return code
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+
+class CustomerColumns(MutableMapping):
+    '''
+    Clase CustomerColumns. Se usa como el diccionario {numero de cliente:
+    CustomerRecord} de Customer, pero guarda una columna por campo:
+    - names y surname codificados con diccionario (_StringColumn)
+    - id_doc_no y phone_no como listas de textos
+    - year_dob como arreglo de enteros
+    y un indice {numero de cliente: renglon}. Los renglones borrados se
+    reutilizan.
+
+    Los CustomerRecord se crean al leer un cliente; cambiar el registro
+    leido no cambia las columnas (se debe asignar de nuevo).
+
+    Metodos publicos
+    + from_columns - crea la tabla desde el estado en columnas de un snapshot
+    + to_columns - regresa el estado en columnas, sin renglones borrados
+    + born_before - obtiene los clientes nacidos antes de un anio
+    '''
+    def __init__(self, customers: dict = None):
+        self.keys_column = []
+        self.rows = {}
+        self.free_rows = []
+        self.names = _StringColumn()
+        self.surname = _StringColumn()
+        self.id_doc_no = []
+        self.phone_no = []
+        self.year_dob = array('i')
+        for customer_no, customer_data in (customers or {}).items():
+            self[customer_no] = customer_data
+
+    @classmethod
+    def from_columns(cls, data: dict):
+        '''
+        Crea la tabla desde el estado en columnas (ver
+        persistence.columnar_snapshot) copiando cada columna en bloque.
+        '''
+        table = cls()
+        table.keys_column = list(data['keys'])
+        table.rows = {key: row for row, key in enumerate(table.keys_column)}
+        table.names = _StringColumn(data['names'], data['names_codes'])
+        table.surname = _StringColumn(data['surname'], data['surname_codes'])
+        table.id_doc_no = list(data['id_doc_no'])
+        table.phone_no = list(data['phone_no'])
+        table.year_dob = array('i', data['year_dob'])
+        return table
+
+    def to_columns(self) -> dict:
+        '''
+        Regresa el estado en columnas con los renglones actuales, volviendo
+        a codificar names y surname.
+        '''
+        rows = sorted(self.rows.values())
+        names, names_codes = encode_column(self.names[row] for row in rows)
+        surname, surname_codes = encode_column(self.surname[row] for row in rows)
+        return {
+            COLUMNS_MARKER: COLUMNS_VERSION,
+            'keys': [self.keys_column[row] for row in rows],
+            'names': names,
+            'names_codes': names_codes,
+            'surname': surname,
+            'surname_codes': surname_codes,
+            'id_doc_no': [self.id_doc_no[row] for row in rows],
+            'phone_no': [self.phone_no[row] for row in rows],
+            'year_dob': array('i', [self.year_dob[row] for row in rows])
+        }
+
+    def __getitem__(self, customer_no: str) -> CustomerRecord:
+        row = self.rows[customer_no]
+        return CustomerRecord(
+            self.names[row],
+            self.surname[row],
+            self.id_doc_no[row],
+            self.phone_no[row],
+            self.year_dob[row]
+        )
+
+    def __setitem__(self, customer_no: str, customer_data: CustomerRecord):
+        row = self.rows.get(customer_no)
+        names = self.names.code(customer_data.names)
+        surname = self.surname.code(customer_data.surname)
+        if row is None and self.free_rows:
+            row = self.free_rows.pop()
+            self.keys_column[row] = customer_no
+        if row is None:
+            row = len(self.keys_column)
+            self.keys_column.append(customer_no)
+            self.names.codes.append(names)
+            self.surname.codes.append(surname)
+            self.id_doc_no.append(customer_data.id_doc_no)
+            self.phone_no.append(customer_data.phone_no)
+            self.year_dob.append(customer_data.year_dob)
+        else:
+            self.names.codes[row] = names
+            self.surname.codes[row] = surname
+            self.id_doc_no[row] = customer_data.id_doc_no
+            self.phone_no[row] = customer_data.phone_no
+            self.year_dob[row] = customer_data.year_dob
+        self.rows[customer_no] = row
+
+    def __delitem__(self, customer_no: str):
+        row = self.rows.pop(customer_no)
+        self.keys_column[row] = None
+        self.free_rows.append(row)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, customer_no) -> bool:
+        return customer_no in self.rows
+
+    def clear(self):
+        self.__init__()
+
+    def born_before(self, year: int) -> list:
+        '''
+        Regresa los numeros de cliente nacidos antes del anio, recorriendo
+        solo la columna year_dob (sin crear CustomerRecord).
+        '''
+        # Los renglones borrados tienen numero de cliente None
+        return list(filter(None, itertools.compress(
+            self.keys_column, map(year.__gt__, self.year_dob)
+        )))
@@ -0,0 +1,101 @@
+'''
+Funciones para la importacion masiva de clientes (ver
+Customer.import_customers): lectura de los renglones, normalizacion y
+validacion. La validacion de un bloque de renglones se puede ejecutar en otro
+proceso, por lo que las funciones estan a nivel de modulo y solo reciben y
+regresan datos simples.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import csv
+import itertools
+import json
+import re
+
+
+ID_DOC_PATTERN = re.compile('^[a-zA-Z0-9]+$')
+PHONE_PATTERN = re.compile('^[0-9]+$')
+CUSTOMER_FIELDS = ('names', 'surname', 'id_doc_no', 'phone_no', 'year_dob')
+
+
+def read_rows(path_or_iter):
+    '''
+    Función que regresa los renglones a importar. Recibe la ruta de un
+    archivo CSV (con encabezado names,surname,id_doc_no,phone_no,year_dob)
+    o JSON lines (un objeto por linea), o bien un iterable de diccionarios o
+    de tuplas con los campos en ese orden. Una linea JSON no valida se
+    regresa como None, para reportarla como un renglon no valido.
+    '''
+    if not isinstance(path_or_iter, str):
+        yield from path_or_iter
+        return
+
+    with open(path_or_iter, 'r', encoding='UTF-8', newline='') as file:
+        if path_or_iter.endswith('.csv'):
+            yield from csv.DictReader(file)
+        else:
+            for line in file:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield None
+
+
+def chunks(rows, size: int):
+    '''
+    Función que agrupa los renglones en listas de size renglones.
+    '''
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def normalize_row(row):
+    '''
+    Función que valida y normaliza un renglon: quita espacios sobrantes de
+    los textos y convierte el anio de nacimiento a entero.
+
+    Regresa una tupla (llave del cliente, datos) o None si el renglon no es
+    valido
+    '''
+    try:
+        if isinstance(row, dict):
+            values = [row[field] for field in CUSTOMER_FIELDS]
+        else:
+            values = list(row)
+        names, surname, id_doc_no, phone_no, year_dob = values
+        names = ' '.join(names.split())
+        surname = ' '.join(surname.split())
+        id_doc_no = id_doc_no.strip()
+        phone_no = phone_no.strip()
+        year_dob = int(year_dob)
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+    if (not names or not surname or year_dob <= 0
+            or not ID_DOC_PATTERN.match(id_doc_no)
+            or not PHONE_PATTERN.match(phone_no)):
+        return None
+
+    customer_key = id_doc_no + '|' + phone_no + '|' + str(year_dob)
+    return customer_key, {
+        'names': names,
+        'surname': surname,
+        'id_doc_no': id_doc_no,
+        'phone_no': phone_no,
+        'year_dob': year_dob
+    }
+
+
+def normalize_rows(rows: list) -> list:
+    '''
+    Función que valida y normaliza un bloque de renglones (ver
+    normalize_row); es la tarea que ejecuta cada proceso.
+    '''
+    return [normalize_row(row) for row in rows]
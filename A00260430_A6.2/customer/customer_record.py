@@ -0,0 +1,77 @@
+'''
+Codigo fuente de la clase CustomerRecord, registro compacto (con __slots__)
+de un cliente en memoria. Los archivos y la interfaz publica de Customer
+siguen usando diccionarios; la conversion se hace al leer, al escribir y al
+regresar los datos.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+
+
+class CustomerRecord():
+    '''
+    Clase CustomerRecord. Tiene los mismos campos que el diccionario del
+    cliente: names, surname, id_doc_no, phone_no y year_dob.
+
+    Metodos publicos
+    + from_dict - crea el registro desde el diccionario del cliente
+    + to_dict - regresa el diccionario del cliente
+    '''
+    __slots__ = ('names', 'surname', 'id_doc_no', 'phone_no', 'year_dob')
+
+    def __init__(
+            self,
+            names: str,
+            surname: str,
+            id_doc_no: str,
+            phone_no: str,
+            year_dob: int):
+        self.names = names
+        self.surname = surname
+        self.id_doc_no = id_doc_no
+        self.phone_no = phone_no
+        self.year_dob = year_dob
+
+    def __eq__(self, other):
+        if not isinstance(other, CustomerRecord):
+            return NotImplemented
+        return self.to_tuple() == other.to_tuple()
+
+    def __repr__(self):
+        return f'CustomerRecord{self.to_tuple()!r}'
+
+    def to_tuple(self) -> tuple:
+        '''
+        Regresa los campos en el orden de __slots__.
+        '''
+        return (
+            self.names, self.surname, self.id_doc_no, self.phone_no,
+            self.year_dob
+        )
+
+    @classmethod
+    def from_dict(cls, customer_data: dict):
+        '''
+        Crea el registro desde el diccionario del cliente.
+        '''
+        return cls(
+            customer_data['names'],
+            customer_data['surname'],
+            customer_data['id_doc_no'],
+            customer_data['phone_no'],
+            customer_data['year_dob']
+        )
+
+    def to_dict(self) -> dict:
+        '''
+        Regresa el diccionario del cliente.
+        '''
+        return {
+            'names': self.names,
+            'surname': self.surname,
+            'id_doc_no': self.id_doc_no,
+            'phone_no': self.phone_no,
+            'year_dob': self.year_dob
+        }
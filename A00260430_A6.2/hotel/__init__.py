@@ -1,4 +1,6 @@
-'''
-Inicializando modulo.
-'''
-from .hotel import Hotel
\ No newline at end of file
+'''
+Inicializando modulo.
+'''
+from .hotel import Hotel
+from .async_hotel import AsyncHotel
+from .room_assignment import FIRST_FIT, BEST_FIT
\ No newline at end of file
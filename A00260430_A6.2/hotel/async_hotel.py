@@ -0,0 +1,119 @@
+'''
+Codigo fuente de la clase AsyncHotel, version asincrona (asyncio) de Hotel.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+from persistence import new_executor, run_blocking
+from .hotel import Hotel
+
+
+class AsyncHotel():
+    '''
+    Clase AsyncHotel. Cada metodo publico de Hotel tiene aqui una version
+    con async que lo ejecuta en el executor (ver persistence.async_io), de
+    modo que los candados y archivos no bloquean el ciclo de eventos.
+
+    Si no se recibe hotel se crea uno con el store indicado; la lectura
+    inicial ocurre al crear la instancia. Si no se recibe executor se crea
+    uno con new_executor; las llamadas pueden correr en paralelo porque
+    Hotel toma sus propios candados.
+
+    Metodos publicos
+    + create_hotel, delete_hotel, display_hotel_info, modify_hotel_info
+    + reserve_hotel_room, reserve_any_room, cancel_hotel_reservation
+    + find_available_rooms
+    + list_customer_reservations, occupancy_snapshot, flush
+    '''
+    def __init__(self, hotel: Hotel = None, store=None, executor=None):
+        self.hotel = hotel if hotel is not None else Hotel(store=store)
+        self.executor = executor or new_executor('hotel')
+
+    async def create_hotel(self, *args, **kwargs) -> tuple[int, None]:
+        '''
+        Version asincrona de Hotel.create_hotel.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.create_hotel, *args, **kwargs
+        )
+
+    async def delete_hotel(self, *args, **kwargs) -> tuple[int, None]:
+        '''
+        Version asincrona de Hotel.delete_hotel.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.delete_hotel, *args, **kwargs
+        )
+
+    async def display_hotel_info(self, *args, **kwargs) -> tuple[int, dict]:
+        '''
+        Version asincrona de Hotel.display_hotel_info.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.display_hotel_info, *args, **kwargs
+        )
+
+    async def modify_hotel_info(self, *args, **kwargs) -> tuple[int, dict]:
+        '''
+        Version asincrona de Hotel.modify_hotel_info.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.modify_hotel_info, *args, **kwargs
+        )
+
+    async def reserve_hotel_room(self, *args, **kwargs) -> tuple[int, None]:
+        '''
+        Version asincrona de Hotel.reserve_hotel_room.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.reserve_hotel_room, *args, **kwargs
+        )
+
+    async def cancel_hotel_reservation(self, *args, **kwargs) -> tuple[int, None]:
+        '''
+        Version asincrona de Hotel.cancel_hotel_reservation.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.cancel_hotel_reservation, *args, **kwargs
+        )
+
+    async def reserve_any_room(self, *args, **kwargs) -> tuple[int, int]:
+        '''
+        Version asincrona de Hotel.reserve_any_room.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.reserve_any_room, *args, **kwargs
+        )
+
+    async def find_available_rooms(self, *args, **kwargs) -> tuple[int, list]:
+        '''
+        Version asincrona de Hotel.find_available_rooms.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.find_available_rooms, *args, **kwargs
+        )
+
+    async def list_customer_reservations(self, *args, **kwargs) -> tuple[int, list]:
+        '''
+        Version asincrona de Hotel.list_customer_reservations.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.list_customer_reservations, *args, **kwargs
+        )
+
+    async def occupancy_snapshot(self, *args, **kwargs) -> tuple[int, dict]:
+        '''
+        Version asincrona de Hotel.occupancy_snapshot.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.occupancy_snapshot, *args, **kwargs
+        )
+
+    async def flush(self, *args, **kwargs) -> tuple[int, None]:
+        '''
+        Version asincrona de Hotel.flush.
+        '''
+        return await run_blocking(
+            self.executor, self.hotel.flush, *args, **kwargs
+        )
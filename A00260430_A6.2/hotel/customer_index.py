@@ -0,0 +1,149 @@
+'''
+Codigo fuente de la clase CustomerIndex. Esta clase guarda el indice inverso
+de numero de cliente a sus reservaciones, para obtener las reservaciones de un
+cliente sin recorrer todos los hoteles, habitaciones y dias.
+
+El indice se guarda en el archivo hotel_customer.json, junto a hotel.json.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+18-10-2026      Clientes por hotel y subconjuntos por shard A00260430
+18-10-2026      Uso compartido entre hilos (candado)        A00260430
+'''
+import threading
+
+
+class CustomerIndex():
+    '''
+    Clase CustomerIndex. La estructura es un diccionario
+    {numero de cliente: [[hotel, cuarto, anio, dia juliano, dias], ...]}
+
+    Tambien se guarda que clientes tienen reservaciones en cada hotel
+    {hotel: set(numero de cliente)}, para obtener las reservaciones de un
+    hotel sin recorrer todo el indice.
+
+    Cada metodo publico se ejecuta con el candado del indice, por lo que
+    varios hilos (por ejemplo, escrituras de shards distintos) pueden usar
+    el mismo indice.
+
+    Metodos publicos
+    + add - agrega una reservacion de un cliente
+    + remove - quita una reservacion (o parte de ella) de un cliente
+    + drop_hotel - quita todas las reservaciones de un hotel
+    + lookup - obtiene las reservaciones de un cliente
+    + merge - agrega las reservaciones de otro diccionario del indice
+    + subset - obtiene el diccionario del indice para algunos hoteles
+    '''
+
+    def __init__(self, reservations: dict = None):
+        self.reservations = {}
+        self.hotel_customers = {}
+        self.lock = threading.RLock()
+        self.merge(reservations or {})
+
+    def merge(self, reservations: dict):
+        '''
+        Agrega las reservaciones de un diccionario con la estructura del
+        indice (por ejemplo, el leido de un shard).
+        '''
+        with self.lock:
+            for customer_no, entries in reservations.items():
+                self.reservations.setdefault(customer_no, []).extend(entries)
+                for entry in entries:
+                    self.hotel_customers.setdefault(entry[0], set()).add(customer_no)
+
+    def subset(self, names) -> dict:
+        '''
+        Regresa el diccionario del indice solo con las reservaciones de los
+        hoteles indicados.
+        '''
+        with self.lock:
+            reservations = {}
+            for name in names:
+                for customer_no in self.hotel_customers.get(name, ()):
+                    reservations.setdefault(customer_no, []).extend(
+                        entry for entry in self.reservations[customer_no]
+                        if entry[0] == name
+                    )
+            return reservations
+
+    def add(
+            self,
+            customer_no: str,
+            name: str,
+            room: int,
+            year: int,
+            date_day: int,
+            days: int):
+        '''
+        Agrega la reservacion del cliente. Si el cliente ya tenia reservados
+        algunos de esos dias en la misma habitacion se reemplazan, por lo que
+        agregar dos veces la misma reservacion no la duplica.
+        '''
+        with self.lock:
+            self.remove(customer_no, name, room, year, date_day, days)
+            self.reservations.setdefault(customer_no, []).append(
+                [name, room, year, date_day, days]
+            )
+            self.hotel_customers.setdefault(name, set()).add(customer_no)
+
+    def remove(
+            self,
+            customer_no: str,
+            name: str,
+            room: int,
+            year: int,
+            date_day: int,
+            days: int):
+        '''
+        Quita los dias [date_day, date_day + days) de las reservaciones del
+        cliente en la habitacion. Las reservaciones que solo se traslapan en
+        parte se recortan.
+        '''
+        with self.lock:
+            if customer_no not in self.reservations:
+                return
+            end = date_day + days
+            entries = []
+            for entry in self.reservations[customer_no]:
+                entry_end = entry[3] + entry[4]
+                if (entry[0] != name or entry[1] != room or entry[2] != year
+                        or entry[3] >= end or entry_end <= date_day):
+                    entries.append(entry)
+                    continue
+                if entry[3] < date_day:
+                    entries.append([name, room, year, entry[3], date_day - entry[3]])
+                if entry_end > end:
+                    entries.append([name, room, year, end, entry_end - end])
+            if entries:
+                self.reservations[customer_no] = entries
+            else:
+                del self.reservations[customer_no]
+            if not any(entry[0] == name for entry in entries):
+                self.hotel_customers.get(name, set()).discard(customer_no)
+
+    def drop_hotel(self, name: str):
+        '''
+        Quita todas las reservaciones del hotel.
+        '''
+        with self.lock:
+            for customer_no in self.hotel_customers.pop(name, set()):
+                entries = [
+                    entry for entry in self.reservations[customer_no]
+                    if entry[0] != name
+                ]
+                if entries:
+                    self.reservations[customer_no] = entries
+                else:
+                    del self.reservations[customer_no]
+
+    def lookup(self, customer_no: str) -> list:
+        '''
+        Regresa las reservaciones del cliente ordenadas por anio y dia.
+        '''
+        with self.lock:
+            return sorted(
+                self.reservations.get(customer_no, []),
+                key=lambda entry: (entry[2], entry[3], entry[0], entry[1])
+            )
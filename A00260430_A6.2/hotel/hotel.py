@@ -1,406 +1,1806 @@
-'''
-Codigo fuente de la clase Customer. Esta clase usa la clase Persistence.
-
-La clase Customer implementa los metodos create_customer, delete_customer,
-display_customer_info, modify_customer_info
-
-Historia
-Fecha           Descripcion del cambio                      Author
-17-02-2024      Version inicial                             A00260430
-'''
-import datetime
-from persistence import update_data_store, load_data_store
-
-
-OK_STATUS = 0
-ERROR_STATUS = -209
-DUPLICATE_HOTEL = -201
-HOTEL_NOT_FOUND = -202
-INVALID_FIELD = -210
-ROOM_NOT_FOUND = -220
-ROOM_NOT_AVAILABLE = -230
-RESERVATION_NOT_FOUND = -240
-HOTEL_ENTITY = 'hotel'
-
-
-class Hotel():
-    '''
-    Clase Hotel. Esta clase crea un diccionario con datos contenidos en un archivo
-    con formato JSON nombrado hotel.json.
-
-    La estructura del cliente es un diccionario con los campos
-    - name (nombre)
-    - cuartos (anio con arreglo por cuarto de 366 elementos binarios (falso o verdadero))
-
-
-    Metodos privados
-    + _validate_hotel_data - verifica que los datos sean del tipo correcto
-
-    Metodos publicos
-    + create_hotel - crea un nuevo registro del hotel.
-    + delete_hotel - borra un registro existente del hotel
-    + display_hotel_info - obtiene los datos de un registro existente del hotel
-    + modify_hotel_info - actualiza los datos de un registro existente del hotel
-    + reserve_hotel_room - reserva una habitacion en un hotel existente
-    + cancel_hotel_reservation - cancela la reservacio de una habitacion en un hotel
-    '''
-
-    def __init__(self):
-        # Cargando datos del archivo en formato JSON para el diccionario de hoteles
-        self.loaded_data, self.hotel_dicc = load_data_store(HOTEL_ENTITY)
-
-    def _validate_hotel_data(
-            self,
-            partial: bool,
-            name: str,
-            address: str,
-            rooms: int) -> tuple[int, dict]:
-        '''
-        Este metodo valida los campos del hotel.
-
-        El metodo retorna una tupla (err, field_list)
-        '''
-        status = 0
-        field_list = {}
-        if name is None or not isinstance(name, str) or name == '':
-            status = INVALID_FIELD
-        field_list['name'] = (
-            bool(isinstance(name, str)),
-            name
-        )
-        if address is None or not isinstance(address, str) or address == '':
-            status = INVALID_FIELD
-        field_list['address'] = (
-            bool(isinstance(address, str)),
-            address
-        )
-        if (rooms is None or not isinstance(rooms, int) or rooms <= 0) and not partial:
-            status = INVALID_FIELD
-        field_list['rooms'] = (
-            bool(isinstance(rooms, int)),
-            rooms
-        )
-
-        return status, field_list
-
-    def create_hotel(
-            self,
-            name: str,
-            address: str,
-            rooms: int) -> tuple[int, None]:
-        '''
-        Metodo para crear un registro nuevo de hotel. La llave primaria es el nombre
-        del hotel.
-
-        El metodo retorna una tupla (err, None)
-        '''
-        status = OK_STATUS
-        status_persist = OK_STATUS
-
-        status, _ = self._validate_hotel_data(
-            False,
-            name,
-            address,
-            rooms
-        )
-
-        if status == OK_STATUS:
-            if name in self.hotel_dicc:
-                status = DUPLICATE_HOTEL
-            else:
-                hotel_data = {}
-                present_year = str(datetime.date.today().year)
-                room_list = [[(False, '')] * 366] * rooms
-                hotel_data['address'] = address
-                hotel_data['rooms'] = rooms
-                hotel_data[present_year] = room_list
-                self.hotel_dicc[name] = hotel_data
-                status_persist, _ = update_data_store(HOTEL_ENTITY, self.hotel_dicc)
-
-        return int(status + status_persist), None
-
-    def delete_hotel(self, name: str) -> tuple[int, None]:
-        '''
-        Este metodo remueve un hotel en el diccionario de clientes.
-
-        El diccionario de hotel es almacenado en el archivo customer.json
-
-        Regresa una tupla (err, None)
-        '''
-        status = OK_STATUS
-        status_persist = OK_STATUS
-
-        if name in self.hotel_dicc:
-            self.hotel_dicc.pop(name)
-            status_persist, _ = update_data_store(HOTEL_ENTITY, self.hotel_dicc)
-        else:
-            status = HOTEL_NOT_FOUND
-
-        return int(status + status_persist), None
-
-    def display_hotel_info(self, name: str) -> tuple[int, dict]:
-        '''
-        Este metodo depliega los datos de un hotel en el diccionario de
-        clientes.
-
-        El diccionario de hotel es almacenado en el archivo customer.json
-
-        Regresa una tupla (err, diccionario)
-        '''
-        status = OK_STATUS
-        hotel_data = {}
-
-        if name in self.hotel_dicc:
-            hotel_data['name'] = name
-            hotel_data['address'] = self.hotel_dicc[name]['address']
-            hotel_data['rooms'] = self.hotel_dicc[name]['rooms']
-        else:
-            status = HOTEL_NOT_FOUND
-
-        return status, hotel_data
-
-    def modify_hotel_info(self, name: str, address: str) -> tuple[int, dict]:
-        '''
-        Este metodo depliega los datos de un hotel en el diccionario de
-        clientes.
-
-        El diccionario de hotel es almacenado en el archivo customer.json
-
-        Regresa una tupla (err, diccionario)
-        '''
-        status = OK_STATUS
-        status_persist = OK_STATUS
-        hotel_field_list = {}
-        hotel_data = {}
-
-        status, hotel_field_list = self._validate_hotel_data(
-            True,
-            name,
-            address,
-            None
-        )
-
-        if status == OK_STATUS:
-            if name in self.hotel_dicc:
-                hotel_data['name'] = name
-                hotel_data['rooms'] = self.hotel_dicc[name]['rooms']
-                if hotel_field_list['address'][0]:
-                    self.hotel_dicc[name]['address'] = address
-                    hotel_data['address'] = address
-                    status_persist, _ = update_data_store(
-                        HOTEL_ENTITY, self.hotel_dicc
-                    )
-            else:
-                status = HOTEL_NOT_FOUND
-
-        return int(status + status_persist), hotel_data
-
-    def _validate_reservation_data(
-            self,
-            room: int,
-            year: int,
-            month: int,
-            day: int,
-            days: int) -> tuple[int, int]:
-        '''
-        Metodo privado para validar los datos de la reservacion
-        '''
-        status = OK_STATUS
-        if (room is None or not isinstance(room, int) or room < 1):
-            status = INVALID_FIELD
-        if (month is None or not isinstance(month, int) or month < 1 or month > 12):
-            status = INVALID_FIELD
-        if (day is None or not isinstance(day, int) or day < 1 or day > 31):
-            status = INVALID_FIELD
-        if (days is None or not isinstance(days, int) or day < 1 or days > 366):
-            status = INVALID_FIELD
-
-        date_value = datetime.datetime(year, month, day, 0, 0)
-        julian_date = date_value.timetuple()
-
-        return status, julian_date.tm_yday
-
-    def _reserve_hotel_rooms(
-            self,
-            name: str,
-            customer_no: str,
-            room: int,
-            year: int,
-            date_day: int,
-            days: int) -> tuple[int, None]:
-        '''
-        Metodo privado para reservar una habitacion. Una habitacion esta
-        representada por una tupla donde el primer valor [0] indica si la
-        habitacion esta ocupada para ese dia (verdadero) o no (falso). Si
-        esta ocupada el segundo valor de la tupla [1] tiene el valor del
-        numero de cliente.
-
-        El metodo intentara reservar una habitacion en el dia solicitado
-        del anio actual. Si puede agregara el numero de cliente en ese
-        dia para esa habitacion.
-
-        Si no puede reserver todos los dias removera las reservaciones en los
-        dias que si pudo y retornara un error de habitacion no encontrada.
-        '''
-        status = OK_STATUS
-        present_year = str(year)
-
-        if room > self.hotel_dicc[name]['rooms']:
-            status = ROOM_NOT_FOUND
-            return status, None
-        if present_year not in self.hotel_dicc[name]:
-            status = ROOM_NOT_FOUND
-            return status, None
-
-        date_val = date_day - 1
-        while (
-                date_val < (date_day - 1 + days)
-                and status == OK_STATUS):
-            if self.hotel_dicc[name][present_year][room - 1][date_val][0]:
-                status = ROOM_NOT_AVAILABLE
-                break
-            self.hotel_dicc[name][present_year][room - 1][date_val] = (True, customer_no)
-            date_val += 1
-
-        if status == ROOM_NOT_AVAILABLE:
-            date_val -= 1
-            while date_val >= (date_day - 1):
-                self.hotel_dicc[name][present_year][room - 1][date_val] = (False, '')
-                date_val -= 1
-
-        return status, None
-
-    def _unreserve_hotel_rooms(
-            self,
-            name: str,
-            customer_no: str,
-            room: int,
-            year: int,
-            date_day: int,
-            days: int) -> tuple[int, None]:
-        '''
-        Metodo privado para reservar una habitacion. Una habitacion esta
-        representada por una tupla donde el primer valor [0] indica si la
-        habitacion esta ocupada para ese dia (verdadero) o no (falso). Si
-        esta ocupada el segundo valor de la tupla [1] tiene el valor del
-        numero de cliente.
-
-        El metodo intentara reservar una habitacion en el dia solicitado
-        del anio actual. Si puede agregara el numero de cliente en ese
-        dia para esa habitacion.
-
-        Si no puede reserver todos los dias removera las reservaciones en los
-        dias que si pudo y retornara un error de habitacion no encontrada.
-        '''
-        status = OK_STATUS
-        present_year = str(year)
-
-        if room > self.hotel_dicc[name]['rooms']:
-            status = ROOM_NOT_FOUND
-            return status, None
-        if present_year not in self.hotel_dicc[name]:
-            status = ROOM_NOT_FOUND
-            return status, None
-
-        date_val = date_day - 1
-        while (
-                date_val < (date_day - 1 + days)
-                and status == OK_STATUS):
-            if not self.hotel_dicc[name][present_year][room - 1][date_val][0]:
-                status = ROOM_NOT_FOUND
-                break
-            if self.hotel_dicc[name][present_year][room - 1][date_val][1] != customer_no:
-                status = ROOM_NOT_FOUND
-                break
-            self.hotel_dicc[name][present_year][room - 1][date_val] = (False, '')
-            date_val += 1
-
-        if status == ROOM_NOT_FOUND:
-            date_val -= 1
-            while date_val >= (date_day - 1):
-                self.hotel_dicc[name][present_year][room - 1][date_val] = (
-                    True, customer_no
-                )
-                date_val -= 1
-
-        return status, None
-
-    def reserve_hotel_room(
-            self,
-            name: str,
-            room: int,
-            customer_no: str,
-            start_month: int,
-            start_day: int,
-            days: int) -> tuple[int, None]:
-        '''
-        Metodo publico para reservar una habitacion en un hotel en el presente
-        anio.
-        '''
-        status = OK_STATUS
-        status_persist = OK_STATUS
-        present_year = datetime.date.today().year
-
-        status, julian_day = self._validate_reservation_data(
-            room,
-            present_year,
-            start_month,
-            start_day,
-            days
-        )
-
-        if status == OK_STATUS:
-            if name in self.hotel_dicc:
-                status, _ = self._reserve_hotel_rooms(
-                    name,
-                    customer_no,
-                    room,
-                    present_year,
-                    julian_day,
-                    days
-                )
-                status_persist, _ = update_data_store(HOTEL_ENTITY, self.hotel_dicc)
-            else:
-                status = HOTEL_NOT_FOUND
-
-        return int(status + status_persist), None
-
-    def cancel_hotel_reservation(
-            self,
-            name: str,
-            room: int,
-            customer_no: str,
-            start_month: int,
-            start_day: int,
-            days: int) -> tuple[int, None]:
-        '''
-        Metodo publico para cancelar la reservarcion de una habitacion en un
-        hotel en el presente anio.
-        '''
-        status = OK_STATUS
-        status_persist = OK_STATUS
-        present_year = datetime.date.today().year
-
-        status, julian_day = self._validate_reservation_data(
-            room,
-            present_year,
-            start_month,
-            start_day,
-            days
-        )
-
-        if status == OK_STATUS:
-            if name in self.hotel_dicc:
-                status, _ = self._unreserve_hotel_rooms(
-                    name,
-                    customer_no,
-                    room,
-                    present_year,
-                    julian_day,
-                    days
-                )
-                status_persist, _ = update_data_store(HOTEL_ENTITY, self.hotel_dicc)
-            else:
-                status = HOTEL_NOT_FOUND
-
-        return int(status + status_persist), None
+'''
+Codigo fuente de la clase Customer. Esta clase usa la clase Persistence.
+
+La clase Customer implementa los metodos create_customer, delete_customer,
+display_customer_info, modify_customer_info
+
+Historia
+Fecha           Descripcion del cambio                      Author
+17-02-2024      Version inicial                             A00260430
+18-10-2026      Modo con diario (journal) de cambios        A00260430
+18-10-2026      Calendario compacto por habitacion          A00260430
+18-10-2026      Indice de rangos y find_available_rooms     A00260430
+18-10-2026      Indice inverso de reservaciones por cliente A00260430
+18-10-2026      Lotes de cambios con una sola escritura     A00260430
+18-10-2026      Escritura solo con cambios y diferida       A00260430
+18-10-2026      Calendarios de varios anios bajo demanda    A00260430
+18-10-2026      Archivos divididos en shards por hotel      A00260430
+18-10-2026      Carga bajo demanda de los shards            A00260430
+18-10-2026      Snapshot de hoteles en formato binario      A00260430
+18-10-2026      Recarga de archivos cambiados por otros     A00260430
+18-10-2026      Control de concurrencia optimista           A00260430
+18-10-2026      Almacenamiento configurable (store)         A00260430
+18-10-2026      Uso compartido entre hilos (candados)       A00260430
+18-10-2026      Registros compactos de hotel (HotelRecord)  A00260430
+18-10-2026      Copia de la ocupacion para analitica        A00260430
+18-10-2026      Asignacion automatica de habitacion         A00260430
+18-10-2026      Indice de clientes con sello de version     A00260430
+18-10-2026      Lote descartado si falla su escritura       A00260430
+18-10-2026      hotel_header.json con compare and swap      A00260430
+18-10-2026      Escritura diferida por tiempo y al terminar A00260430
+'''
+import atexit
+import contextlib
+import datetime
+import functools
+import random
+import threading
+import time
+import weakref
+from persistence import VERSION_CONFLICT as STORE_VERSION_CONFLICT
+from persistence import shard_entity, get_default_store
+from persistence import JSON_FORMAT
+from .room_calendar import RoomCalendar, DAYS_PER_YEAR
+from .interval_index import IntervalIndex
+from .customer_index import CustomerIndex
+from .hotel_record import HotelRecord
+from .room_assignment import BEST_FIT, ROOM_POLICIES
+
+
+OK_STATUS = 0
+ERROR_STATUS = -209
+DUPLICATE_HOTEL = -201
+HOTEL_NOT_FOUND = -202
+INVALID_FIELD = -210
+ROOM_NOT_FOUND = -220
+ROOM_NOT_AVAILABLE = -230
+RESERVATION_NOT_FOUND = -240
+VERSION_CONFLICT = -250
+CONFLICT_RETRIES = 8
+CONFLICT_BACKOFF_MS = 5
+HOTEL_ENTITY = 'hotel'
+CUSTOMER_INDEX_ENTITY = 'hotel_customer'
+HOTEL_HEADER_ENTITY = 'hotel_header'
+
+# Instancias cuyos cambios pendientes se guardan al terminar el programa
+_INSTANCES = weakref.WeakSet()
+
+
+def _close_all():
+    '''
+    Función privada que guarda los cambios pendientes de todas las
+    instancias al terminar el programa (atexit).
+    '''
+    for instance in list(_INSTANCES):
+        instance.close()
+
+
+atexit.register(_close_all)
+
+
+class Hotel():
+    '''
+    Clase Hotel. Esta clase crea un diccionario con datos contenidos en un archivo
+    con formato JSON nombrado hotel.json.
+
+    La estructura del cliente es un diccionario con los campos
+    - name (nombre)
+    - cuartos (anio con una lista de RoomCalendar, uno por cuarto)
+
+    En memoria cada hotel es un HotelRecord (address, rooms y years); en los
+    archivos sigue siendo un diccionario y se convierte al leer y escribir.
+
+    El calendario de un anio se crea la primera vez que se reserva en ese
+    anio. Una estancia que cruza el fin de anio se divide en un segmento por
+    anio.
+
+    En hotel.json cada anio se guarda de forma dispersa, solo con los cuartos
+    que tienen reservaciones: {cuarto: [[dia inicial, dias, cliente], ...]}.
+
+    Si la clase se crea con journaled=True cada cambio se agrega como un
+    registro delta al diario hotel.journal en lugar de reescribir hotel.json;
+    al crecer el diario se compacta en un snapshot nuevo en segundo plano.
+
+    Solo se escribe cuando hay cambios: las operaciones que fallan o que no
+    cambian nada no tocan el archivo. Con flush_every y flush_ms la escritura
+    se difiere hasta acumular N cambios o hasta que pasen T milisegundos desde
+    la ultima escritura; con flush_ms un temporizador guarda los cambios
+    pendientes aunque no lleguen mas cambios. flush guarda los cambios
+    pendientes en cualquier momento y close (que tambien se llama al terminar
+    el programa) los guarda y cancela el temporizador; con flush_every > 1 y
+    sin flush_ms los ultimos cambios solo se guardan con flush o close. Entre begin_batch y commit_batch los cambios solo se aplican en
+    memoria y se guardan todos juntos con una sola escritura al confirmar el
+    lote.
+
+    Si la clase se crea con shards=N los hoteles se guardan repartidos por
+    hash del nombre en N archivos hotel.d/NNNN.json (y su parte del indice de
+    clientes en hotel_customer.d/NNNN.json), cada uno con su candado. Cada
+    escritura solo toca los shards de los hoteles que cambiaron. Los datos
+    generales de todos los hoteles (nombre, direccion y cuartos) tambien se
+    guardan en hotel_header.json.
+
+    El indice de clientes se guarda como {'stamp': sello, 'reservations':
+    indice} despues de cada escritura, con el sello de version del archivo
+    de hoteles (o shard) que regreso la escritura. Al leerlo solo se usa si
+    el sello guardado es el sello actual del archivo; si no (otro proceso o
+    programa cambio el archivo, o se interrumpio la escritura del indice) el
+    indice se crea de nuevo a partir de los calendarios. En modo con diario
+    cada registro cambia el sello, por lo que el indice no se guarda y
+    siempre se crea al leer.
+
+    Con shards y lazy=True solo se lee hotel_header.json al crear la clase;
+    los calendarios de un shard se leen la primera vez que una operacion
+    toca alguno de sus hoteles.
+
+    Antes de cada operacion se compara el sello de version (ver
+    persistence.data_store_stamp) de los archivos leidos; si otro proceso
+    los cambio se vuelven a leer (con shards, solo los shards que cambiaron)
+    y los cambios pendientes de esta instancia se aplican de nuevo.
+
+    Las escrituras son condicionales (compare and swap sobre el sello de
+    version del archivo del hotel o de su shard): si otro proceso escribio
+    primero hay un conflicto. reserve_hotel_room y cancel_hotel_reservation
+    vuelven a leer, verificar y aplicar el cambio, con espera aleatoria
+    creciente entre intentos; si no lo logran regresan VERSION_CONFLICT.
+
+    Los datos se guardan con el store indicado (por omision el de
+    persistence.set_default_store, archivos JSON). Con un store que solo
+    guarda registros delta, como SQLiteStore, la clase usa siempre el modo
+    con diario; los shards solo se usan si el store los acepta.
+
+    Con fmt='binary' los calendarios se guardan en hotel.bin (o en
+    hotel.d/NNNN.bin) en el formato binario de persistence.binary_snapshot
+    en lugar de JSON. El indice de clientes y hotel_header siguen en JSON.
+    El archivo es mas chico y se convierte mas rapido que JSON, pero la
+    clase lo decodifica completo al leerlo (con diario, indice de rangos e
+    indice de clientes): no usa BinarySnapshot ni lee solo las paginas de un
+    cuarto. Para consultar la ocupacion sin decodificar el archivo se usa
+    BinarySnapshot directamente sobre hotel.bin.
+
+    Una instancia se puede usar desde varios hilos. Cada archivo (o shard)
+    tiene un candado que toman las operaciones que cambian sus hoteles, las
+    recargas y las escrituras; cada hotel tiene un candado que protege sus
+    calendarios, por lo que las consultas de un hotel no esperan a las
+    escrituras de otros. Con shards las reservaciones en hoteles de shards
+    distintos se aplican y escriben en paralelo; sin shards todos los
+    hoteles estan en un solo archivo y sus escrituras se hacen una a la vez.
+    Los candados se toman en el orden archivo, hoteles (por nombre) y
+    estructuras compartidas.
+
+    Metodos privados
+    + _validate_hotel_data - verifica que los datos sean del tipo correcto
+    + _persist - guarda los cambios (diario o archivo completo)
+    + _write - escribe los cambios de un archivo (o shard)
+    + _load_shard - lee un shard (calendarios y parte del indice de clientes)
+    + _ensure_loaded - lee el shard de un hotel si aun no se ha leido
+    + _load_all - lee el archivo de hoteles completo (sin shards)
+    + _load_header - lee los datos generales de hotel_header.json
+    + _refresh - vuelve a leer los archivos que cambio otro proceso
+    + _reload - vuelve a leer un archivo (o shard) y aplica los pendientes
+    + _pending_stays - agrupa los registros pendientes por estancia
+    + _stay_applies - verifica si una estancia pendiente se puede aplicar
+    + _take_dropped - obtiene las reservaciones descartadas de los archivos
+    + _load_index_shards - lee las partes del indice de clientes faltantes
+    + _load_index - lee el indice de clientes si su sello es el del archivo
+    + _index_stamp - convierte un sello al formato guardado en el indice
+    + _encode / _decode - convierten los calendarios del formato del archivo
+    + _build_room_index - crea el indice de rangos reservados de un hotel
+    + _build_customer_index - crea el indice de reservaciones por cliente
+    + _split_stay - divide una estancia en segmentos por anio
+    + _year_calendars - obtiene (o crea) los calendarios de un anio
+    + _commit_stay - reserva o cancela con control de concurrencia optimista
+    + _choose_room - elige una habitacion libre con una politica de asignacion
+    + _flush_entity - escribe los registros pendientes de un archivo
+    + _flush_pending - escribe una vez los registros pendientes de un archivo
+    + _discard - descarta registros no guardados y vuelve a leer sus archivos
+    + _schedule_flush / _timed_flush - escritura diferida por temporizador
+    + _write_header - actualiza los datos generales en hotel_header.json
+    + _entity / _entity_lock / _hotel_lock - archivo de un hotel y candados
+
+    Metodos publicos
+    + create_hotel - crea un nuevo registro del hotel.
+    + delete_hotel - borra un registro existente del hotel
+    + display_hotel_info - obtiene los datos de un registro existente del hotel
+    + modify_hotel_info - actualiza los datos de un registro existente del hotel
+    + reserve_hotel_room - reserva una habitacion en un hotel existente
+    + reserve_any_room - elige y reserva una habitacion libre de un hotel
+    + cancel_hotel_reservation - cancela la reservacio de una habitacion en un hotel
+    + find_available_rooms - obtiene las habitaciones libres de un hotel
+    + list_customer_reservations - obtiene las reservaciones de un cliente
+    + occupancy_snapshot - obtiene una copia de la ocupacion de un anio
+    + begin_batch - inicia un lote de cambios sin escrituras
+    + commit_batch - guarda todos los cambios del lote con una escritura
+    + flush - guarda los cambios pendientes
+    + close - guarda los cambios pendientes y cancela el temporizador
+    '''
+
+    def __init__(
+            self,
+            journaled: bool = False,
+            flush_every: int = 1,
+            flush_ms: int = 0,
+            shards: int = 0,
+            lazy: bool = False,
+            fmt: str = JSON_FORMAT,
+            store=None):
+        self.store = store or get_default_store()
+        self.journaled = journaled or self.store.journaled
+        self.fmt = fmt
+        self.shards = shards if self.store.shardable else 0
+        self.lazy = lazy and self.shards > 0
+        self.flush_every = flush_every
+        self.flush_ms = flush_ms
+        # Numero de cambios aplicados en memoria y registros aun no guardados
+        self.version = 0
+        self._pending = []
+        # Reservaciones pendientes descartadas al volver a leer un archivo
+        # porque la habitacion ya no estaba libre; se reportan en flush
+        self._dropped = []
+        self._last_flush = time.monotonic()
+        self._timer = None
+        # Lotes de cambios en curso por hilo (numero de lotes anidados) y
+        # registros de cada lote, para descartarlos si falla la escritura
+        self._batches = {}
+        self._batch_records = {}
+        # Candado de las estructuras compartidas (se toma al final) y
+        # candados por archivo (o shard) y por hotel
+        self._lock = threading.RLock()
+        self._entity_locks = {}
+        self._hotel_locks = {}
+        # Indice inverso de cliente a reservaciones, guardado en
+        # hotel_customer.json y actualizado al aplicar el diario
+        self.customer_index = CustomerIndex()
+        # Indice por hotel de los rangos reservados de cada habitacion
+        self.room_index = {}
+        self.loaded_data = OK_STATUS
+        self.hotel_dicc = {}
+        # Sello de version de cada archivo al leerlo o escribirlo
+        self._stamps = {}
+        _INSTANCES.add(self)
+        if not self.shards:
+            self._load_all()
+            return
+
+        # Shards de hoteles y del indice de clientes, los nombres de los
+        # hoteles de cada shard y los shards ya leidos
+        self.index_shards = dict(zip(
+            self.store.shard_entities(HOTEL_ENTITY, self.shards),
+            self.store.shard_entities(CUSTOMER_INDEX_ENTITY, self.shards)
+        ))
+        self.shard_members = {entity: set() for entity in self.index_shards}
+        self._loaded_shards = set()
+        self._loaded_index_shards = set()
+        # Sello del shard de hoteles con el que se leyo cada parte del
+        # indice de clientes sin leer el shard
+        self._index_stamps = {}
+        header = {}
+        if self.lazy:
+            self.loaded_data, header = self._load_header()
+        if not header:
+            self.lazy = False
+            for entity in self.index_shards:
+                self._load_shard(entity)
+
+    def _entity(self, name: str) -> str:
+        '''
+        Metodo privado que regresa el archivo (o shard) del hotel.
+        '''
+        if self.shards:
+            return shard_entity(HOTEL_ENTITY, name, self.shards)
+        return HOTEL_ENTITY
+
+    def _entity_lock(self, entity: str):
+        '''
+        Metodo privado que regresa el candado del archivo (o shard). Lo toman
+        las operaciones que cambian hoteles del archivo, las recargas y las
+        escrituras.
+        '''
+        with self._lock:
+            return self._entity_locks.setdefault(entity, threading.RLock())
+
+    def _hotel_lock(self, name: str):
+        '''
+        Metodo privado que regresa el candado del hotel, que protege sus
+        calendarios y su indice de rangos.
+        '''
+        with self._lock:
+            return self._hotel_locks.setdefault(name, threading.RLock())
+
+    @contextlib.contextmanager
+    def _entity_hotels_locked(self, entity: str):
+        '''
+        Metodo privado (administrador de contexto) que toma, ordenados por
+        nombre, los candados de todos los hoteles del archivo para cambiarlos
+        juntos al volver a leerlo.
+        '''
+        with self._lock:
+            names = sorted(
+                self.shard_members[entity] if self.shards else self.hotel_dicc
+            )
+        with contextlib.ExitStack() as stack:
+            for name in names:
+                stack.enter_context(self._hotel_lock(name))
+            yield
+
+    def _load_all(self) -> tuple[int, None]:
+        '''
+        Metodo privado que lee el archivo de hoteles completo, con su diario,
+        y el indice de clientes (sin shards).
+        '''
+        stamp = self.store.stamp(HOTEL_ENTITY, self.fmt)
+        index_loaded = self._load_index(CUSTOMER_INDEX_ENTITY, stamp)
+        # Cargando datos del archivo en formato JSON para el diccionario
+        # de hoteles
+        status, data = self.store.load(
+            HOTEL_ENTITY,
+            functools.partial(self._rebuild, index_loaded=index_loaded),
+            self.fmt
+        )
+        room_index = {
+            name: self._build_room_index(hotel_data)
+            for name, hotel_data in data.items()
+        }
+        with self._lock:
+            self._stamps[HOTEL_ENTITY] = stamp
+            self.loaded_data = status
+            self.room_index = room_index
+            self.hotel_dicc.clear()
+            self.hotel_dicc.update(data)
+
+        return self.loaded_data, None
+
+    def _load_header(self) -> tuple[int, dict]:
+        '''
+        Metodo privado que lee hotel_header.json y actualiza los datos
+        generales de los hoteles de los shards que aun no se han leido.
+        '''
+        stamp = self.store.stamp(HOTEL_HEADER_ENTITY)
+        status, header = self.store.load(HOTEL_HEADER_ENTITY)
+        with self._lock:
+            self._stamps[HOTEL_HEADER_ENTITY] = stamp
+            for entity, names in self.shard_members.items():
+                if entity not in self._loaded_shards:
+                    for name in names:
+                        self.hotel_dicc.pop(name, None)
+                    names.clear()
+            for name, hotel_data in header.items():
+                entity = self._entity(name)
+                if entity not in self._loaded_shards:
+                    self.hotel_dicc[name] = HotelRecord.from_dict(hotel_data)
+                    self.shard_members[entity].add(name)
+
+        return status, header
+
+    def _refresh(self, name: str = None):
+        '''
+        Metodo privado que compara el sello de version de los archivos leidos
+        con el sello actual y vuelve a leer solo los que cambio otro proceso.
+        Si se indica un hotel solo se revisa el shard de ese hotel.
+        '''
+        if not self.shards:
+            entities = [HOTEL_ENTITY]
+        elif name is None:
+            with self._lock:
+                entities = sorted(self._loaded_shards)
+        else:
+            entities = [self._entity(name)]
+
+        if (self.lazy and self.store.stamp(HOTEL_HEADER_ENTITY)
+                != self._stamps.get(HOTEL_HEADER_ENTITY)):
+            self._load_header()
+        for entity in entities:
+            if (entity in self._stamps
+                    and self.store.stamp(entity, self.fmt) != self._stamps[entity]):
+                # Otro hilo pudo volver a leerlo mientras se esperaba
+                with self._entity_lock(entity):
+                    if self.store.stamp(entity, self.fmt) != self._stamps[entity]:
+                        self._reload(entity)
+
+    def _reload(self, entity: str):
+        '''
+        Metodo privado que vuelve a leer un archivo de hoteles (o un shard)
+        que cambio otro proceso. Los registros pendientes de esta instancia
+        (aun no guardados) se verifican y aplican de nuevo sobre los datos
+        leidos; los que ya no se pueden aplicar (por ejemplo, una reservacion
+        de una habitacion que otro proceso ocupo) se descartan y las
+        reservaciones descartadas se reportan en flush. Se llama con el
+        candado del archivo.
+        '''
+        with self._lock:
+            pending = [
+                record for record in self._pending
+                if self._entity(record[1]) == entity
+            ]
+        with self._entity_hotels_locked(entity):
+            if self.shards:
+                for name in self.shard_members[entity]:
+                    self.customer_index.drop_hotel(name)
+                    self.room_index.pop(name, None)
+                with self._lock:
+                    self._loaded_shards.discard(entity)
+                    self._loaded_index_shards.discard(self.index_shards[entity])
+                self._load_shard(entity)
+            else:
+                self.customer_index = CustomerIndex()
+                self._load_all()
+
+            dropped = []
+            for stay in self._pending_stays(pending):
+                if self._stay_applies(stay):
+                    for record in stay:
+                        self._apply_journal_record(self.hotel_dicc, record)
+                else:
+                    dropped.append(stay)
+            with self._lock:
+                dropped_ids = {id(record) for stay in dropped for record in stay}
+                self._pending = [
+                    record for record in self._pending
+                    if id(record) not in dropped_ids
+                ]
+                self._dropped.extend(
+                    stay for stay in dropped if stay[0][0] == 'reserve'
+                )
+                for name in {record[1] for record in pending}:
+                    if name in self.hotel_dicc:
+                        self.room_index[name] = self._build_room_index(
+                            self.hotel_dicc[name]
+                        )
+                        if self.shards:
+                            self.shard_members[entity].add(name)
+                    else:
+                        self.room_index.pop(name, None)
+                        if self.shards:
+                            self.shard_members[entity].discard(name)
+
+    @staticmethod
+    def _pending_stays(records: list) -> list:
+        '''
+        Metodo privado que agrupa los registros pendientes por estancia. Los
+        segmentos de una estancia que cruza el fin de anio son registros
+        seguidos de la misma operacion, hotel, cuarto y cliente, y se
+        verifican juntos para no aplicar solo una parte de la estancia.
+
+        Regresa la lista de estancias (listas de registros)
+        '''
+        stays = []
+        for record in records:
+            if (stays and record[0] in ('reserve', 'cancel')
+                    and record[4] == 1):
+                last = stays[-1][-1]
+                year_days = (
+                    datetime.date(last[3] + 1, 1, 1)
+                    - datetime.date(last[3], 1, 1)
+                ).days
+                if (last[:3] == record[:3] and last[6] == record[6]
+                        and last[3] + 1 == record[3]
+                        and last[4] + last[5] - 1 == year_days):
+                    stays[-1].append(record)
+                    continue
+            stays.append([record])
+        return stays
+
+    def _stay_applies(self, stay: list) -> bool:
+        '''
+        Metodo privado que verifica si una estancia pendiente (o un registro
+        de otro tipo) se puede aplicar sobre los datos actuales: el hotel debe
+        existir (salvo al crearlo), una reservacion solo si la habitacion
+        sigue libre en todos sus segmentos y una cancelacion solo si el
+        cliente aun tiene reservados todos sus dias.
+        '''
+        operation = stay[0][0]
+        name = stay[0][1]
+        if operation == 'hotel':
+            return True
+        if name not in self.hotel_dicc:
+            return False
+        if operation not in ('reserve', 'cancel'):
+            return True
+
+        hotel_data = self.hotel_dicc[name]
+        for _, _, room, year, date_day, days, customer_no in stay:
+            if room > hotel_data.rooms:
+                return False
+            calendars = hotel_data.years.get(str(year))
+            if operation == 'reserve':
+                if (calendars is not None
+                        and not calendars[room - 1].is_free(date_day - 1, days)):
+                    return False
+            elif (calendars is None
+                  or not calendars[room - 1].is_booked_by(
+                      date_day - 1, days, customer_no)):
+                return False
+        return True
+
+    def _take_dropped(self, entities) -> list:
+        '''
+        Metodo privado que quita y regresa las reservaciones descartadas (ver
+        _reload) de los archivos indicados, como diccionarios con hotel,
+        room, customer_no, year, start_month, start_day y days.
+        '''
+        with self._lock:
+            dropped = [
+                stay for stay in self._dropped
+                if self._entity(stay[0][1]) in entities
+            ]
+            self._dropped = [
+                stay for stay in self._dropped
+                if self._entity(stay[0][1]) not in entities
+            ]
+
+        reservations = []
+        for stay in dropped:
+            _, name, room, year, date_day, _, customer_no = stay[0]
+            start_date = datetime.date(year, 1, 1) + datetime.timedelta(
+                days=date_day - 1
+            )
+            reservations.append({
+                'hotel': name,
+                'room': room,
+                'customer_no': customer_no,
+                'year': year,
+                'start_month': start_date.month,
+                'start_day': start_date.day,
+                'days': sum(record[5] for record in stay)
+            })
+        return reservations
+
+    def _load_shard(self, entity: str) -> tuple[int, None]:
+        '''
+        Metodo privado que lee un shard de hoteles, con su diario, y su parte
+        del indice de clientes si no se ha leido. Los datos generales leidos
+        de hotel_header.json se reemplazan por los datos completos. Se llama
+        con el candado del shard (o al crear la clase).
+        '''
+        with self._lock:
+            if entity in self._loaded_shards:
+                return OK_STATUS, None
+            index_entity = self.index_shards[entity]
+            load_index = index_entity not in self._loaded_index_shards
+
+        stamp = self.store.stamp(entity, self.fmt)
+        if load_index:
+            index_loaded = self._load_index(index_entity, stamp)
+            with self._lock:
+                self._loaded_index_shards.add(index_entity)
+                self._index_stamps.pop(index_entity, None)
+        else:
+            # La parte del indice se leyo antes sin el shard; si el shard
+            # cambio desde entonces se crea de nuevo
+            with self._lock:
+                index_stamp = self._index_stamps.pop(index_entity, stamp)
+            index_loaded = index_stamp == stamp
+            if not index_loaded:
+                for name in list(self.customer_index.hotel_customers):
+                    if self._entity(name) == entity:
+                        self.customer_index.drop_hotel(name)
+
+        status, data = self.store.load(
+            entity,
+            functools.partial(self._rebuild, index_loaded=index_loaded),
+            self.fmt
+        )
+        room_index = {
+            name: self._build_room_index(hotel_data)
+            for name, hotel_data in data.items()
+        }
+        with self._lock:
+            self._stamps[entity] = stamp
+            self.loaded_data = min(self.loaded_data, status)
+            # El indice se publica antes que los hoteles
+            self.room_index.update(room_index)
+            for name in self.shard_members[entity] - set(data):
+                self.hotel_dicc.pop(name, None)
+            self.hotel_dicc.update(data)
+            self.shard_members[entity] = set(data)
+            self._loaded_shards.add(entity)
+
+        return status, None
+
+    def _load_index_shards(self):
+        '''
+        Metodo privado que lee las partes del indice de clientes que aun no
+        se han leido. Si una parte no tiene el sello actual de su shard (ver
+        _load_index) o la clase usa diario (el indice no se guarda) se lee el
+        shard completo. Se llama con los candados de los shards.
+        '''
+        for entity, index_entity in self.index_shards.items():
+            with self._lock:
+                if (entity in self._loaded_shards
+                        or index_entity in self._loaded_index_shards):
+                    continue
+            stamp = self.store.stamp(entity, self.fmt)
+            if self._load_index(index_entity, stamp):
+                with self._lock:
+                    self._loaded_index_shards.add(index_entity)
+                    self._index_stamps[index_entity] = stamp
+            else:
+                self._load_shard(entity)
+
+    def _load_index(self, index_entity: str, stamp: tuple) -> bool:
+        '''
+        Metodo privado que lee el indice de clientes de un archivo de hoteles
+        (o shard) y lo agrega al indice si se guardo con el sello de version
+        stamp del archivo. Un indice sin sello (formato anterior) o con otro
+        sello no se usa.
+
+        Regresa verdadero si se agrego el indice leido
+        '''
+        if self.journaled:
+            return False
+        _, index_data = self.store.load(index_entity)
+        if ('reservations' not in index_data
+                or index_data.get('stamp') != self._index_stamp(stamp)):
+            return False
+        self.customer_index.merge(index_data['reservations'])
+        return True
+
+    @staticmethod
+    def _index_stamp(stamp):
+        '''
+        Metodo privado que convierte el sello de version a listas, como
+        queda al guardarlo y leerlo en JSON.
+        '''
+        if isinstance(stamp, (list, tuple)):
+            return [Hotel._index_stamp(part) for part in stamp]
+        return stamp
+
+    def _ensure_loaded(self, name: str):
+        '''
+        Metodo privado que lee el shard del hotel si la clase se creo con
+        lazy=True y el shard aun no se ha leido.
+        '''
+        if self.lazy:
+            entity = self._entity(name)
+            with self._entity_lock(entity):
+                self._load_shard(entity)
+
+    @staticmethod
+    def _build_room_index(hotel_data: HotelRecord) -> IntervalIndex:
+        '''
+        Metodo privado que crea el indice de rangos reservados de un hotel a
+        partir de sus calendarios.
+        '''
+        room_index = IntervalIndex(hotel_data.rooms)
+        for year, year_data in hotel_data.years.items():
+            first_day = datetime.date(int(year), 1, 1).toordinal()
+            for room, calendar in enumerate(year_data, 1):
+                for start, booking in calendar.bookings.items():
+                    room_index.add(
+                        room, first_day + start, first_day + start + booking[0]
+                    )
+        return room_index
+
+    def _rebuild(
+            self,
+            data: dict,
+            records: list,
+            index_loaded: bool = True) -> dict:
+        '''
+        Metodo privado que convierte el snapshot leido de hotel.json y aplica
+        los registros del diario. Si no se leyo el indice de clientes del
+        archivo (o su sello no era el del archivo) se crea a partir de los
+        calendarios.
+        '''
+        data = self._decode(data)
+        if not index_loaded:
+            self.customer_index.merge(
+                self._build_customer_index(data).reservations
+            )
+        for record in records:
+            self._apply_journal_record(data, record)
+        return data
+
+    @staticmethod
+    def _build_customer_index(data: dict) -> CustomerIndex:
+        '''
+        Metodo privado que crea el indice de reservaciones por cliente a
+        partir de los calendarios, cuando hotel_customer.json no existe o no
+        corresponde al archivo de hoteles.
+        '''
+        customer_index = CustomerIndex()
+        for name, hotel_data in data.items():
+            for year, year_data in hotel_data.years.items():
+                for room, calendar in enumerate(year_data, 1):
+                    for start, booking in calendar.bookings.items():
+                        customer_index.add(
+                            booking[1], name, room, int(year), start + 1,
+                            booking[0]
+                        )
+        return customer_index
+
+    @staticmethod
+    def _decode(data: dict) -> dict:
+        '''
+        Metodo privado que convierte los hoteles del formato del archivo a
+        HotelRecord, con los calendarios como listas de RoomCalendar. Tambien
+        acepta el formato anterior, con una lista de 366 pares [ocupado,
+        cliente] por cuarto.
+        '''
+        for name, hotel_data in data.items():
+            hotel_data = HotelRecord.from_dict(hotel_data)
+            for year, year_data in hotel_data.years.items():
+                if isinstance(year_data, list):
+                    hotel_data.years[year] = [
+                        RoomCalendar.decode(room_data) for room_data in year_data
+                    ]
+                    continue
+                room_list = [RoomCalendar() for _ in range(hotel_data.rooms)]
+                for room, room_data in year_data.items():
+                    room_list[int(room) - 1] = RoomCalendar.decode(room_data)
+                hotel_data.years[year] = room_list
+            data[name] = hotel_data
+        return data
+
+    def _encode(self, names=None) -> dict:
+        '''
+        Metodo privado que convierte los calendarios al formato del archivo.
+        Si se indican nombres solo se convierten esos hoteles.
+        '''
+        data = {}
+        if names is None:
+            names = self.hotel_dicc
+        for name in names:
+            hotel_data = self.hotel_dicc[name]
+            data[name] = hotel_data.to_dict()
+            for year, year_data in hotel_data.years.items():
+                data[name][year] = {
+                    str(room + 1): calendar.encode()
+                    for room, calendar in enumerate(year_data)
+                    if calendar.bookings
+                }
+        return data
+
+    def _apply_journal_record(self, data: dict, record: list):
+        '''
+        Metodo privado para aplicar un registro del diario. Los registros son
+        asignaciones, por lo que aplicarlos de nuevo no cambia el resultado.
+
+        - ['hotel', nombre, direccion, cuartos]
+        - ['address', nombre, direccion]
+        - ['delete', nombre]
+        - ['reserve', nombre, cuarto, anio, dia, dias, cliente]
+        - ['cancel', nombre, cuarto, anio, dia, dias, cliente]
+        '''
+        operation = record[0]
+        name = record[1]
+        if operation in ('hotel', 'delete'):
+            self.customer_index.drop_hotel(name)
+        if operation == 'hotel':
+            data[name] = HotelRecord(record[2], record[3])
+        elif operation == 'address':
+            if name in data:
+                data[name].address = record[2]
+        elif operation == 'delete':
+            data.pop(name, None)
+        elif operation in ('reserve', 'cancel'):
+            _, _, room, year, date_day, days, customer_no = record
+            calendar = self._year_calendars(data[name], year)[room - 1]
+            for start, length, owner in calendar.release(date_day - 1, days):
+                self.customer_index.remove(
+                    owner, name, room, year, start + 1, length
+                )
+            if operation == 'reserve':
+                calendar.book(date_day - 1, days, customer_no)
+                self.customer_index.add(
+                    customer_no, name, room, year, date_day, days
+                )
+
+    def _persist(
+            self,
+            records: list,
+            retries: int = CONFLICT_RETRIES,
+            entity: str = None) -> tuple[int, None]:
+        '''
+        Metodo privado para registrar los cambios de una operacion sobre los
+        hoteles de un archivo (entity). Sin registros no hay cambios y no se
+        escribe nada. Los registros se acumulan y se guardan con
+        _flush_entity segun la politica de escritura diferida (o al confirmar
+        el lote en curso). Se llama con el candado del archivo.
+        '''
+        if not records:
+            return OK_STATUS, None
+
+        with self._lock:
+            self.version += 1
+            self._pending.extend(records)
+            if threading.get_ident() in self._batch_records:
+                self._batch_records[threading.get_ident()].extend(records)
+            due = (
+                sum(1 for record in self._pending
+                    if self._entity(record[1]) == entity) >= self.flush_every
+                or (self.flush_ms
+                    and (time.monotonic() - self._last_flush) * 1000
+                    >= self.flush_ms)
+            )
+        if threading.get_ident() in self._batches or not due:
+            self._schedule_flush()
+            return OK_STATUS, None
+
+        return self._flush_entity(entity, retries)
+
+    def _schedule_flush(self):
+        '''
+        Metodo privado que, con flush_ms, programa un temporizador que guarda
+        los cambios pendientes en flush_ms milisegundos (si no hay uno ya
+        programado).
+        '''
+        with self._lock:
+            if not self.flush_ms or self._timer is not None:
+                return
+            self._timer = threading.Timer(self.flush_ms / 1000, self._timed_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _timed_flush(self):
+        '''
+        Metodo privado que ejecuta el temporizador: guarda los registros
+        pendientes de cada archivo como _persist (las reservaciones
+        descartadas se siguen reportando en flush). Si hay un lote en curso,
+        o quedan registros pendientes por un conflicto, se programa de nuevo.
+        '''
+        with self._lock:
+            self._timer = None
+            busy = bool(self._batches)
+            entities = sorted({self._entity(record[1]) for record in self._pending})
+        if not busy:
+            for entity in entities:
+                status, _ = self._flush_entity(entity)
+                if status != OK_STATUS:
+                    print(
+                        '[ERROR] - An exception ocurred',
+                        f'while flushing entity {entity}: {status}'
+                    )
+        with self._lock:
+            pending = bool(self._pending)
+        if pending:
+            self._schedule_flush()
+
+    def close(self) -> tuple[int, None]:
+        '''
+        Metodo publico que cancela el temporizador de escritura diferida y
+        guarda los cambios pendientes (ver flush). Se llama al terminar el
+        programa para cada instancia que sigue en uso.
+
+        Regresa una tupla (err, None o reservaciones descartadas)
+        '''
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        return self.flush()
+
+    def flush(self, retries: int = CONFLICT_RETRIES) -> tuple[int, None]:
+        '''
+        Metodo publico para guardar los cambios pendientes. Con shards solo
+        se escriben los shards de los hoteles que cambiaron.
+
+        Cada archivo (o shard) se escribe solo si nadie mas lo cambio desde
+        que se leyo (ver persistence.commit_data_store). Si otro proceso lo
+        cambio, el archivo se vuelve a leer, los registros pendientes se
+        aplican de nuevo sobre los datos leidos y se reintenta hasta retries
+        veces, esperando un tiempo aleatorio creciente entre intentos. Si no
+        se logra escribir los registros quedan pendientes y se regresa
+        VERSION_CONFLICT.
+
+        Las reservaciones pendientes que al volver a leer ya no estaban
+        libres se descartan (no se guardan) y, si lo demas se guardo, se
+        regresa ROOM_NOT_AVAILABLE con la lista de esas reservaciones.
+
+        Regresa una tupla (err, None o reservaciones descartadas)
+        '''
+        with self._lock:
+            entities = sorted(
+                {self._entity(record[1]) for record in self._pending}
+                | {self._entity(stay[0][1]) for stay in self._dropped}
+            )
+
+        status = OK_STATUS
+        for entity in entities:
+            status_entity, _ = self._flush_entity(entity, retries)
+            status = min(status, status_entity)
+
+        dropped = self._take_dropped(entities)
+        if status == OK_STATUS and dropped:
+            return ROOM_NOT_AVAILABLE, dropped
+        return status, None
+
+    def _flush_entity(
+            self,
+            entity: str,
+            retries: int = CONFLICT_RETRIES) -> tuple[int, None]:
+        '''
+        Metodo privado que guarda, con el candado del archivo, los registros
+        pendientes de un archivo (o shard), reintentando despues de un
+        conflicto de version como se describe en flush.
+
+        Regresa una tupla (err, None)
+        '''
+        with self._entity_lock(entity):
+            for attempt in range(retries + 1):
+                status, conflict = self._flush_pending(entity)
+                if not conflict:
+                    return status, None
+                if attempt < retries:
+                    self._reload(entity)
+                    self._backoff(attempt)
+
+        return VERSION_CONFLICT, None
+
+    @staticmethod
+    def _backoff(attempt: int):
+        '''
+        Metodo privado que espera un tiempo aleatorio, que crece al doble con
+        cada intento, antes de reintentar despues de un conflicto.
+        '''
+        time.sleep(random.uniform(0, CONFLICT_BACKOFF_MS * 2 ** attempt) / 1000)
+
+    def _flush_pending(self, entity: str) -> tuple[int, bool]:
+        '''
+        Metodo privado que escribe una vez los registros pendientes de un
+        archivo (o shard). Si hay conflicto de version los registros vuelven
+        a quedar pendientes. Se llama con el candado del archivo.
+
+        Regresa una tupla (err, verdadero si hubo conflicto)
+        '''
+        with self._lock:
+            records = []
+            others = []
+            for record in self._pending:
+                if self._entity(record[1]) == entity:
+                    records.append(record)
+                else:
+                    others.append(record)
+            if not records:
+                return OK_STATUS, False
+            self._pending = others
+            self._last_flush = time.monotonic()
+
+        if self.shards:
+            status, _ = self._write(
+                entity,
+                self.index_shards[entity],
+                self.shard_members[entity],
+                records
+            )
+        else:
+            status, _ = self._write(
+                entity, CUSTOMER_INDEX_ENTITY, None, records
+            )
+        if status == VERSION_CONFLICT:
+            with self._lock:
+                self._pending = records + self._pending
+            return status, True
+
+        names = {
+            record[1] for record in records
+            if record[0] in ('hotel', 'address', 'delete')
+        }
+        if self.shards and names:
+            status = min(status, self._write_header(names))
+
+        return status, False
+
+    def _write_header(self, names: set, retries: int = CONFLICT_RETRIES) -> int:
+        '''
+        Metodo privado que actualiza en hotel_header.json los datos generales
+        (direccion y cuartos) de los hoteles indicados, que se acaban de
+        guardar en su shard. Los demas hoteles del archivo no se tocan: se
+        lee el archivo, se cambian solo esos hoteles y se escribe solo si
+        nadie lo cambio desde la lectura (compare and swap); si alguien lo
+        cambio se vuelve a leer y se reintenta. Se llama con el candado del
+        shard de los hoteles.
+
+        El sello guardado no se actualiza, por lo que con lazy=True el
+        siguiente _refresh lee los hoteles que otros procesos agregaron.
+
+        Regresa el err de la escritura
+        '''
+        with self._entity_lock(HOTEL_HEADER_ENTITY):
+            for attempt in range(retries + 1):
+                stamp = self.store.stamp(HOTEL_HEADER_ENTITY)
+                _, header = self.store.load(HOTEL_HEADER_ENTITY)
+                with self._lock:
+                    for name in names:
+                        if name in self.hotel_dicc:
+                            header[name] = self.hotel_dicc[name].to_dict()
+                        else:
+                            header.pop(name, None)
+                status, _ = self.store.commit(
+                    HOTEL_HEADER_ENTITY, stamp, data=header
+                )
+                if status != STORE_VERSION_CONFLICT:
+                    return status
+                if attempt < retries:
+                    self._backoff(attempt)
+
+        return VERSION_CONFLICT
+
+    def _write(
+            self,
+            entity: str,
+            index_entity: str,
+            names,
+            records: list) -> tuple[int, None]:
+        '''
+        Metodo privado para escribir los cambios de un archivo de hoteles (o
+        de un shard, con los nombres de sus hoteles). En modo con diario solo
+        se agregan los registros delta (y se compacta el diario cuando
+        crece); en otro caso se reescribe el archivo completo junto con su
+        indice de clientes. Si el archivo cambio desde la ultima lectura no
+        se escribe y se regresa VERSION_CONFLICT.
+        '''
+        if not self.journaled:
+            status, stamp = self.store.commit(
+                entity,
+                self._stamps.get(entity),
+                data=self._encode(names),
+                fmt=self.fmt
+            )
+        else:
+            status, stamp = self.store.commit(
+                entity, self._stamps.get(entity), records=records, fmt=self.fmt
+            )
+        if status == STORE_VERSION_CONFLICT:
+            return VERSION_CONFLICT, None
+        if status != OK_STATUS:
+            return status, None
+        self._stamps[entity] = stamp
+
+        if not self.journaled:
+            # El indice se guarda con el sello que regreso el commit; si otro
+            # proceso escribe el archivo antes que el indice, los sellos no
+            # coinciden y el indice se crea de nuevo al leer
+            if names is None:
+                index_data = self.customer_index.reservations
+            else:
+                index_data = self.customer_index.subset(names)
+            status, _ = self.store.update(index_entity, {
+                'stamp': self._index_stamp(stamp),
+                'reservations': index_data
+            })
+
+        # El sello incluye el tamaño del diario (segundo elemento)
+        if self.journaled and self.store.checkpoint_due(stamp):
+            # El snapshot se guarda con el candado del archivo y solo si
+            # nadie escribio despues de este commit; si alguien escribio se
+            # compacta en una escritura siguiente. El sello guardado es el
+            # del commit, por lo que el siguiente _refresh vuelve a leer el
+            # archivo compactado (y lo de otros procesos)
+            status, _ = self.store.checkpoint(
+                entity,
+                self._encode(names),
+                self.fmt,
+                expected_stamp=stamp
+            )
+            if status == STORE_VERSION_CONFLICT:
+                status = OK_STATUS
+
+        return status, None
+
+    def _validate_hotel_data(
+            self,
+            partial: bool,
+            name: str,
+            address: str,
+            rooms: int) -> tuple[int, dict]:
+        '''
+        Este metodo valida los campos del hotel.
+
+        El metodo retorna una tupla (err, field_list)
+        '''
+        status = 0
+        field_list = {}
+        if name is None or not isinstance(name, str) or name == '':
+            status = INVALID_FIELD
+        field_list['name'] = (
+            bool(isinstance(name, str)),
+            name
+        )
+        if address is None or not isinstance(address, str) or address == '':
+            status = INVALID_FIELD
+        field_list['address'] = (
+            bool(isinstance(address, str)),
+            address
+        )
+        if (rooms is None or not isinstance(rooms, int) or rooms <= 0) and not partial:
+            status = INVALID_FIELD
+        field_list['rooms'] = (
+            bool(isinstance(rooms, int)),
+            rooms
+        )
+
+        return status, field_list
+
+    def create_hotel(
+            self,
+            name: str,
+            address: str,
+            rooms: int) -> tuple[int, None]:
+        '''
+        Metodo para crear un registro nuevo de hotel. La llave primaria es el nombre
+        del hotel.
+
+        El metodo retorna una tupla (err, None)
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+
+        status, _ = self._validate_hotel_data(
+            False,
+            name,
+            address,
+            rooms
+        )
+
+        if status == OK_STATUS:
+            entity = self._entity(name)
+            with self._entity_lock(entity):
+                self._refresh(name)
+                self._ensure_loaded(name)
+                if name in self.hotel_dicc:
+                    status = DUPLICATE_HOTEL
+                else:
+                    hotel_data = HotelRecord(address, rooms)
+                    with self._lock:
+                        self.room_index[name] = IntervalIndex(rooms)
+                        self.hotel_dicc[name] = hotel_data
+                        if self.shards:
+                            self.shard_members[entity].add(name)
+                    status_persist, _ = self._persist(
+                        [['hotel', name, address, rooms]], entity=entity
+                    )
+
+        return int(status + status_persist), None
+
+    def delete_hotel(self, name: str) -> tuple[int, None]:
+        '''
+        Este metodo remueve un hotel en el diccionario de clientes.
+
+        El diccionario de hotel es almacenado en el archivo customer.json
+
+        Regresa una tupla (err, None)
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+
+        entity = self._entity(name)
+        with self._entity_lock(entity):
+            self._refresh(name)
+            if name in self.hotel_dicc:
+                self._ensure_loaded(name)
+                with self._hotel_lock(name):
+                    with self._lock:
+                        self.hotel_dicc.pop(name)
+                        self.room_index.pop(name, None)
+                        if self.shards:
+                            self.shard_members[entity].discard(name)
+                    self.customer_index.drop_hotel(name)
+                status_persist, _ = self._persist(
+                    [['delete', name]], entity=entity
+                )
+            else:
+                status = HOTEL_NOT_FOUND
+
+        return int(status + status_persist), None
+
+    def display_hotel_info(self, name: str) -> tuple[int, dict]:
+        '''
+        Este metodo depliega los datos de un hotel en el diccionario de
+        clientes.
+
+        El diccionario de hotel es almacenado en el archivo customer.json
+
+        Regresa una tupla (err, diccionario)
+        '''
+        status = OK_STATUS
+        hotel_data = {}
+
+        self._refresh(name)
+        with self._hotel_lock(name):
+            stored_data = self.hotel_dicc.get(name)
+            if stored_data is not None:
+                hotel_data['name'] = name
+                hotel_data.update(stored_data.to_dict())
+            else:
+                status = HOTEL_NOT_FOUND
+
+        return status, hotel_data
+
+    def modify_hotel_info(self, name: str, address: str) -> tuple[int, dict]:
+        '''
+        Este metodo depliega los datos de un hotel en el diccionario de
+        clientes.
+
+        El diccionario de hotel es almacenado en el archivo customer.json
+
+        Regresa una tupla (err, diccionario)
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+        hotel_field_list = {}
+        hotel_data = {}
+
+        status, hotel_field_list = self._validate_hotel_data(
+            True,
+            name,
+            address,
+            None
+        )
+
+        if status == OK_STATUS:
+            entity = self._entity(name)
+            with self._entity_lock(entity):
+                self._refresh(name)
+                if name in self.hotel_dicc:
+                    self._ensure_loaded(name)
+                    records = []
+                    with self._hotel_lock(name):
+                        hotel_data['name'] = name
+                        hotel_data['rooms'] = self.hotel_dicc[name].rooms
+                        if hotel_field_list['address'][0]:
+                            if self.hotel_dicc[name].address != address:
+                                records.append(['address', name, address])
+                            self.hotel_dicc[name].address = address
+                            hotel_data['address'] = address
+                    status_persist, _ = self._persist(records, entity=entity)
+                else:
+                    status = HOTEL_NOT_FOUND
+
+        return int(status + status_persist), hotel_data
+
+    def _validate_reservation_data(
+            self,
+            room: int,
+            year: int,
+            month: int,
+            day: int,
+            days: int) -> tuple[int, int]:
+        '''
+        Metodo privado para validar los datos de la reservacion
+
+        El metodo retorna una tupla (err, dia juliano)
+        '''
+        status = OK_STATUS
+        julian_day = None
+        if (room is None or not isinstance(room, int) or room < 1):
+            status = INVALID_FIELD
+        if (year is None or not isinstance(year, int)
+                or year < datetime.MINYEAR or year > datetime.MAXYEAR):
+            status = INVALID_FIELD
+        if (month is None or not isinstance(month, int) or month < 1 or month > 12):
+            status = INVALID_FIELD
+        if (day is None or not isinstance(day, int) or day < 1 or day > 31):
+            status = INVALID_FIELD
+        if (days is None or not isinstance(days, int) or days < 1 or days > 366):
+            status = INVALID_FIELD
+
+        if status == OK_STATUS:
+            try:
+                start_date = datetime.date(year, month, day)
+                julian_day = start_date.timetuple().tm_yday
+            except ValueError:
+                status = INVALID_FIELD
+
+        # El ultimo dia de la estancia debe ser una fecha valida
+        if (status == OK_STATUS and start_date.toordinal() + days - 1
+                > datetime.date.max.toordinal()):
+            status = INVALID_FIELD
+            julian_day = None
+
+        return status, julian_day
+
+    @staticmethod
+    def _split_stay(year: int, date_day: int, days: int) -> list:
+        '''
+        Metodo privado que divide una estancia en segmentos
+        (anio, dia juliano, dias), uno por cada anio que toca.
+        '''
+        segments = []
+        while days > 0:
+            year_days = datetime.date(year, 12, 31).timetuple().tm_yday
+            length = min(days, year_days - date_day + 1)
+            segments.append((year, date_day, length))
+            days -= length
+            year += 1
+            date_day = 1
+        return segments
+
+    @staticmethod
+    def _year_calendars(hotel_data: HotelRecord, year: int) -> list:
+        '''
+        Metodo privado que regresa los calendarios de un anio del hotel,
+        creandolos la primera vez que se usa el anio.
+        '''
+        if str(year) not in hotel_data.years:
+            hotel_data.years[str(year)] = [
+                RoomCalendar() for _ in range(hotel_data.rooms)
+            ]
+        return hotel_data.years[str(year)]
+
+    def _reserve_hotel_rooms(
+            self,
+            name: str,
+            customer_no: str,
+            room: int,
+            year: int,
+            date_day: int,
+            days: int) -> tuple[int, list]:
+        '''
+        Metodo privado para reservar una habitacion. La ocupacion de cada
+        habitacion esta representada por un RoomCalendar por anio: un arreglo
+        de bytes por dia (ocupado o libre) y los rangos reservados con el
+        numero de cliente.
+
+        El metodo verifica que todo el rango de dias este libre, en todos los
+        anios que toca, y solo entonces lo reserva para el cliente, por lo que
+        no hay que deshacer reservaciones parciales. Si algun dia esta ocupado
+        retorna un error de habitacion no disponible.
+
+        Regresa una tupla (err, segmentos reservados (anio, dia, dias))
+        '''
+        status = OK_STATUS
+        hotel_data = self.hotel_dicc[name]
+
+        if room < 1 or room > hotel_data.rooms:
+            status = ROOM_NOT_FOUND
+            return status, []
+
+        segments = self._split_stay(year, date_day, days)
+        for seg_year, seg_day, seg_days in segments:
+            if (str(seg_year) in hotel_data.years
+                    and not hotel_data.years[str(seg_year)][room - 1].is_free(
+                        seg_day - 1, seg_days)):
+                status = ROOM_NOT_AVAILABLE
+                return status, []
+
+        for seg_year, seg_day, seg_days in segments:
+            calendar = self._year_calendars(hotel_data, seg_year)[room - 1]
+            calendar.book(seg_day - 1, seg_days, customer_no)
+            first_day = datetime.date(seg_year, 1, 1).toordinal() + seg_day - 1
+            self.room_index[name].add(room, first_day, first_day + seg_days)
+            self.customer_index.add(
+                customer_no, name, room, seg_year, seg_day, seg_days
+            )
+
+        return status, segments
+
+    def _unreserve_hotel_rooms(
+            self,
+            name: str,
+            customer_no: str,
+            room: int,
+            year: int,
+            date_day: int,
+            days: int) -> tuple[int, list]:
+        '''
+        Metodo privado para cancelar la reservacion de una habitacion.
+
+        El metodo verifica que todos los dias del rango, en todos los anios
+        que toca, esten reservados por el cliente y solo entonces los libera.
+        Si algun dia esta libre o reservado por otro cliente retorna un error
+        de habitacion no encontrada.
+
+        Regresa una tupla (err, segmentos liberados (anio, dia, dias))
+        '''
+        status = OK_STATUS
+        hotel_data = self.hotel_dicc[name]
+
+        if room < 1 or room > hotel_data.rooms:
+            status = ROOM_NOT_FOUND
+            return status, []
+
+        segments = self._split_stay(year, date_day, days)
+        for seg_year, seg_day, seg_days in segments:
+            if (str(seg_year) not in hotel_data.years
+                    or not hotel_data.years[str(seg_year)][room - 1].is_booked_by(
+                        seg_day - 1, seg_days, customer_no)):
+                status = ROOM_NOT_FOUND
+                return status, []
+
+        for seg_year, seg_day, seg_days in segments:
+            hotel_data.years[str(seg_year)][room - 1].release(seg_day - 1, seg_days)
+            first_day = datetime.date(seg_year, 1, 1).toordinal() + seg_day - 1
+            self.room_index[name].remove(room, first_day, first_day + seg_days)
+            self.customer_index.remove(
+                customer_no, name, room, seg_year, seg_day, seg_days
+            )
+
+        return status, segments
+
+    def _commit_stay(
+            self,
+            operation: str,
+            name: str,
+            customer_no: str,
+            room: int,
+            year: int,
+            date_day: int,
+            days: int,
+            policy=None) -> tuple[int, int, int]:
+        '''
+        Metodo privado que reserva ('reserve') o cancela ('cancel') una
+        estancia con control de concurrencia optimista: se aplica el cambio
+        sobre los datos actuales del hotel y se guarda solo si el archivo del
+        hotel (o su shard) no cambio desde que se leyo. Cada intento se hace
+        con el candado del archivo, por lo que los cambios de otros hilos en
+        el mismo archivo no se mezclan con el intento. Si otro proceso lo
+        cambio, el cambio se descarta, se vuelven a leer los datos y se
+        verifica y aplica de nuevo, hasta CONFLICT_RETRIES veces con espera
+        aleatoria creciente entre intentos.
+
+        Si room es None la habitacion se elige con la politica (ver
+        _choose_room) con el mismo candado del hotel con el que se reserva,
+        por lo que otro hilo no puede ocuparla entre la eleccion y la
+        reservacion; en cada intento se vuelve a elegir.
+
+        Regresa una tupla (err de la operacion, err al guardar, habitacion)
+        '''
+        if operation == 'reserve':
+            apply = self._reserve_hotel_rooms
+        else:
+            apply = self._unreserve_hotel_rooms
+        status = OK_STATUS
+        status_persist = OK_STATUS
+
+        entity = self._entity(name)
+        for attempt in range(CONFLICT_RETRIES + 1):
+            with self._entity_lock(entity):
+                self._refresh(name)
+                if name not in self.hotel_dicc:
+                    return HOTEL_NOT_FOUND, OK_STATUS, room
+                self._ensure_loaded(name)
+                with self._hotel_lock(name):
+                    stay_room = room
+                    if stay_room is None:
+                        stay_room = self._choose_room(
+                            name, policy, year, date_day, days
+                        )
+                    if stay_room is None:
+                        status, segments = ROOM_NOT_AVAILABLE, []
+                    else:
+                        status, segments = apply(
+                            name, customer_no, stay_room, year, date_day, days
+                        )
+                records = [
+                    [operation, name, stay_room, seg_year, seg_day, seg_days,
+                     customer_no]
+                    for seg_year, seg_day, seg_days in segments
+                ]
+                status_persist, _ = self._persist(records, 0, entity)
+                if status_persist != VERSION_CONFLICT:
+                    break
+                # Se descarta el cambio; _refresh lee los datos del otro
+                # proceso
+                conflict_ids = {id(record) for record in records}
+                with self._lock:
+                    self._pending = [
+                        record for record in self._pending
+                        if id(record) not in conflict_ids
+                    ]
+                    self.version -= 1
+                self._refresh(name)
+            if attempt < CONFLICT_RETRIES:
+                self._backoff(attempt)
+
+        return status, status_persist, stay_room
+
+    def _choose_room(
+            self,
+            name: str,
+            policy,
+            year: int,
+            date_day: int,
+            days: int) -> int:
+        '''
+        Metodo privado que obtiene las habitaciones libres en la estancia con
+        el indice de rangos reservados y elige una con la politica (ver
+        room_assignment). Se debe llamar con el candado del hotel.
+
+        Regresa la habitacion o None si no hay habitaciones libres o si la
+        politica regresa algo que no es una de las habitaciones libres
+        '''
+        room_index = self.room_index[name]
+        first_day = datetime.date(year, 1, 1).toordinal() + date_day - 1
+        rooms = room_index.free_rooms(first_day, first_day + days)
+        if not rooms:
+            return None
+        room = policy(room_index, list(rooms), first_day, first_day + days)
+        if room not in rooms:
+            return None
+        return room
+
+    def reserve_hotel_room(
+            self,
+            name: str,
+            room: int,
+            customer_no: str,
+            start_month: int,
+            start_day: int,
+            days: int,
+            start_year: int = None) -> tuple[int, None]:
+        '''
+        Metodo publico para reservar una habitacion en un hotel. Si no se
+        indica el anio se usa el presente anio; la estancia puede cruzar el
+        fin de anio.
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+        if start_year is None:
+            start_year = datetime.date.today().year
+
+        status, julian_day = self._validate_reservation_data(
+            room,
+            start_year,
+            start_month,
+            start_day,
+            days
+        )
+
+        if status == OK_STATUS:
+            status, status_persist, _ = self._commit_stay(
+                'reserve',
+                name,
+                customer_no,
+                room,
+                start_year,
+                julian_day,
+                days
+            )
+
+        return int(status + status_persist), None
+
+    def reserve_any_room(
+            self,
+            name: str,
+            customer_no: str,
+            start_month: int,
+            start_day: int,
+            days: int,
+            start_year: int = None,
+            policy=BEST_FIT) -> tuple[int, int]:
+        '''
+        Metodo publico para reservar una habitacion libre de un hotel elegida
+        por el hotel. La eleccion y la reservacion son un solo paso: la
+        habitacion elegida no puede ser ocupada por otra solicitud antes de
+        reservarla.
+
+        La politica es 'first_fit' (la habitacion libre con el numero menor),
+        'best_fit' (la que menos fragmenta los calendarios, por omision) o
+        una función policy(room_index, rooms, start, end) (ver
+        room_assignment).
+
+        Regresa una tupla (err, habitacion reservada o None)
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+        room = None
+        if start_year is None:
+            start_year = datetime.date.today().year
+
+        status, julian_day = self._validate_reservation_data(
+            1,
+            start_year,
+            start_month,
+            start_day,
+            days
+        )
+        if isinstance(policy, str):
+            policy = ROOM_POLICIES.get(policy)
+        if not callable(policy):
+            status = INVALID_FIELD
+
+        if status == OK_STATUS:
+            status, status_persist, room = self._commit_stay(
+                'reserve',
+                name,
+                customer_no,
+                None,
+                start_year,
+                julian_day,
+                days,
+                policy
+            )
+
+        status = int(status + status_persist)
+        return status, room if status == OK_STATUS else None
+
+    def cancel_hotel_reservation(
+            self,
+            name: str,
+            room: int,
+            customer_no: str,
+            start_month: int,
+            start_day: int,
+            days: int,
+            start_year: int = None) -> tuple[int, None]:
+        '''
+        Metodo publico para cancelar la reservarcion de una habitacion en un
+        hotel. Si no se indica el anio se usa el presente anio.
+        '''
+        status = OK_STATUS
+        status_persist = OK_STATUS
+        if start_year is None:
+            start_year = datetime.date.today().year
+
+        status, julian_day = self._validate_reservation_data(
+            room,
+            start_year,
+            start_month,
+            start_day,
+            days
+        )
+
+        if status == OK_STATUS:
+            status, status_persist, _ = self._commit_stay(
+                'cancel',
+                name,
+                customer_no,
+                room,
+                start_year,
+                julian_day,
+                days
+            )
+
+        return int(status + status_persist), None
+
+    def find_available_rooms(
+            self,
+            name: str,
+            start_month: int,
+            start_day: int,
+            days: int,
+            start_year: int = None) -> tuple[int, list]:
+        '''
+        Metodo publico para obtener las habitaciones de un hotel que estan
+        libres durante todo el rango de dias (por omision en el presente
+        anio). La consulta usa el indice de rangos reservados, con costo
+        O(habitaciones * log reservaciones).
+
+        Regresa una tupla (err, lista de numeros de habitacion)
+        '''
+        rooms = []
+        if start_year is None:
+            start_year = datetime.date.today().year
+
+        status, julian_day = self._validate_reservation_data(
+            1,
+            start_year,
+            start_month,
+            start_day,
+            days
+        )
+
+        if status == OK_STATUS:
+            self._refresh(name)
+            if name in self.hotel_dicc:
+                self._ensure_loaded(name)
+            with self._hotel_lock(name):
+                room_index = self.room_index.get(name)
+                if name in self.hotel_dicc and room_index is not None:
+                    first_day = datetime.date(start_year, 1, 1).toordinal()
+                    first_day += julian_day - 1
+                    rooms = room_index.free_rooms(first_day, first_day + days)
+                else:
+                    status = HOTEL_NOT_FOUND
+
+        return int(status), rooms
+
+    def list_customer_reservations(self, customer_no: str) -> tuple[int, list]:
+        '''
+        Metodo publico para obtener las reservaciones de un cliente desde el
+        indice inverso, sin recorrer los calendarios.
+
+        Regresa una tupla (err, lista de diccionarios con hotel, room, year,
+        start_month, start_day y days)
+        '''
+        reservations = []
+        entities = sorted(self.index_shards) if self.shards else [HOTEL_ENTITY]
+        with contextlib.ExitStack() as stack:
+            for entity in entities:
+                stack.enter_context(self._entity_lock(entity))
+            self._refresh()
+            if self.lazy:
+                self._load_index_shards()
+            entries = self.customer_index.lookup(customer_no)
+        for name, room, year, date_day, days in entries:
+            start_date = datetime.date(year, 1, 1) + datetime.timedelta(
+                days=date_day - 1
+            )
+            reservations.append({
+                'hotel': name,
+                'room': room,
+                'year': year,
+                'start_month': start_date.month,
+                'start_day': start_date.day,
+                'days': days
+            })
+
+        return OK_STATUS, reservations
+
+    def occupancy_snapshot(self, name: str, year: int) -> tuple[int, dict]:
+        '''
+        Metodo publico para obtener una copia de la ocupacion de un hotel en
+        un anio, para calcular reportes sin tomar el candado del hotel:
+        - rooms (numero de cuartos)
+        - occupied (bytes, DAYS_PER_YEAR por cuarto, 1 ocupado y 0 libre)
+        - bookings (lista de [cuarto, dia inicial base 0, dias, cliente])
+
+        Regresa una tupla (err, diccionario)
+        '''
+        status = OK_STATUS
+        snapshot = {}
+
+        self._refresh(name)
+        if name in self.hotel_dicc:
+            self._ensure_loaded(name)
+        with self._hotel_lock(name):
+            hotel_data = self.hotel_dicc.get(name)
+            if hotel_data is not None:
+                calendars = hotel_data.years.get(str(year), [])
+                snapshot['rooms'] = hotel_data.rooms
+                snapshot['occupied'] = (
+                    b''.join(calendar.occupied for calendar in calendars)
+                    or bytes(hotel_data.rooms * DAYS_PER_YEAR)
+                )
+                snapshot['bookings'] = [
+                    [room, start, booking[0], booking[1]]
+                    for room, calendar in enumerate(calendars, 1)
+                    for start, booking in calendar.bookings.items()
+                ]
+            else:
+                status = HOTEL_NOT_FOUND
+
+        return status, snapshot
+
+    def begin_batch(self):
+        '''
+        Metodo publico para iniciar un lote de cambios. Los cambios siguientes
+        del mismo hilo se aplican en memoria y no se guardan hasta llamar
+        commit_batch. Un lote iniciado dentro de otro se guarda al confirmar
+        el lote exterior.
+        '''
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._batches[thread_id] = self._batches.get(thread_id, 0) + 1
+            self._batch_records.setdefault(thread_id, [])
+
+    def commit_batch(self) -> tuple[int, None]:
+        '''
+        Metodo publico para terminar el lote de cambios y guardarlo con una
+        sola escritura (un solo registro en el diario en modo con diario).
+        Si la escritura falla (error o VERSION_CONFLICT) los cambios del lote
+        se descartan y sus archivos se vuelven a leer, por lo que no quedan
+        en memoria ni se guardan despues.
+
+        Regresa una tupla (err, None o reservaciones descartadas, ver flush)
+        '''
+        thread_id = threading.get_ident()
+        with self._lock:
+            depth = self._batches.pop(thread_id, 1) - 1
+            if depth:
+                self._batches[thread_id] = depth
+                return OK_STATUS, None
+            records = self._batch_records.pop(thread_id, [])
+
+        status, dropped = self.flush()
+        if status not in (OK_STATUS, ROOM_NOT_AVAILABLE):
+            self._discard(records)
+        return status, dropped
+
+    def _discard(self, records: list):
+        '''
+        Metodo privado que quita de los pendientes los registros indicados
+        (si no se guardaron) y vuelve a leer los archivos (o shards) de sus
+        hoteles, con lo que los cambios se deshacen en memoria. Los demas
+        registros pendientes de esos archivos se aplican de nuevo.
+        '''
+        with self._lock:
+            record_ids = {id(record) for record in records}
+            self._pending = [
+                record for record in self._pending
+                if id(record) not in record_ids
+            ]
+            entities = sorted({self._entity(record[1]) for record in records})
+        for entity in entities:
+            with self._entity_lock(entity):
+                self._reload(entity)
@@ -0,0 +1,74 @@
+'''
+Codigo fuente de la clase HotelRecord, registro compacto (con __slots__) de
+un hotel en memoria. Los archivos guardan el hotel como diccionario; la
+conversion se hace al leer (ver Hotel._decode) y al escribir (Hotel._encode).
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+18-10-2026      Lectura como diccionario del archivo        A00260430
+'''
+
+
+class HotelRecord():
+    '''
+    Clase HotelRecord. Campos
+    - address (direccion)
+    - rooms (numero de cuartos)
+    - years (anio como texto con la lista de RoomCalendar, uno por cuarto)
+
+    El registro tambien se puede leer (no modificar) con las llaves del
+    diccionario del archivo: registro['address'], registro['rooms'],
+    registro[anio] y anio in registro.
+
+    Metodos publicos
+    + from_dict - crea el registro desde el diccionario del archivo
+    + to_dict - regresa los datos generales como diccionario
+    '''
+    __slots__ = ('address', 'rooms', 'years')
+
+    def __init__(self, address: str, rooms: int, years: dict = None):
+        self.address = address
+        self.rooms = rooms
+        self.years = years if years is not None else {}
+
+    def __eq__(self, other):
+        if not isinstance(other, HotelRecord):
+            return NotImplemented
+        return (self.address, self.rooms, self.years) == (
+            other.address, other.rooms, other.years
+        )
+
+    def __getitem__(self, key: str):
+        if key == 'address':
+            return self.address
+        if key == 'rooms':
+            return self.rooms
+        return self.years[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in ('address', 'rooms') or key in self.years
+
+    def __repr__(self):
+        return f'HotelRecord({self.address!r}, {self.rooms!r})'
+
+    @classmethod
+    def from_dict(cls, hotel_data: dict):
+        '''
+        Crea el registro desde el diccionario {'address', 'rooms', anio: ...}
+        del archivo; los anios se copian sin convertir.
+        '''
+        return cls(
+            hotel_data['address'],
+            hotel_data['rooms'],
+            {
+                year: year_data for year, year_data in hotel_data.items()
+                if year not in ('address', 'rooms')
+            }
+        )
+
+    def to_dict(self) -> dict:
+        '''
+        Regresa los datos generales {'address', 'rooms'} del hotel.
+        '''
+        return {'address': self.address, 'rooms': self.rooms}
@@ -0,0 +1,97 @@
+'''
+Codigo fuente de la clase IntervalIndex. Esta clase guarda, por habitacion,
+los rangos de dias reservados de un hotel en listas ordenadas para contestar
+consultas de disponibilidad con busqueda binaria.
+
+Los dias se indican como ordinales de fecha (datetime.date.toordinal), por lo
+que los rangos no dependen del anio.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+18-10-2026      Rango libre alrededor de una estancia       A00260430
+'''
+from bisect import bisect_left, bisect_right
+
+
+class IntervalIndex():
+    '''
+    Clase IntervalIndex. Por cada habitacion se guardan dos listas paralelas y
+    ordenadas con el inicio y el fin (exclusivo) de los rangos reservados. Los
+    rangos de una habitacion nunca se traslapan.
+
+    Metodos publicos
+    + add - agrega un rango reservado a una habitacion
+    + remove - quita un rango (o parte de el) de una habitacion
+    + is_free - verifica que una habitacion este libre en un rango
+    + free_rooms - obtiene las habitaciones libres en un rango
+    + free_gap - obtiene el rango libre que contiene a un rango
+    '''
+
+    def __init__(self, rooms: int):
+        self.starts = [[] for _ in range(rooms)]
+        self.ends = [[] for _ in range(rooms)]
+
+    def add(self, room: int, start: int, end: int):
+        '''
+        Agrega el rango [start, end) a la habitacion (base 1).
+        '''
+        position = bisect_left(self.starts[room - 1], start)
+        self.starts[room - 1].insert(position, start)
+        self.ends[room - 1].insert(position, end)
+
+    def remove(self, room: int, start: int, end: int):
+        '''
+        Quita el rango [start, end) de la habitacion (base 1). Los rangos que
+        solo se traslapan en parte se recortan.
+        '''
+        starts = self.starts[room - 1]
+        ends = self.ends[room - 1]
+        position = bisect_right(ends, start)
+        pieces = []
+        while position < len(starts) and starts[position] < end:
+            if starts[position] < start:
+                pieces.append((starts[position], start))
+            if ends[position] > end:
+                pieces.append((end, ends[position]))
+            del starts[position]
+            del ends[position]
+        for piece_start, piece_end in pieces:
+            self.add(room, piece_start, piece_end)
+
+    def is_free(self, room: int, start: int, end: int) -> bool:
+        '''
+        Regresa verdadero si la habitacion (base 1) no tiene reservaciones en
+        el rango [start, end).
+        '''
+        position = bisect_right(self.ends[room - 1], start)
+        return (
+            position == len(self.starts[room - 1])
+            or self.starts[room - 1][position] >= end
+        )
+
+    def free_rooms(self, start: int, end: int) -> list[int]:
+        '''
+        Regresa la lista de habitaciones (base 1) libres en el rango
+        [start, end).
+        '''
+        return [
+            room for room in range(1, len(self.starts) + 1)
+            if self.is_free(room, start, end)
+        ]
+
+    def free_gap(self, room: int, start: int, end: int) -> tuple:
+        '''
+        Regresa el rango libre (gap_start, gap_end) de la habitacion (base 1)
+        que contiene a [start, end): el fin de la reservacion anterior y el
+        inicio de la siguiente, o None del lado sin reservaciones. Regresa
+        None si la habitacion no esta libre en el rango.
+        '''
+        if not self.is_free(room, start, end):
+            return None
+        starts = self.starts[room - 1]
+        ends = self.ends[room - 1]
+        position = bisect_right(ends, start)
+        gap_start = ends[position - 1] if position > 0 else None
+        gap_end = starts[position] if position < len(starts) else None
+        return gap_start, gap_end
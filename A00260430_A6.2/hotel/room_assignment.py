@@ -0,0 +1,73 @@
+'''
+Codigo fuente de las politicas de asignacion de habitacion usadas por
+Hotel.reserve_any_room.
+
+Una politica es una función policy(room_index, rooms, start, end) que recibe
+el IntervalIndex del hotel, la lista de habitaciones libres (no vacia) y el
+rango [start, end) en ordinales de fecha, y regresa la habitacion elegida (o
+None si ninguna le sirve).
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+from .interval_index import IntervalIndex
+
+
+FIRST_FIT = 'first_fit'
+BEST_FIT = 'best_fit'
+
+
+def first_fit(
+        room_index: IntervalIndex,
+        rooms: list,
+        start: int,
+        end: int) -> int:
+    '''
+    Política first fit: la habitacion libre con el numero menor (rooms
+    viene ordenada); no necesita consultar el indice.
+    '''
+    return rooms[0]
+
+
+def _fragmentation(room_index: IntervalIndex, room: int, start: int, end: int):
+    '''
+    Función privada que califica cuanto fragmenta el calendario reservar
+    [start, end) en la habitacion. Los dias libres que quedan antes y despues
+    de la estancia y hasta otra reservacion son un hueco; la llave es
+    (huecos nuevos, dias en huecos, lados sin reservaciones, habitacion).
+    '''
+    gap_start, gap_end = room_index.free_gap(room, start, end)
+    holes = [
+        left for left in (
+            None if gap_start is None else start - gap_start,
+            None if gap_end is None else gap_end - end
+        )
+        if left is not None
+    ]
+    return (
+        sum(1 for left in holes if left > 0),
+        sum(holes),
+        2 - len(holes),
+        room
+    )
+
+
+def best_fit(
+        room_index: IntervalIndex,
+        rooms: list,
+        start: int,
+        end: int) -> int:
+    '''
+    Política best fit: la habitacion donde la estancia deja menos huecos
+    entre reservaciones; con los mismos huecos, la de huecos mas chicos y
+    luego la que ya tiene reservaciones junto a la estancia, de modo que las
+    habitaciones vacias y los rangos largos quedan para estancias largas.
+    '''
+    return min(rooms, key=lambda room: _fragmentation(room_index, room, start, end))
+
+
+ROOM_POLICIES = {
+    FIRST_FIT: first_fit,
+    BEST_FIT: best_fit
+}
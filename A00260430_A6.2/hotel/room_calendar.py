@@ -0,0 +1,140 @@
+'''
+Codigo fuente de la clase RoomCalendar. Esta clase representa la ocupacion
+de una habitacion durante un anio.
+
+La ocupacion se guarda en un bytearray de 366 posiciones (1 ocupado, 0 libre)
+y los numeros de cliente en un diccionario disperso con los rangos reservados,
+en lugar de una lista de 366 tuplas (ocupado, cliente).
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+DAYS_PER_YEAR = 366
+FREE = b'\x00'
+OCCUPIED = b'\x01'
+
+
+class RoomCalendar():
+    '''
+    Clase RoomCalendar. Los dias se indican en base 0 (dia juliano - 1).
+
+    - occupied (bytearray con un byte por dia)
+    - bookings (diccionario {dia inicial: [dias, numero de cliente]})
+
+    Metodos publicos
+    + is_free - verifica que un rango de dias este libre
+    + is_booked_by - verifica que un rango de dias este reservado por un cliente
+    + book - reserva un rango de dias para un cliente
+    + release - libera un rango de dias
+    + customer_at - obtiene el numero de cliente de un dia
+    + encode - convierte el calendario al formato del archivo JSON
+    + decode - crea un calendario a partir del formato del archivo JSON
+    '''
+    __slots__ = ('occupied', 'bookings')
+
+    def __init__(self):
+        self.occupied = bytearray(DAYS_PER_YEAR)
+        self.bookings = {}
+
+    def _overlapping(self, start: int, end: int) -> list:
+        '''
+        Metodo privado que regresa los rangos reservados que se traslapan con
+        [start, end), ordenados por dia inicial.
+        '''
+        return sorted(
+            (day, booking[0], booking[1])
+            for day, booking in self.bookings.items()
+            if day < end and day + booking[0] > start
+        )
+
+    def is_free(self, start: int, days: int) -> bool:
+        '''
+        Regresa verdadero si ningun dia del rango esta ocupado.
+        '''
+        return OCCUPIED not in self.occupied[start:start + days]
+
+    def is_booked_by(self, start: int, days: int, customer_no: str) -> bool:
+        '''
+        Regresa verdadero si todos los dias del rango estan reservados por el
+        cliente.
+        '''
+        if FREE in self.occupied[start:start + days]:
+            return False
+        return all(
+            booking[2] == customer_no
+            for booking in self._overlapping(start, start + days)
+        )
+
+    def book(self, start: int, days: int, customer_no: str):
+        '''
+        Reserva el rango de dias para el cliente. No verifica disponibilidad.
+        '''
+        self.occupied[start:start + days] = OCCUPIED * days
+        self.bookings[start] = [days, customer_no]
+
+    def release(self, start: int, days: int):
+        '''
+        Libera el rango de dias. Los rangos reservados que solo se traslapan
+        en parte se recortan.
+
+        Regresa la lista de partes liberadas [dia inicial, dias, cliente].
+        '''
+        end = start + days
+        released = []
+        for day, length, customer_no in self._overlapping(start, end):
+            del self.bookings[day]
+            if day < start:
+                self.bookings[day] = [start - day, customer_no]
+            if day + length > end:
+                self.bookings[end] = [day + length - end, customer_no]
+            released_start = max(day, start)
+            released.append([
+                released_start,
+                min(day + length, end) - released_start,
+                customer_no
+            ])
+        self.occupied[start:end] = FREE * days
+        return released
+
+    def customer_at(self, day: int) -> str:
+        '''
+        Regresa el numero de cliente que ocupa el dia o '' si esta libre.
+        '''
+        for start, booking in self.bookings.items():
+            if start <= day < start + booking[0]:
+                return booking[1]
+        return ''
+
+    def encode(self) -> list:
+        '''
+        Regresa la lista de rangos reservados [dia inicial, dias, cliente].
+        La ocupacion se reconstruye a partir de los rangos.
+        '''
+        return [
+            [day, booking[0], booking[1]]
+            for day, booking in sorted(self.bookings.items())
+        ]
+
+    @classmethod
+    def decode(cls, data: list):
+        '''
+        Crea un calendario a partir de la lista de rangos reservados. Tambien
+        acepta el formato anterior de 366 pares [ocupado, cliente].
+        '''
+        calendar = cls()
+        if len(data) == DAYS_PER_YEAR and data and len(data[0]) == 2:
+            day = 0
+            while day < DAYS_PER_YEAR:
+                if not data[day][0]:
+                    day += 1
+                    continue
+                start = day
+                while (day < DAYS_PER_YEAR and data[day][0]
+                       and data[day][1] == data[start][1]):
+                    day += 1
+                calendar.book(start, day - start, data[start][1])
+        else:
+            for start, days, customer_no in data:
+                calendar.book(start, days, customer_no)
+        return calendar
@@ -1,6 +1,37 @@
-'''
-Inicializando modulo.
-'''
-from .persistence import create_data_store
-from .persistence import update_data_store
-from .persistence import load_data_store
+'''
+Inicializando modulo.
+'''
+from .persistence import create_data_store
+from .persistence import update_data_store
+from .persistence import load_data_store
+from .persistence import append_journal
+from .persistence import checkpoint_data_store
+from .persistence import JOURNAL_MAX_BYTES
+from .persistence import shard_entity
+from .persistence import shard_entities
+from .persistence import convert_data_store
+from .persistence import JSON_FORMAT
+from .persistence import BINARY_FORMAT
+from .persistence import COLUMNAR_FORMAT
+from .persistence import set_fsync_policy
+from .persistence import FSYNC_NONE
+from .persistence import FSYNC_COMMIT
+from .persistence import FSYNC_GROUP
+from .persistence import read_lock
+from .persistence import SharedFileLock
+from .persistence import data_store_stamp
+from .persistence import commit_data_store
+from .persistence import VERSION_CONFLICT
+from .binary_snapshot import BinarySnapshot
+from .columnar_snapshot import COLUMNS_MARKER
+from .columnar_snapshot import COLUMNS_VERSION
+from .columnar_snapshot import is_columns
+from .columnar_snapshot import encode_column
+from .store import FileStore
+from .store import set_default_store
+from .store import get_default_store
+from .sqlite_store import SQLiteStore
+from .memory_store import MemoryStore
+from .async_io import EXECUTOR_WORKERS
+from .async_io import new_executor
+from .async_io import run_blocking
\ No newline at end of file
@@ -0,0 +1,42 @@
+'''
+Modulo con las funciones para ejecutar la persistencia fuera del ciclo de
+eventos de asyncio.
+
+Las clases asincronas (AsyncHotel, AsyncCustomer y AsyncReservation) llaman
+a los metodos sincronos en un executor con varios hilos. La espera de los
+candados de archivo y la lectura y escritura de archivos ocurren en esos
+hilos, por lo que el ciclo de eventos sigue atendiendo otras solicitudes.
+Hotel y Customer se pueden usar desde varios hilos (toman sus propios
+candados), asi que las llamadas sobre hoteles o archivos distintos corren
+en paralelo. Quien llama tambien puede pasar su propio executor.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+18-10-2026      Executor con varios hilos                   A00260430
+'''
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+EXECUTOR_WORKERS = 8
+
+
+def new_executor(
+        name: str = 'persistence',
+        workers: int = EXECUTOR_WORKERS) -> ThreadPoolExecutor:
+    '''
+    Función que crea un executor dedicado con workers hilos.
+    '''
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+
+
+async def run_blocking(executor, function, *args, **kwargs):
+    '''
+    Función que ejecuta function(*args, **kwargs) en el executor y espera su
+    resultado sin bloquear el ciclo de eventos.
+    '''
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, functools.partial(function, *args, **kwargs)
+    )
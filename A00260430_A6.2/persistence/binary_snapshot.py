@@ -0,0 +1,262 @@
+'''
+Modulo con el formato binario de snapshots de hoteles, alternativo a JSON.
+
+El formato guarda el mismo diccionario que hotel.json
+{hotel: {'address', 'rooms', anio: {cuarto: [[dia inicial, dias, cliente]]}}}
+como un encabezado de tamaño fijo seguido de tablas de registros de tamaño
+fijo y de la ocupacion de cada cuarto empacada en bits (46 bytes por cuarto y
+anio). Con BinarySnapshot el archivo se abre con mmap y la ocupacion de un
+cuarto se lee directamente de su posicion, sin leer ni convertir el resto.
+load_data_store y Hotel(fmt='binary') usan decode_snapshot, que convierte el
+archivo completo; solo BinarySnapshot evita la conversion.
+
+Estructura (little endian)
+- encabezado: magic, version, hoteles, clientes, posicion tabla de clientes
+- directorio: un registro por hotel (nombre, direccion, cuartos, anios)
+- anios: un registro por hotel y anio (anio, reservaciones, posiciones)
+- ocupacion: por hotel y anio, 46 bytes por cuarto (bit = dia ocupado)
+- reservaciones: un registro por rango (cuarto, dia inicial, dias, cliente)
+- clientes: posicion y longitud de cada numero de cliente
+- textos: nombres, direcciones y numeros de cliente en UTF-8
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import mmap
+import struct
+
+MAGIC = b'HOTB'
+VERSION = 1
+DAYS_PER_YEAR = 366
+ROOM_BYTES = (DAYS_PER_YEAR + 7) // 8
+HEADER = struct.Struct('<4sHHIIQ')
+HOTEL = struct.Struct('<QIQIIIQ')
+YEAR = struct.Struct('<IIQQ')
+BOOKING = struct.Struct('<IHHI')
+STRING = struct.Struct('<QI')
+
+
+def encode_snapshot(data: dict) -> bytes:
+    '''
+    Función que convierte el diccionario de hoteles (formato de hotel.json)
+    al formato binario.
+    '''
+    hotels = []
+    customers = {}
+    for name, hotel_data in data.items():
+        years = []
+        for year, year_data in hotel_data.items():
+            if year in ('address', 'rooms'):
+                continue
+            bookings = []
+            if isinstance(year_data, list):
+                year_data = _legacy_ranges(year_data)
+            for room, room_data in year_data.items():
+                for start, days, customer_no in room_data:
+                    customer_id = customers.setdefault(customer_no, len(customers))
+                    bookings.append((int(room), start, days, customer_id))
+            years.append((int(year), sorted(bookings)))
+        hotels.append((name, hotel_data, sorted(years)))
+
+    # Posiciones de cada seccion
+    years_pos = HEADER.size + HOTEL.size * len(hotels)
+    occupancy_pos = years_pos + YEAR.size * sum(len(h[2]) for h in hotels)
+    bookings_pos = occupancy_pos + ROOM_BYTES * sum(
+        h[1]['rooms'] * len(h[2]) for h in hotels
+    )
+    customers_pos = bookings_pos + BOOKING.size * sum(
+        len(year[1]) for h in hotels for year in h[2]
+    )
+    strings_pos = customers_pos + STRING.size * len(customers)
+
+    directory = bytearray()
+    year_table = bytearray()
+    occupancy = bytearray()
+    booking_table = bytearray()
+    strings = bytearray()
+
+    def add_string(value: str) -> tuple[int, int]:
+        encoded = value.encode('UTF-8')
+        position = strings_pos + len(strings)
+        strings.extend(encoded)
+        return position, len(encoded)
+
+    for name, hotel_data, years in hotels:
+        name_pos, name_len = add_string(name)
+        address_pos, address_len = add_string(hotel_data['address'])
+        directory.extend(HOTEL.pack(
+            name_pos, name_len, address_pos, address_len, hotel_data['rooms'],
+            len(years), years_pos + len(year_table)
+        ))
+        for year, bookings in years:
+            year_table.extend(YEAR.pack(
+                year, len(bookings), occupancy_pos + len(occupancy),
+                bookings_pos + len(booking_table)
+            ))
+            bits = [0] * hotel_data['rooms']
+            for room, start, days, customer_id in bookings:
+                bits[room - 1] |= ((1 << days) - 1) << start
+                booking_table.extend(BOOKING.pack(room, start, days, customer_id))
+            for room_bits in bits:
+                occupancy.extend(room_bits.to_bytes(ROOM_BYTES, 'little'))
+
+    customer_table = bytearray()
+    for customer_no in customers:
+        customer_table.extend(STRING.pack(*add_string(customer_no)))
+
+    return b''.join((
+        HEADER.pack(MAGIC, VERSION, 0, len(hotels), len(customers), customers_pos),
+        directory, year_table, occupancy, booking_table, customer_table, strings
+    ))
+
+
+def _legacy_ranges(year_data: list) -> dict:
+    '''
+    Función privada que convierte un anio en el formato anterior de
+    hotel.json (366 pares [ocupado, cliente] por cuarto) a rangos.
+    '''
+    ranges = {}
+    for room, room_data in enumerate(year_data, start=1):
+        for day, (occupied, customer_no) in enumerate(room_data):
+            if not occupied:
+                continue
+            room_ranges = ranges.setdefault(str(room), [])
+            if (room_ranges and room_ranges[-1][2] == customer_no
+                    and sum(room_ranges[-1][:2]) == day):
+                room_ranges[-1][1] += 1
+            else:
+                room_ranges.append([day, 1, customer_no])
+    return ranges
+
+
+def decode_snapshot(raw) -> dict:
+    '''
+    Función que convierte un snapshot binario al diccionario de hoteles
+    (formato de hotel.json). Un archivo vacio es un diccionario vacio.
+    '''
+    data = {}
+    if not raw:
+        return data
+
+    magic, version, _, hotel_count, customer_count, customers_pos = \
+        HEADER.unpack_from(raw, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Invalid binary snapshot')
+
+    customers = []
+    for customer in range(customer_count):
+        position, length = STRING.unpack_from(
+            raw, customers_pos + customer * STRING.size
+        )
+        customers.append(bytes(raw[position:position + length]).decode('UTF-8'))
+
+    for hotel in range(hotel_count):
+        (name_pos, name_len, address_pos, address_len, rooms, year_count,
+         years_pos) = HOTEL.unpack_from(raw, HEADER.size + hotel * HOTEL.size)
+        name = bytes(raw[name_pos:name_pos + name_len]).decode('UTF-8')
+        hotel_data = {
+            'address': bytes(
+                raw[address_pos:address_pos + address_len]
+            ).decode('UTF-8'),
+            'rooms': rooms
+        }
+        for year_no in range(year_count):
+            year, booking_count, _, bookings_pos = YEAR.unpack_from(
+                raw, years_pos + year_no * YEAR.size
+            )
+            year_data = {}
+            for room, start, days, customer_id in BOOKING.iter_unpack(
+                    raw[bookings_pos:bookings_pos + booking_count * BOOKING.size]):
+                year_data.setdefault(str(room), []).append(
+                    [start, days, customers[customer_id]]
+                )
+            hotel_data[str(year)] = year_data
+        data[name] = hotel_data
+
+    return data
+
+
+class BinarySnapshot():
+    '''
+    Clase BinarySnapshot. Abre un snapshot binario con mmap para consultar la
+    ocupacion de un cuarto sin leer el archivo completo. Al abrirlo solo se
+    lee el directorio de hoteles; cada consulta lee los bytes del cuarto.
+
+    Metodos publicos
+    + hotel_info - obtiene la direccion y cuartos de un hotel
+    + room_occupancy - obtiene los bits de ocupacion de un cuarto en un anio
+    + is_free - verifica que un cuarto este libre en un rango de dias
+    + close - cierra el archivo
+    '''
+
+    def __init__(self, file_name: str):
+        with open(file_name, 'rb') as fd:
+            self.buffer = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        _, _, _, hotel_count, _, _ = HEADER.unpack_from(self.buffer, 0)
+        self.directory = {}
+        for hotel in range(hotel_count):
+            entry = HOTEL.unpack_from(self.buffer, HEADER.size + hotel * HOTEL.size)
+            name = self.buffer[entry[0]:entry[0] + entry[1]].decode('UTF-8')
+            self.directory[name] = entry
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        '''
+        Cierra el mmap del archivo.
+        '''
+        self.buffer.close()
+
+    def hotel_info(self, name: str) -> dict:
+        '''
+        Regresa un diccionario con address y rooms del hotel o None.
+        '''
+        if name not in self.directory:
+            return None
+        _, _, address_pos, address_len, rooms, _, _ = self.directory[name]
+        return {
+            'address': self.buffer[
+                address_pos:address_pos + address_len
+            ].decode('UTF-8'),
+            'rooms': rooms
+        }
+
+    def room_occupancy(self, name: str, year: int, room: int) -> int:
+        '''
+        Regresa la ocupacion del cuarto (base 1) en el anio como un entero
+        donde el bit n indica si el dia n (base 0) esta ocupado.
+        '''
+        if name not in self.directory:
+            return 0
+        _, _, _, _, rooms, year_count, years_pos = self.directory[name]
+        if room < 1 or room > rooms:
+            return 0
+        for year_no in range(year_count):
+            entry_year, _, occupancy_pos, _ = YEAR.unpack_from(
+                self.buffer, years_pos + year_no * YEAR.size
+            )
+            if entry_year == year:
+                position = occupancy_pos + (room - 1) * ROOM_BYTES
+                return int.from_bytes(
+                    self.buffer[position:position + ROOM_BYTES], 'little'
+                )
+        return 0
+
+    def is_free(
+            self,
+            name: str,
+            year: int,
+            room: int,
+            start: int,
+            days: int) -> bool:
+        '''
+        Regresa verdadero si el cuarto no tiene dias ocupados en el rango
+        [start, start + days) del anio (dias en base 0).
+        '''
+        mask = ((1 << days) - 1) << start
+        return not self.room_occupancy(name, year, room) & mask
@@ -0,0 +1,142 @@
+'''
+Modulo con el formato columnar de snapshots de clientes, alternativo a JSON.
+
+En lugar de un diccionario por cliente el snapshot guarda una columna por
+campo. names y surname se guardan codificados con diccionario (la lista de
+valores distintos y un arreglo con el codigo de cada renglon) y year_dob como
+arreglo de enteros; el archivo se lee con una sola lectura y los arreglos se
+copian en bloque, sin convertir cliente por cliente.
+
+El estado en columnas es un diccionario
+{COLUMNS_MARKER: COLUMNS_VERSION, 'keys': [...], 'names': [valores],
+ 'names_codes': array, 'surname': [valores], 'surname_codes': array,
+ 'id_doc_no': [...], 'phone_no': [...], 'year_dob': array}
+
+Estructura del archivo (little endian)
+- encabezado: magic, version, renglones
+- secciones en el orden de SECTIONS, cada una con su longitud en bytes:
+  textos en UTF-8 separados por NUL o arreglos de enteros de 32 bits
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import struct
+import sys
+from array import array
+
+MAGIC = b'CUSC'
+COLUMNS_VERSION = 1
+COLUMNS_MARKER = '#columns'
+HEADER = struct.Struct('<4sHI')
+LENGTH = struct.Struct('<Q')
+# Seccion y tipo: lista de textos o arreglo de enteros (codigo de array)
+SECTIONS = (
+    ('keys', None),
+    ('names', None),
+    ('names_codes', 'I'),
+    ('surname', None),
+    ('surname_codes', 'I'),
+    ('id_doc_no', None),
+    ('phone_no', None),
+    ('year_dob', 'i')
+)
+SEPARATOR = '\x00'
+
+
+def is_columns(data) -> bool:
+    '''
+    Función que indica si data es el estado en columnas (y no el
+    diccionario de clientes de customer.json).
+    '''
+    return isinstance(data, dict) and COLUMNS_MARKER in data
+
+
+def encode_column(values) -> tuple[list, array]:
+    '''
+    Función que codifica una columna de textos con diccionario.
+
+    Regresa una tupla (valores distintos, arreglo de codigos)
+    '''
+    codes = {}
+    column = array('I', [codes.setdefault(value, len(codes)) for value in values])
+    return list(codes), column
+
+
+def columns_from_customers(customers: dict) -> dict:
+    '''
+    Función que convierte el diccionario de clientes de customer.json al
+    estado en columnas.
+    '''
+    rows = list(customers.values())
+    names, names_codes = encode_column(row['names'] for row in rows)
+    surname, surname_codes = encode_column(row['surname'] for row in rows)
+    return {
+        COLUMNS_MARKER: COLUMNS_VERSION,
+        'keys': list(customers),
+        'names': names,
+        'names_codes': names_codes,
+        'surname': surname,
+        'surname_codes': surname_codes,
+        'id_doc_no': [row['id_doc_no'] for row in rows],
+        'phone_no': [row['phone_no'] for row in rows],
+        'year_dob': array('i', [row['year_dob'] for row in rows])
+    }
+
+
+def encode_columns(data: dict) -> bytes:
+    '''
+    Función que convierte el estado en columnas (o el diccionario de
+    clientes, por ejemplo al convertir customer.json) al formato del
+    archivo.
+    '''
+    if not is_columns(data):
+        data = columns_from_customers(data)
+
+    parts = [HEADER.pack(MAGIC, COLUMNS_VERSION, len(data['keys']))]
+    for section, typecode in SECTIONS:
+        if typecode is None:
+            payload = SEPARATOR.join(data[section]).encode('UTF-8')
+        else:
+            column = array(typecode, data[section])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            payload = column.tobytes()
+        parts.append(LENGTH.pack(len(payload)))
+        parts.append(payload)
+
+    return b''.join(parts)
+
+
+def decode_columns(raw: bytes) -> dict:
+    '''
+    Función que convierte el contenido del archivo al estado en columnas.
+    Un archivo vacio es un diccionario de clientes vacio.
+    '''
+    if not raw:
+        return {}
+
+    magic, version, rows = HEADER.unpack_from(raw)
+    if magic != MAGIC or version != COLUMNS_VERSION:
+        raise ValueError('invalid columnar snapshot')
+
+    data = {COLUMNS_MARKER: COLUMNS_VERSION}
+    position = HEADER.size
+    view = memoryview(raw)
+    for section, typecode in SECTIONS:
+        (length,) = LENGTH.unpack_from(raw, position)
+        position += LENGTH.size
+        payload = view[position:position + length]
+        position += length
+        if typecode is None:
+            text = bytes(payload).decode('UTF-8')
+            # Sin renglones todas las listas estan vacias
+            data[section] = text.split(SEPARATOR) if rows else []
+        else:
+            column = array(typecode)
+            column.frombytes(payload)
+            if sys.byteorder == 'big':
+                column.byteswap()
+            data[section] = column
+
+    return data
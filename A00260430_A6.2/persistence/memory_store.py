@@ -0,0 +1,158 @@
+'''
+Modulo con el almacenamiento en memoria, alternativo a los archivos JSON.
+
+MemoryStore cumple la misma interfaz que FileStore (ver store) pero guarda
+cada entidad en diccionarios del proceso, sin archivos ni candados de
+archivo. Sirve para pruebas y para medir los algoritmos de reservacion sin
+medir el disco. Dos instancias de Hotel o Customer con el mismo MemoryStore
+se comportan como dos procesos con los mismos archivos.
+
+Los datos se guardan serializados con pickle (mas rapido que JSON) y se
+leen como una copia nueva, de modo que ninguna instancia ve los cambios en
+memoria de otra.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import pickle
+import threading
+
+OK_STATUS = 0
+VERSION_CONFLICT = -8
+JOURNAL_MAX_BLOCKS = 10000
+
+
+class MemoryStore():
+    '''
+    Clase MemoryStore. Guarda por entidad un snapshot, sus registros delta
+    (un bloque serializado por escritura) y un contador de escrituras.
+
+    El sello de version es (contador, bloques en el diario).
+    '''
+    journaled = False
+    shardable = True
+
+    def __init__(self):
+        self.snapshots = {}
+        self.journals = {}
+        self.versions = {}
+        self.lock = threading.Lock()
+
+    def _stamp(self, entity_name) -> tuple:
+        '''
+        Metodo privado que regresa el sello de version de la entidad.
+        '''
+        return (
+            self.versions.get(entity_name, 0),
+            len(self.journals.get(entity_name, ()))
+        )
+
+    def load(self, entity_name, rebuild=None, fmt=None) -> tuple[int, dict]:
+        '''
+        Lee una entidad; una entidad que no existe es un diccionario vacio.
+        Si se recibe rebuild el estado se reconstruye con
+        rebuild(datos, registros).
+
+        Regresa una tupla (err, diccionario)
+        '''
+        with self.lock:
+            snapshot = self.snapshots.get(entity_name)
+            blocks = list(self.journals.get(entity_name, ()))
+        data = pickle.loads(snapshot) if snapshot is not None else {}
+        records = [record for block in blocks for record in pickle.loads(block)]
+
+        if rebuild is not None:
+            data = rebuild(data, records)
+
+        return OK_STATUS, data
+
+    def update(self, entity_name, data, fmt=None) -> tuple[int, None]:
+        '''
+        Reemplaza el estado completo de una entidad.
+        '''
+        status, _ = self.commit(entity_name, None, data=data)
+        return status, None
+
+    def append(self, entity_name, records) -> tuple[int, int]:
+        '''
+        Agrega registros delta de una entidad.
+
+        Regresa una tupla (err, bloques en el diario)
+        '''
+        status, stamp = self.commit(entity_name, None, records=records)
+        return status, stamp[1]
+
+    def commit(
+            self,
+            entity_name,
+            expected_stamp,
+            data=None,
+            records=None,
+            fmt=None,
+            extra=None) -> tuple[int, tuple]:
+        '''
+        Escribe el estado completo (data) o los registros delta (records) de
+        una entidad, y los estados de extra, solo si el sello de version es
+        expected_stamp (o si es None). Un estado completo descarta el diario.
+
+        Regresa una tupla (err, sello de version despues de escribir)
+        '''
+        with self.lock:
+            stamp = self._stamp(entity_name)
+            if expected_stamp is not None and stamp != expected_stamp:
+                return VERSION_CONFLICT, stamp
+            if data is not None:
+                self.snapshots[entity_name] = pickle.dumps(
+                    data, pickle.HIGHEST_PROTOCOL
+                )
+                self.journals[entity_name] = []
+            if records is not None:
+                self.journals.setdefault(entity_name, []).append(
+                    pickle.dumps(records, pickle.HIGHEST_PROTOCOL)
+                )
+            for extra_entity, extra_data in (extra or {}).items():
+                self.snapshots[extra_entity] = pickle.dumps(
+                    extra_data, pickle.HIGHEST_PROTOCOL
+                )
+                self.journals[extra_entity] = []
+                self.versions[extra_entity] = self.versions.get(extra_entity, 0) + 1
+            self.versions[entity_name] = stamp[0] + 1
+            return OK_STATUS, self._stamp(entity_name)
+
+    def checkpoint(
+            self,
+            entity_name,
+            data,
+            fmt=None,
+            expected_stamp=None,
+            extra=None) -> tuple[int, None]:
+        '''
+        Compacta el diario: data pasa a ser el snapshot de la entidad (y se
+        escriben los estados de extra), solo si el sello de version es
+        expected_stamp (o si es None).
+        '''
+        status, _ = self.commit(
+            entity_name, expected_stamp, data=data, extra=extra
+        )
+        return status, None
+
+    def stamp(self, entity_name, fmt=None) -> tuple:
+        '''
+        Regresa el sello de version de la entidad.
+        '''
+        with self.lock:
+            return self._stamp(entity_name)
+
+    def checkpoint_due(self, stamp: tuple) -> bool:
+        '''
+        Regresa verdadero si el diario del sello ya paso de
+        JOURNAL_MAX_BLOCKS bloques.
+        '''
+        return bool(stamp and stamp[1] > JOURNAL_MAX_BLOCKS)
+
+    def shard_entities(self, entity_name, shards: int) -> list[str]:
+        '''
+        Nombres de los shards de una entidad (los mismos que en archivos).
+        '''
+        return [f'{entity_name}.d/{shard:04d}' for shard in range(shards)]
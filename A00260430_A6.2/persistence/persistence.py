@@ -1,92 +1,645 @@
-'''
-Modulo para leer archivos con los datos de Hotel, Customer y Reservation.
-Todos los datos están en formato JSON.
-
-Historia
-Fecha           Descripcion del cambio                      Author
-17-02-2024      Version inicial                             A00260430
-'''
-import json
-import os
-
-from filelock import FileLock
-OK_STATUS = 0
-ERROR_STATUS = -9
-TEMP_DATA = {}
-
-
-def create_data_store(entity_name) -> tuple[int, None]:
-    '''
-    Función para crear un archivo de datos en formato JSON.
-
-    La función genera un diccionario simple con todos los productos y sus
-    precios.
-    '''
-    status = OK_STATUS
-
-    try:
-        lock = FileLock(entity_name+'.lock')
-        with lock:
-            with open(entity_name+'.json', 'w', encoding='UTF-8') as fd:
-                json.dump(TEMP_DATA, fd)
-    except OSError as error:
-        print(
-            '[ERROR] - An exception ocurred',
-            f'while creating file for entity {entity_name}: {error}'
-        )
-        status = ERROR_STATUS
-    finally:
-        lock.release()
-
-    return status, None
-
-
-def update_data_store(entity_name, data) -> tuple[int, None]:
-    '''
-    Función para actualizar archivo con en formato JSON.
-    '''
-    status = OK_STATUS
-
-    try:
-        lock = FileLock(entity_name+'.lock')
-        with lock:
-            with open(entity_name+'.json', 'w', encoding='UTF-8') as fd:
-                json.dump(data, fd)
-    except OSError as error:
-        print(
-            '[ERROR] - An exception ocurred',
-            f'while writing file for entity {entity_name}: {error}'
-        )
-        status = ERROR_STATUS
-    finally:
-        lock.release()
-
-    return status, None
-
-
-def load_data_store(entity_name) -> tuple[int, dict]:
-    '''
-    Función para actualizar archivo con en formato JSON.
-    '''
-    status = OK_STATUS
-    data = None
-
-    try:
-        lock = FileLock(entity_name+'.lock')
-        with lock:
-            if not os.path.isfile(entity_name+'.json'):
-                data = {}
-            else:
-                with open(entity_name+'.json', 'r', encoding='UTF-8') as fd:
-                    data = json.load(fd)
-    except OSError as error:
-        print(
-            '[ERROR] - An exception ocurred',
-            f'while reading file for entity {entity_name}: {error}'
-        )
-        status = ERROR_STATUS
-        data = {}
-    finally:
-        lock.release()
-
-    return status, data
+'''
+Modulo para leer archivos con los datos de Hotel, Customer y Reservation.
+Los datos están en formato JSON; el snapshot de hoteles tambien se puede
+guardar en formato binario (ver binary_snapshot) indicando fmt='binary' y
+el de clientes en columnas (ver columnar_snapshot) con fmt='columnar'.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+17-02-2024      Version inicial                             A00260430
+18-10-2026      Diario (journal) de cambios y checkpoints   A00260430
+18-10-2026      Almacenamiento dividido en shards           A00260430
+18-10-2026      Formato de snapshot binario                 A00260430
+18-10-2026      Escritura atomica y politica de fsync       A00260430
+18-10-2026      Candado compartido para lectores            A00260430
+18-10-2026      Sello de version de los archivos            A00260430
+18-10-2026      Escritura condicional (compare and swap)    A00260430
+18-10-2026      Formato de snapshot en columnas             A00260430
+18-10-2026      Checkpoint condicional (sello de version)   A00260430
+'''
+import json
+import os
+import threading
+import time
+import zlib
+
+from filelock import FileLock
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+from .binary_snapshot import encode_snapshot, decode_snapshot
+from .columnar_snapshot import encode_columns, decode_columns
+OK_STATUS = 0
+ERROR_STATUS = -9
+VERSION_CONFLICT = -8
+TEMP_DATA = {}
+JOURNAL_MAX_BYTES = 1048576
+JSON_FORMAT = 'json'
+BINARY_FORMAT = 'binary'
+COLUMNAR_FORMAT = 'columnar'
+# Extension, serializacion y lectura de cada formato de snapshot
+FORMATS = {
+    JSON_FORMAT: (
+        '.json',
+        lambda data: json.dumps(data).encode('UTF-8'),
+        lambda raw: json.loads(raw.decode('UTF-8'))
+    ),
+    BINARY_FORMAT: ('.bin', encode_snapshot, decode_snapshot),
+    COLUMNAR_FORMAT: ('.col', encode_columns, decode_columns)
+}
+# Politicas de fsync: ninguna, en cada escritura o agrupando las escrituras
+# concurrentes (group commit)
+FSYNC_NONE = 'none'
+FSYNC_COMMIT = 'commit'
+FSYNC_GROUP = 'group'
+FSYNC_POLICY = {'policy': FSYNC_NONE, 'window_ms': 2}
+
+
+class _GroupCommit():
+    '''
+    Clase privada para agrupar los fsync de escrituras concurrentes. La
+    primera escritura que llega es la lider: espera window_ms a que lleguen
+    otras, hace el fsync de todos los archivos del grupo, los renombra y hace
+    un solo fsync por directorio. Las demas escrituras del grupo solo esperan
+    a que la lider termine.
+    '''
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.batch = None
+
+    def commit(self, temp_name, file_name):
+        '''
+        Hace durable el archivo temp_name y lo renombra a file_name (si
+        file_name es None solo se hace el fsync). Lanza OSError si falla la
+        escritura del grupo.
+        '''
+        with self.lock:
+            batch = self.batch
+            leader = batch is None
+            if leader:
+                batch = self.batch = {
+                    'files': [], 'done': threading.Event(), 'error': None
+                }
+            batch['files'].append((temp_name, file_name))
+
+        if leader:
+            time.sleep(FSYNC_POLICY['window_ms'] / 1000)
+            with self.lock:
+                self.batch = None
+            try:
+                directories = set()
+                for batch_temp, batch_file in batch['files']:
+                    _fsync_file(batch_temp)
+                    if batch_file is not None:
+                        os.replace(batch_temp, batch_file)
+                        directories.add(os.path.dirname(batch_file) or '.')
+                for directory in directories:
+                    _fsync_file(directory)
+            except OSError as error:
+                batch['error'] = error
+            batch['done'].set()
+        else:
+            batch['done'].wait()
+
+        if batch['error'] is not None:
+            raise batch['error']
+
+
+_GROUP_COMMIT = _GroupCommit()
+
+
+class SharedFileLock():
+    '''
+    Clase SharedFileLock. Candado compartido (fcntl.flock con LOCK_SH) sobre
+    el mismo archivo <entidad>.lock que usa FileLock (LOCK_EX) para las
+    escrituras: varios lectores pueden tener el candado al mismo tiempo,
+    pero un lector espera a que termine la escritura en curso y una
+    escritura espera a que terminen los lectores.
+
+    Se usa igual que FileLock: con with y release al terminar.
+    '''
+
+    def __init__(self, lock_file: str):
+        self.lock_file = lock_file
+        self.fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+    def acquire(self):
+        '''
+        Toma el candado compartido, esperando si hay una escritura.
+        '''
+        if self.fd is None:
+            self.fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+            fcntl.flock(self.fd, fcntl.LOCK_SH)
+
+    def release(self):
+        '''
+        Libera el candado si se tiene.
+        '''
+        if self.fd is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+            os.close(self.fd)
+            self.fd = None
+
+
+def read_lock(entity_name):
+    '''
+    Función que regresa el candado para leer una entidad: compartido con
+    fcntl.flock si el sistema lo tiene, o el FileLock exclusivo en otro caso.
+    '''
+    if fcntl is None:
+        return FileLock(entity_name+'.lock')
+    return SharedFileLock(entity_name+'.lock')
+
+
+def set_fsync_policy(policy, window_ms: int = None) -> tuple[int, None]:
+    '''
+    Función para indicar la politica de fsync de las escrituras:
+    FSYNC_NONE (sin fsync), FSYNC_COMMIT (fsync del archivo y del directorio
+    en cada escritura) o FSYNC_GROUP (las escrituras que llegan dentro de
+    window_ms se hacen durables con un solo grupo de fsync).
+    '''
+    if policy not in (FSYNC_NONE, FSYNC_COMMIT, FSYNC_GROUP):
+        return ERROR_STATUS, None
+    FSYNC_POLICY['policy'] = policy
+    if window_ms is not None:
+        FSYNC_POLICY['window_ms'] = window_ms
+    return OK_STATUS, None
+
+
+def _fsync_file(file_name):
+    '''
+    Función privada que hace fsync de un archivo o directorio ya escrito.
+    '''
+    fd = os.open(file_name, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _atomic_write(file_name, payload: bytes):
+    '''
+    Función privada que escribe el archivo completo en un archivo temporal y
+    lo renombra, de modo que un fallo a mitad de la escritura deja intacto el
+    archivo anterior y un lector nunca ve un archivo a medias. Antes de
+    renombrar se aplica la politica de fsync.
+    '''
+    policy = FSYNC_POLICY['policy']
+    with open(file_name+'.tmp', 'wb') as fd:
+        fd.write(payload)
+        if policy == FSYNC_COMMIT:
+            fd.flush()
+            os.fsync(fd.fileno())
+    if policy == FSYNC_GROUP:
+        _GROUP_COMMIT.commit(file_name+'.tmp', file_name)
+        return
+    os.replace(file_name+'.tmp', file_name)
+    if policy == FSYNC_COMMIT:
+        _fsync_file(os.path.dirname(file_name) or '.')
+
+
+def create_data_store(entity_name) -> tuple[int, None]:
+    '''
+    Función para crear un archivo de datos en formato JSON.
+
+    La función genera un diccionario simple con todos los productos y sus
+    precios.
+    '''
+    status = OK_STATUS
+
+    try:
+        lock = FileLock(entity_name+'.lock')
+        with lock:
+            _write_snapshot(entity_name, TEMP_DATA, JSON_FORMAT)
+    except OSError as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while creating file for entity {entity_name}: {error}'
+        )
+        status = ERROR_STATUS
+    finally:
+        lock.release()
+
+    return status, None
+
+
+def update_data_store(entity_name, data, fmt=JSON_FORMAT) -> tuple[int, None]:
+    '''
+    Función para actualizar archivo con en formato JSON (o el formato fmt).
+
+    El archivo se escribe a un temporal y se renombra (ver _atomic_write),
+    aplicando la politica de fsync de set_fsync_policy. El archivo escrito
+    contiene el estado completo, por lo que se borran los diarios (journal)
+    pendientes de la entidad.
+    '''
+    status = OK_STATUS
+
+    try:
+        lock = FileLock(entity_name+'.lock')
+        with lock:
+            _write_snapshot(entity_name, data, fmt)
+    except OSError as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while writing file for entity {entity_name}: {error}'
+        )
+        status = ERROR_STATUS
+    finally:
+        lock.release()
+
+    return status, None
+
+
+def load_data_store(
+        entity_name,
+        rebuild=None,
+        fmt=JSON_FORMAT) -> tuple[int, dict]:
+    '''
+    Función para leer un archivo en formato JSON (o el formato fmt).
+
+    La lectura toma el candado compartido (ver read_lock), por lo que los
+    lectores no se bloquean entre si, solo con las escrituras.
+
+    Si se recibe la función rebuild, tambien se leen los registros del diario
+    de la entidad (ver append_journal) y el estado se reconstruye llamando
+    rebuild(datos, registros), que regresa el diccionario final.
+    '''
+    status = OK_STATUS
+    data = None
+    records = []
+    extension, _, deserialize = FORMATS[fmt]
+
+    try:
+        lock = read_lock(entity_name)
+        with lock:
+            if not os.path.isfile(entity_name+extension):
+                data = {}
+            else:
+                with open(entity_name+extension, 'rb') as fd:
+                    data = deserialize(fd.read())
+            if rebuild is not None:
+                records = _read_journal(entity_name)
+    except OSError as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while reading file for entity {entity_name}: {error}'
+        )
+        status = ERROR_STATUS
+        data = {}
+    finally:
+        lock.release()
+
+    if rebuild is not None and status == OK_STATUS:
+        data = rebuild(data, records)
+
+    return status, data
+
+
+def _read_journal(entity_name) -> list:
+    '''
+    Función privada para leer los registros del diario. Primero se leen los
+    registros del diario en proceso de checkpoint (.journal.1) y despues los
+    del diario activo (.journal). Una linea incompleta al final del archivo
+    (escritura interrumpida) se ignora.
+    '''
+    records = []
+    for file_name in (entity_name+'.journal.1', entity_name+'.journal'):
+        if not os.path.isfile(file_name):
+            continue
+        with open(file_name, 'r', encoding='UTF-8') as fd:
+            for line in fd:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    break
+    return records
+
+
+def append_journal(entity_name, records) -> tuple[int, int]:
+    '''
+    Función para agregar registros delta al diario (journal) de una entidad.
+
+    Cada registro se escribe como una linea JSON compacta al final del archivo
+    <entidad>.journal, de modo que el costo de escritura depende del tamaño
+    del cambio y no del tamaño de los datos. Los registros deben describir
+    asignaciones (no verificaciones), para que aplicarlos dos veces sobre un
+    snapshot que ya los incluye produzca el mismo estado. Tambien se aplica
+    la politica de fsync de set_fsync_policy.
+
+    Regresa una tupla (err, tamaño del diario en bytes)
+    '''
+    status = OK_STATUS
+    size = 0
+
+    try:
+        lock = FileLock(entity_name+'.lock')
+        with lock:
+            size = _append_records(entity_name, records)
+    except OSError as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while writing journal for entity {entity_name}: {error}'
+        )
+        status = ERROR_STATUS
+    finally:
+        lock.release()
+
+    return status, size
+
+
+def _write_snapshot(entity_name, data, fmt):
+    '''
+    Función privada que escribe el snapshot completo de una entidad y borra
+    sus diarios. Se llama con el candado de la entidad tomado.
+    '''
+    extension, serialize, _ = FORMATS[fmt]
+    _atomic_write(entity_name+extension, serialize(data))
+    # Un snapshot completo reemplaza los registros del diario
+    for file_name in (entity_name+'.journal', entity_name+'.journal.1'):
+        if os.path.isfile(file_name):
+            os.remove(file_name)
+    _bump_version(entity_name)
+
+
+def _append_records(entity_name, records) -> int:
+    '''
+    Función privada que agrega registros al diario de una entidad y regresa
+    el tamaño del diario. Se llama con el candado de la entidad tomado.
+    '''
+    with open(entity_name+'.journal', 'a', encoding='UTF-8') as fd:
+        for record in records:
+            fd.write(json.dumps(record, separators=(',', ':')) + '\n')
+        size = fd.tell()
+        if FSYNC_POLICY['policy'] == FSYNC_COMMIT:
+            fd.flush()
+            os.fsync(fd.fileno())
+    if FSYNC_POLICY['policy'] == FSYNC_GROUP:
+        _GROUP_COMMIT.commit(entity_name+'.journal', None)
+    _bump_version(entity_name)
+    return size
+
+
+def commit_data_store(
+        entity_name,
+        expected_stamp,
+        data=None,
+        records=None,
+        fmt=JSON_FORMAT,
+        extra=None) -> tuple[int, tuple]:
+    '''
+    Función para guardar los cambios de una entidad solo si nadie mas la
+    cambio desde que se leyo (compare and swap). Con el candado tomado se
+    compara el sello de version actual (ver data_store_stamp) con
+    expected_stamp; si son distintos no se escribe nada y se regresa
+    VERSION_CONFLICT, para que quien llama vuelva a leer y reintente.
+
+    Con data se escribe el snapshot completo (como update_data_store) y con
+    records se agregan registros al diario (como append_journal). extra es un
+    diccionario {entidad: datos} de snapshots JSON derivados (por ejemplo un
+    indice) que se escriben con el mismo candado, para que queden de acuerdo
+    con la entidad. Si expected_stamp es None no se compara.
+
+    Regresa una tupla (err, sello de version despues de escribir)
+    '''
+    status = OK_STATUS
+    stamp = None
+
+    try:
+        lock = FileLock(entity_name+'.lock')
+        with lock:
+            stamp = data_store_stamp(entity_name, fmt)
+            if expected_stamp is not None and stamp != expected_stamp:
+                status = VERSION_CONFLICT
+            else:
+                if data is not None:
+                    _write_snapshot(entity_name, data, fmt)
+                if records is not None:
+                    _append_records(entity_name, records)
+                for extra_entity, extra_data in (extra or {}).items():
+                    _atomic_write(
+                        extra_entity+'.json',
+                        json.dumps(extra_data).encode('UTF-8')
+                    )
+                stamp = data_store_stamp(entity_name, fmt)
+    except OSError as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while committing file for entity {entity_name}: {error}'
+        )
+        status = ERROR_STATUS
+    finally:
+        lock.release()
+
+    return status, stamp
+
+
+def checkpoint_data_store(
+        entity_name,
+        data,
+        background: bool = True,
+        fmt=JSON_FORMAT,
+        expected_stamp=None,
+        extra=None) -> tuple[int, threading.Thread]:
+    '''
+    Función para compactar el diario de una entidad en un nuevo snapshot.
+
+    data debe ser el estado completo que resulta del snapshot y del diario.
+    Con el candado tomado se compara el sello de version actual con
+    expected_stamp (el sello con el que se leyo data); si son distintos el
+    diario tiene registros de otros procesos que data no incluye, por lo que
+    no se compacta y se regresa VERSION_CONFLICT. Si expected_stamp es None
+    no se compara (solo si no hay otros procesos escribiendo).
+
+    Con el mismo candado se escriben los snapshots JSON de extra (ver
+    commit_data_store), se rota el diario activo a <entidad>.journal.1 y se
+    serializa el diccionario; la escritura del snapshot y el borrado del
+    diario rotado se hacen en un hilo en segundo plano (o en linea si
+    background es falso). Si ya hay un checkpoint pendiente no se hace nada.
+
+    Regresa una tupla (err, hilo del checkpoint o None)
+    '''
+    status = OK_STATUS
+    payload = None
+    rotated = None
+    thread = None
+
+    try:
+        lock = FileLock(entity_name+'.lock')
+        with lock:
+            if (expected_stamp is not None
+                    and data_store_stamp(entity_name, fmt) != expected_stamp):
+                status = VERSION_CONFLICT
+            elif (not os.path.isfile(entity_name+'.journal.1')
+                    and os.path.isfile(entity_name+'.journal')):
+                for extra_entity, extra_data in (extra or {}).items():
+                    _atomic_write(
+                        extra_entity+'.json',
+                        json.dumps(extra_data).encode('UTF-8')
+                    )
+                os.replace(entity_name+'.journal', entity_name+'.journal.1')
+                rotated = _file_stamp(entity_name+'.journal.1')
+                payload = FORMATS[fmt][1](data)
+    except OSError as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while rotating journal for entity {entity_name}: {error}'
+        )
+        status = ERROR_STATUS
+    finally:
+        lock.release()
+
+    if payload is not None:
+        if background:
+            thread = threading.Thread(
+                target=_write_checkpoint,
+                args=(entity_name, payload, fmt, rotated)
+            )
+            thread.start()
+        else:
+            status, _ = _write_checkpoint(entity_name, payload, fmt, rotated)
+
+    return status, thread
+
+
+def _file_stamp(file_name) -> tuple:
+    '''
+    Función privada que regresa (inodo, fecha de modificacion, tamaño) del
+    archivo, o None si no existe.
+    '''
+    try:
+        stat = os.stat(file_name)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _write_checkpoint(entity_name, payload, fmt, rotated) -> tuple[int, None]:
+    '''
+    Función privada que escribe el snapshot serializado y borra el diario
+    rotado. El snapshot se escribe a un archivo temporal y se renombra, asi
+    un fallo a mitad de la escritura deja intacto el snapshot anterior.
+
+    Si el diario rotado ya no es el que se roto (rotated, ver _file_stamp)
+    otro proceso escribio un snapshot completo despues de rotarlo, por lo que
+    el snapshot serializado es anterior y no se escribe.
+    '''
+    status = OK_STATUS
+    extension = FORMATS[fmt][0]
+
+    try:
+        lock = FileLock(entity_name+'.lock')
+        with lock:
+            if _file_stamp(entity_name+'.journal.1') == rotated:
+                _atomic_write(entity_name+extension, payload)
+                os.remove(entity_name+'.journal.1')
+    except OSError as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while writing checkpoint for entity {entity_name}: {error}'
+        )
+        status = ERROR_STATUS
+    finally:
+        lock.release()
+
+    return status, None
+
+
+def convert_data_store(entity_name, source_fmt, target_fmt) -> tuple[int, None]:
+    '''
+    Función para convertir el snapshot de una entidad de un formato a otro
+    (por ejemplo de JSON a binario). Los diarios pendientes se aplican al
+    siguiente load_data_store, por lo que no se modifican.
+    '''
+    status = OK_STATUS
+    source_extension, _, deserialize = FORMATS[source_fmt]
+    target_extension, serialize, _ = FORMATS[target_fmt]
+
+    try:
+        lock = FileLock(entity_name+'.lock')
+        with lock:
+            data = {}
+            if os.path.isfile(entity_name+source_extension):
+                with open(entity_name+source_extension, 'rb') as fd:
+                    data = deserialize(fd.read())
+            _atomic_write(entity_name+target_extension, serialize(data))
+    except (OSError, ValueError) as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while converting file for entity {entity_name}: {error}'
+        )
+        status = ERROR_STATUS
+    finally:
+        lock.release()
+
+    return status, None
+
+
+def _read_version(entity_name) -> int:
+    '''
+    Función privada que lee el contador de version de <entidad>.version.
+    '''
+    try:
+        with open(entity_name+'.version', 'r', encoding='UTF-8') as fd:
+            return int(fd.read() or 0)
+    except (OSError, ValueError):
+        return 0
+
+
+def _bump_version(entity_name):
+    '''
+    Función privada que incrementa el contador de version de la entidad. Se
+    llama con el candado de la entidad tomado, en cada escritura que cambia
+    los datos.
+    '''
+    with open(entity_name+'.version.tmp', 'w', encoding='UTF-8') as fd:
+        fd.write(str(_read_version(entity_name) + 1))
+    os.replace(entity_name+'.version.tmp', entity_name+'.version')
+
+
+def data_store_stamp(entity_name, fmt=JSON_FORMAT) -> tuple:
+    '''
+    Función que regresa el sello de version de una entidad: el contador de
+    <entidad>.version, que incrementa cada escritura de este modulo, y el
+    inodo, fecha de modificacion y tamaño del snapshot y de sus diarios (por
+    si otro programa cambia los archivos). Basta comparar el sello con el
+    guardado al leer para saber si otro proceso cambio los datos. El
+    contador es necesario porque un inodo puede reutilizarse y la fecha de
+    modificacion tiene poca resolucion.
+    '''
+    stamp = [_read_version(entity_name)]
+    for file_name in (entity_name+FORMATS[fmt][0], entity_name+'.journal',
+                      entity_name+'.journal.1'):
+        stamp.append(_file_stamp(file_name))
+    return tuple(stamp)
+
+
+def shard_entity(entity_name, key: str, shards: int) -> str:
+    '''
+    Función que regresa el nombre de entidad del shard donde se guarda la
+    llave. Los shards son archivos <entidad>.d/NNNN.json (cada uno con su
+    candado) y la llave se asigna por hash, de modo que las escrituras de
+    llaves en shards distintos no se bloquean entre si.
+
+    La entidad regresada se usa con las mismas funciones (load_data_store,
+    update_data_store, append_journal, ...) que una entidad normal. El
+    directorio lo crea shard_entities.
+    '''
+    return f'{entity_name}.d/{zlib.crc32(key.encode("UTF-8")) % shards:04d}'
+
+
+def shard_entities(entity_name, shards: int) -> list[str]:
+    '''
+    Función que regresa los nombres de entidad de todos los shards de una
+    entidad, creando el directorio <entidad>.d si no existe.
+    '''
+    os.makedirs(entity_name+'.d', exist_ok=True)
+    return [f'{entity_name}.d/{shard:04d}' for shard in range(shards)]
@@ -0,0 +1,397 @@
+'''
+Modulo con el almacenamiento en SQLite, alternativo a los archivos JSON.
+
+Los hoteles, sus rangos reservados por habitacion y los clientes se guardan
+en tablas con indices, y cada registro delta de Hotel y Customer se aplica
+como sentencias sobre los renglones que cambian, dentro de una transaccion:
+una reservacion modifica solo los rangos de esa habitacion en lugar de
+reescribir todo el documento. La base de datos usa el modo WAL, por lo que
+los lectores no bloquean a quien escribe.
+
+- hotel (name, address, rooms)
+- booking (hotel, year, room, start, days, customer), llave primaria
+  (hotel, year, room, start) e indice por cliente
+- customer (key, names, surname, id_doc_no, phone_no, year_dob), indices
+  por telefono y documento de identificacion
+
+Las demas entidades se guardan como documentos JSON (tabla document) con sus
+registros delta (tabla journal).
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import json
+import sqlite3
+import threading
+
+OK_STATUS = 0
+ERROR_STATUS = -9
+VERSION_CONFLICT = -8
+HOTEL_ENTITY = 'hotel'
+CUSTOMER_ENTITY = 'customer'
+CUSTOMER_FIELDS = ('names', 'surname', 'id_doc_no', 'phone_no', 'year_dob')
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS entity_version (
+    entity TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS document (
+    entity TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    entity TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS journal_entity ON journal (entity, seq);
+CREATE TABLE IF NOT EXISTS hotel (
+    name TEXT PRIMARY KEY,
+    address TEXT NOT NULL,
+    rooms INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS booking (
+    hotel TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    room INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    days INTEGER NOT NULL,
+    customer TEXT NOT NULL,
+    PRIMARY KEY (hotel, year, room, start)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS booking_customer ON booking (customer);
+CREATE TABLE IF NOT EXISTS customer (
+    key TEXT PRIMARY KEY,
+    names TEXT,
+    surname TEXT,
+    id_doc_no TEXT,
+    phone_no TEXT,
+    year_dob INTEGER
+);
+CREATE INDEX IF NOT EXISTS customer_phone ON customer (phone_no);
+CREATE INDEX IF NOT EXISTS customer_id_doc ON customer (id_doc_no);
+'''
+
+
+class SQLiteStore():
+    '''
+    Clase SQLiteStore. Implementa la interfaz de store (ver store.FileStore)
+    sobre una base de datos SQLite. Las entidades hotel y customer se guardan
+    en tablas y sus registros delta se aplican como cambios de renglones, por
+    lo que Hotel y Customer usan su modo con diario (journaled). El sello de
+    version de cada entidad es un contador en la tabla entity_version, que
+    se compara e incrementa en la misma transaccion de cada escritura.
+
+    No acepta shards: las escrituras ya son por renglon.
+    '''
+    journaled = True
+    shardable = False
+
+    def __init__(self, path: str = 'hotel.db'):
+        self.path = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        '''
+        Cierra la conexion a la base de datos.
+        '''
+        self.connection.close()
+
+    def _version(self, entity_name) -> int:
+        '''
+        Metodo privado que lee el contador de version de la entidad.
+        '''
+        row = self.connection.execute(
+            'SELECT version FROM entity_version WHERE entity = ?',
+            (entity_name,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _read(self, entity_name) -> tuple[dict, list]:
+        '''
+        Metodo privado que lee una entidad con el formato de su archivo JSON
+        y los registros delta pendientes (solo para documentos).
+        '''
+        data = {}
+        records = []
+        if entity_name == HOTEL_ENTITY:
+            for name, address, rooms in self.connection.execute(
+                    'SELECT name, address, rooms FROM hotel'):
+                data[name] = {'address': address, 'rooms': rooms}
+            for hotel, year, room, start, days, customer_no in \
+                    self.connection.execute(
+                        'SELECT hotel, year, room, start, days, customer '
+                        'FROM booking ORDER BY hotel, year, room, start'):
+                data[hotel].setdefault(str(year), {}).setdefault(
+                    str(room), []
+                ).append([start, days, customer_no])
+        elif entity_name == CUSTOMER_ENTITY:
+            for row in self.connection.execute(
+                    'SELECT key, ' + ', '.join(CUSTOMER_FIELDS) + ' FROM customer'):
+                data[row[0]] = dict(zip(CUSTOMER_FIELDS, row[1:]))
+        else:
+            row = self.connection.execute(
+                'SELECT data FROM document WHERE entity = ?', (entity_name,)
+            ).fetchone()
+            if row:
+                data = json.loads(row[0])
+            records = [
+                json.loads(record) for (record,) in self.connection.execute(
+                    'SELECT record FROM journal WHERE entity = ? ORDER BY seq',
+                    (entity_name,)
+                )
+            ]
+        return data, records
+
+    def _write(self, entity_name, data):
+        '''
+        Metodo privado que reemplaza el estado completo de una entidad.
+        '''
+        execute = self.connection.execute
+        if entity_name == HOTEL_ENTITY:
+            execute('DELETE FROM booking')
+            execute('DELETE FROM hotel')
+            for name, hotel_data in data.items():
+                execute(
+                    'INSERT INTO hotel (name, address, rooms) VALUES (?, ?, ?)',
+                    (name, hotel_data['address'], hotel_data['rooms'])
+                )
+                for year, year_data in hotel_data.items():
+                    if year in ('address', 'rooms'):
+                        continue
+                    self.connection.executemany(
+                        'INSERT INTO booking VALUES (?, ?, ?, ?, ?, ?)',
+                        [
+                            (name, int(year), int(room), start, days, customer_no)
+                            for room, room_data in year_data.items()
+                            for start, days, customer_no in room_data
+                        ]
+                    )
+        elif entity_name == CUSTOMER_ENTITY:
+            execute('DELETE FROM customer')
+            for key, customer_data in data.items():
+                self._put_customer(key, customer_data)
+        else:
+            execute(
+                'INSERT OR REPLACE INTO document (entity, data) VALUES (?, ?)',
+                (entity_name, json.dumps(data))
+            )
+            execute('DELETE FROM journal WHERE entity = ?', (entity_name,))
+
+    def _put_customer(self, key, customer_data):
+        '''
+        Metodo privado que inserta o reemplaza un cliente.
+        '''
+        self.connection.execute(
+            'INSERT OR REPLACE INTO customer VALUES (?, ?, ?, ?, ?, ?)',
+            (key,) + tuple(customer_data.get(field) for field in CUSTOMER_FIELDS)
+        )
+
+    def _release(self, name, room, year, start, days):
+        '''
+        Metodo privado que libera los dias [start, start + days) de una
+        habitacion. Los rangos que solo se traslapan en parte se recortan.
+        '''
+        end = start + days
+        execute = self.connection.execute
+        rows = execute(
+            'SELECT start, days, customer FROM booking '
+            'WHERE hotel = ? AND year = ? AND room = ? '
+            'AND start < ? AND start + days > ?',
+            (name, year, room, end, start)
+        ).fetchall()
+        for row_start, row_days, customer_no in rows:
+            execute(
+                'DELETE FROM booking '
+                'WHERE hotel = ? AND year = ? AND room = ? AND start = ?',
+                (name, year, room, row_start)
+            )
+            if row_start < start:
+                execute(
+                    'INSERT INTO booking VALUES (?, ?, ?, ?, ?, ?)',
+                    (name, year, room, row_start, start - row_start, customer_no)
+                )
+            if row_start + row_days > end:
+                execute(
+                    'INSERT INTO booking VALUES (?, ?, ?, ?, ?, ?)',
+                    (name, year, room, end, row_start + row_days - end,
+                     customer_no)
+                )
+
+    def _apply(self, entity_name, records):
+        '''
+        Metodo privado que aplica registros delta como cambios de renglones.
+
+        - hotel: ['hotel', nombre, direccion, cuartos], ['address', nombre,
+          direccion], ['delete', nombre], ['reserve' o 'cancel', nombre,
+          cuarto, anio, dia, dias, cliente]
+        - customer: ['put', numero de cliente, datos], ['delete', numero]
+        - otras entidades: se guardan en la tabla journal
+        '''
+        execute = self.connection.execute
+        for record in records:
+            operation = record[0]
+            if entity_name == HOTEL_ENTITY:
+                if operation in ('hotel', 'delete'):
+                    execute('DELETE FROM booking WHERE hotel = ?', (record[1],))
+                    execute('DELETE FROM hotel WHERE name = ?', (record[1],))
+                if operation == 'hotel':
+                    execute(
+                        'INSERT INTO hotel (name, address, rooms) VALUES (?, ?, ?)',
+                        (record[1], record[2], record[3])
+                    )
+                elif operation == 'address':
+                    execute(
+                        'UPDATE hotel SET address = ? WHERE name = ?',
+                        (record[2], record[1])
+                    )
+                elif operation in ('reserve', 'cancel'):
+                    _, name, room, year, date_day, days, customer_no = record
+                    self._release(name, room, year, date_day - 1, days)
+                    if operation == 'reserve':
+                        execute(
+                            'INSERT INTO booking VALUES (?, ?, ?, ?, ?, ?)',
+                            (name, year, room, date_day - 1, days, customer_no)
+                        )
+            elif entity_name == CUSTOMER_ENTITY:
+                if operation == 'put':
+                    self._put_customer(record[1], record[2])
+                elif operation == 'delete':
+                    execute('DELETE FROM customer WHERE key = ?', (record[1],))
+            else:
+                execute(
+                    'INSERT INTO journal (entity, record) VALUES (?, ?)',
+                    (entity_name, json.dumps(record))
+                )
+
+    def load(self, entity_name, rebuild=None, fmt=None) -> tuple[int, dict]:
+        '''
+        Lee una entidad con el formato de su archivo JSON. Si se recibe
+        rebuild el estado se reconstruye con rebuild(datos, registros).
+
+        Regresa una tupla (err, diccionario)
+        '''
+        status = OK_STATUS
+        data = {}
+        records = []
+
+        with self.lock:
+            try:
+                self.connection.execute('BEGIN')
+                data, records = self._read(entity_name)
+                self.connection.execute('COMMIT')
+            except sqlite3.Error as error:
+                print(
+                    '[ERROR] - An exception ocurred',
+                    f'while reading entity {entity_name}: {error}'
+                )
+                self.connection.rollback()
+                status = ERROR_STATUS
+                data = {}
+
+        if rebuild is not None and status == OK_STATUS:
+            data = rebuild(data, records)
+
+        return status, data
+
+    def commit(
+            self,
+            entity_name,
+            expected_stamp,
+            data=None,
+            records=None,
+            fmt=None,
+            extra=None) -> tuple[int, tuple]:
+        '''
+        Escribe en una transaccion el estado completo (data) o los registros
+        delta (records) de una entidad, y los documentos de extra, solo si
+        el sello de version es expected_stamp (o si es None).
+
+        Regresa una tupla (err, sello de version despues de escribir)
+        '''
+        status = OK_STATUS
+        stamp = None
+
+        with self.lock:
+            try:
+                self.connection.execute('BEGIN IMMEDIATE')
+                stamp = (self._version(entity_name),)
+                if expected_stamp is not None and stamp != expected_stamp:
+                    status = VERSION_CONFLICT
+                    self.connection.execute('ROLLBACK')
+                else:
+                    if data is not None:
+                        self._write(entity_name, data)
+                    if records is not None:
+                        self._apply(entity_name, records)
+                    for extra_entity, extra_data in (extra or {}).items():
+                        self._write(extra_entity, extra_data)
+                    stamp = (stamp[0] + 1,)
+                    self.connection.execute(
+                        'INSERT OR REPLACE INTO entity_version (entity, version) '
+                        'VALUES (?, ?)',
+                        (entity_name, stamp[0])
+                    )
+                    self.connection.execute('COMMIT')
+            except sqlite3.Error as error:
+                print(
+                    '[ERROR] - An exception ocurred',
+                    f'while writing entity {entity_name}: {error}'
+                )
+                self.connection.rollback()
+                status = ERROR_STATUS
+
+        return status, stamp
+
+    def update(self, entity_name, data, fmt=None) -> tuple[int, None]:
+        '''
+        Reemplaza el estado completo de una entidad.
+        '''
+        status, _ = self.commit(entity_name, None, data=data)
+        return status, None
+
+    def append(self, entity_name, records) -> tuple[int, int]:
+        '''
+        Aplica registros delta de una entidad. No hay diario que crezca, por
+        lo que el tamaño regresado es 0.
+        '''
+        status, _ = self.commit(entity_name, None, records=records)
+        return status, 0
+
+    def checkpoint(
+            self,
+            entity_name,
+            data,
+            fmt=None,
+            expected_stamp=None,
+            extra=None) -> tuple[int, None]:
+        '''
+        No hace nada: los registros ya se aplicaron sobre las tablas.
+        '''
+        return OK_STATUS, None
+
+    def stamp(self, entity_name, fmt=None) -> tuple:
+        '''
+        Regresa el sello de version de la entidad (contador de escrituras).
+        '''
+        with self.lock:
+            return (self._version(entity_name),)
+
+    def checkpoint_due(self, stamp: tuple) -> bool:
+        '''
+        Nunca hace falta compactar.
+        '''
+        return False
+
+    def shard_entities(self, entity_name, shards: int) -> list[str]:
+        '''
+        Sin shards: regresa solo la entidad.
+        '''
+        return [entity_name]
@@ -0,0 +1,127 @@
+'''
+Modulo con la interfaz de almacenamiento (store) que usan Hotel y Customer.
+
+Un store guarda entidades (diccionarios) por nombre y ofrece los metodos
+- load - lee una entidad (y reconstruye su estado con rebuild)
+- update - escribe el estado completo de una entidad
+- append - agrega registros delta de una entidad
+- commit - escribe solo si la entidad no cambio (compare and swap)
+- checkpoint - compacta los registros delta en un snapshot
+- stamp - obtiene el sello de version de una entidad
+- checkpoint_due - indica si conviene compactar segun el sello
+- shard_entities - obtiene los nombres de los shards de una entidad
+
+FileStore usa los archivos JSON (o binarios) de persistence; SQLiteStore
+(ver sqlite_store) usa una base de datos SQLite y MemoryStore (ver
+memory_store) diccionarios en memoria. El store que se usa cuando no se
+indica uno se configura con set_default_store.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+18-10-2026      Store en memoria (MemoryStore)              A00260430
+'''
+from .persistence import load_data_store, update_data_store
+from .persistence import append_journal, checkpoint_data_store
+from .persistence import commit_data_store, data_store_stamp
+from .persistence import shard_entities, JSON_FORMAT, JOURNAL_MAX_BYTES
+
+
+class FileStore():
+    '''
+    Clase FileStore. Guarda cada entidad en <entidad>.json (o <entidad>.bin)
+    con su diario, usando las funciones del modulo persistence.
+
+    journaled indica si el store solo guarda registros delta (Hotel y
+    Customer usan entonces su modo con diario); shardable indica si acepta
+    entidades divididas en shards.
+    '''
+    journaled = False
+    shardable = True
+
+    def load(self, entity_name, rebuild=None, fmt=JSON_FORMAT) -> tuple[int, dict]:
+        '''
+        Lee una entidad, ver load_data_store.
+        '''
+        return load_data_store(entity_name, rebuild, fmt)
+
+    def update(self, entity_name, data, fmt=JSON_FORMAT) -> tuple[int, None]:
+        '''
+        Escribe el estado completo de una entidad, ver update_data_store.
+        '''
+        return update_data_store(entity_name, data, fmt)
+
+    def append(self, entity_name, records) -> tuple[int, int]:
+        '''
+        Agrega registros delta al diario, ver append_journal.
+        '''
+        return append_journal(entity_name, records)
+
+    def commit(
+            self,
+            entity_name,
+            expected_stamp,
+            data=None,
+            records=None,
+            fmt=JSON_FORMAT,
+            extra=None) -> tuple[int, tuple]:
+        '''
+        Escritura condicional, ver commit_data_store.
+        '''
+        return commit_data_store(
+            entity_name, expected_stamp, data, records, fmt, extra
+        )
+
+    def checkpoint(
+            self,
+            entity_name,
+            data,
+            fmt=JSON_FORMAT,
+            expected_stamp=None,
+            extra=None) -> tuple[int, object]:
+        '''
+        Compacta el diario en segundo plano solo si la entidad no cambio
+        desde expected_stamp, ver checkpoint_data_store.
+        '''
+        return checkpoint_data_store(
+            entity_name, data, fmt=fmt, expected_stamp=expected_stamp,
+            extra=extra
+        )
+
+    def stamp(self, entity_name, fmt=JSON_FORMAT) -> tuple:
+        '''
+        Sello de version de una entidad, ver data_store_stamp.
+        '''
+        return data_store_stamp(entity_name, fmt)
+
+    def checkpoint_due(self, stamp: tuple) -> bool:
+        '''
+        Regresa verdadero si el diario activo del sello (tercer elemento,
+        despues del contador y del snapshot) ya paso de JOURNAL_MAX_BYTES.
+        '''
+        return bool(stamp and stamp[2] and stamp[2][2] > JOURNAL_MAX_BYTES)
+
+    def shard_entities(self, entity_name, shards: int) -> list[str]:
+        '''
+        Nombres de los shards de una entidad, ver shard_entities.
+        '''
+        return shard_entities(entity_name, shards)
+
+
+DEFAULT_STORE = {'store': FileStore()}
+
+
+def set_default_store(store) -> tuple[int, None]:
+    '''
+    Función para indicar el store que usan Hotel, Customer y Reservation
+    cuando no se les indica uno.
+    '''
+    DEFAULT_STORE['store'] = store
+    return 0, None
+
+
+def get_default_store():
+    '''
+    Función que regresa el store configurado con set_default_store.
+    '''
+    return DEFAULT_STORE['store']
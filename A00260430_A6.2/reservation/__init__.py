@@ -1,4 +1,5 @@
-'''
-Inicializando modulo.
-'''
-from .reservation import Reservation
\ No newline at end of file
+'''
+Inicializando modulo.
+'''
+from .reservation import Reservation
+from .async_reservation import AsyncReservation
\ No newline at end of file
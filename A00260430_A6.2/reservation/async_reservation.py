@@ -0,0 +1,109 @@
+'''
+Codigo fuente de la clase AsyncReservation, version asincrona (asyncio) de
+Reservation.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+from hotel import Hotel, AsyncHotel
+from customer import Customer, AsyncCustomer
+from persistence import new_executor, run_blocking
+from .reservation import Reservation
+
+
+class AsyncReservation():
+    '''
+    Clase AsyncReservation. Cada metodo publico de Reservation tiene aqui
+    una version con async que lo ejecuta en el executor (ver
+    persistence.async_io): una reservacion consulta al hotel y al cliente y
+    escribe en un solo paso del executor, sin bloquear el ciclo de eventos.
+
+    Los atributos hotel y customer son AsyncHotel y AsyncCustomer sobre los
+    mismos objetos y el mismo executor. El executor tiene varios hilos (o
+    es el que recibe el constructor), de modo que varias reservaciones
+    pueden esperar archivos en paralelo.
+
+    Metodos publicos
+    + create_reservation, create_reservation_any_room, cancel_reservation
+    + list_reservations
+    + create_reservations, cancel_reservations, error_message, close
+    '''
+    def __init__(
+            self,
+            hotel: Hotel = None,
+            customer: Customer = None,
+            store=None,
+            executor=None):
+        self.reservation = Reservation(hotel, customer, store)
+        self.executor = executor or new_executor('reservation')
+        self.hotel = AsyncHotel(self.reservation.hotel, executor=self.executor)
+        self.customer = AsyncCustomer(
+            self.reservation.customer, executor=self.executor
+        )
+
+    async def create_reservation(self, *args, **kwargs) -> tuple[list[int], None]:
+        '''
+        Version asincrona de Reservation.create_reservation.
+        '''
+        return await run_blocking(
+            self.executor, self.reservation.create_reservation, *args, **kwargs
+        )
+
+    async def create_reservation_any_room(
+            self, *args, **kwargs) -> tuple[list[int], int]:
+        '''
+        Version asincrona de Reservation.create_reservation_any_room.
+        '''
+        return await run_blocking(
+            self.executor,
+            self.reservation.create_reservation_any_room,
+            *args,
+            **kwargs
+        )
+
+    async def cancel_reservation(self, *args, **kwargs) -> tuple[list[int], None]:
+        '''
+        Version asincrona de Reservation.cancel_reservation.
+        '''
+        return await run_blocking(
+            self.executor, self.reservation.cancel_reservation, *args, **kwargs
+        )
+
+    async def list_reservations(self, *args, **kwargs) -> tuple[list[int], list]:
+        '''
+        Version asincrona de Reservation.list_reservations.
+        '''
+        return await run_blocking(
+            self.executor, self.reservation.list_reservations, *args, **kwargs
+        )
+
+    async def create_reservations(
+            self, *args, **kwargs) -> tuple[list[list[int]], None]:
+        '''
+        Version asincrona de Reservation.create_reservations.
+        '''
+        return await run_blocking(
+            self.executor, self.reservation.create_reservations, *args, **kwargs
+        )
+
+    async def cancel_reservations(
+            self, *args, **kwargs) -> tuple[list[list[int]], None]:
+        '''
+        Version asincrona de Reservation.cancel_reservations.
+        '''
+        return await run_blocking(
+            self.executor, self.reservation.cancel_reservations, *args, **kwargs
+        )
+
+    def close(self):
+        '''
+        Metodo para terminar el executor cuando ya no hay llamadas.
+        '''
+        self.executor.shutdown()
+
+    def error_message(self, status: int) -> str:
+        '''
+        Metodo para traducir errores, ver Reservation.error_message.
+        '''
+        return self.reservation.error_message(status)
@@ -1,127 +1,304 @@
-'''
-Codigo fuente de la clase Reservation. Esta clase usa las clases Hotel y
-Customer, así como la clase Persistence
-
-La clase reservacion implementa dos metodos, create_reservation y
-cancel_reservation
-
-Historia
-Fecha           Descripcion del cambio                      Author
-17-02-2024      Versión inicial                             A00260430
-'''
-from hotel import Hotel
-from customer import Customer
-
-
-OK_STATUS = 0
-
-DUPLICATE_CUSTOMER = -101
-CUSTOMER_NOT_FOUND = -102
-CUSTOMER_ERROR_STATUS = -109
-CUSTOMER_INVALID_FIELD = -110
-DUPLICATE_HOTEL = -201
-HOTEL_NOT_FOUND = -202
-HOTEL_INVALID_FIELD = -210
-HOTEL_ERROR_STATUS = -209
-ROOM_NOT_FOUND = -220
-ROOM_NOT_AVAILABLE = -230
-RESERVATION_NOT_FOUND = -240
-
-
-class Reservation():
-    '''
-    Clase Reservation implementa dos metodos publicos:
-    - create_reservation
-    - cancel_reservation
-    '''
-
-    def __init__(self, hotel: Hotel, customer: Customer):
-        self.hotel = hotel
-        self.customer = customer
-
-    def create_reservation(
-            self,
-            customer_no: str,
-            hotel_name: str,
-            room: int,
-            start_month: int,
-            start_day: int,
-            days: int) -> tuple[list[int], None]:
-        '''
-        metodo para crear una reservacion usando una estructura con los datos
-        del cliente y una estructura con los datos del hotel.
-
-        Regresa una tupla (err, None)
-        '''
-        status = [OK_STATUS]
-
-        status_h, _ = self.hotel.display_hotel_info(hotel_name)
-        status_c, _ = self.customer.display_customer_info(customer_no)
-
-        if (status_h + status_c) == OK_STATUS:
-            status, _ = self.hotel.reserve_hotel_room(
-                hotel_name,
-                room,
-                customer_no,
-                start_month,
-                start_day,
-                days
-            )
-            status = [status]
-        else:
-            status = [status_h, status_c]
-
-        return status, None
-
-    def cancel_reservation(
-            self,
-            customer_no: str,
-            hotel_name: str,
-            room: int,
-            start_month: int,
-            start_day: int,
-            days: int) -> tuple[list[int], None]:
-        '''
-        metodo para crear una reservacio usando una estructura con los datos
-        del cliente y una estructura con los datos del hotel.
-
-        Regresa una tupla (err, None)
-        '''
-        status = [OK_STATUS]
-
-        status_h, _ = self.hotel.display_hotel_info(hotel_name)
-        status_c, _ = self.customer.display_customer_info(customer_no)
-
-        if (status_h + status_c) == OK_STATUS:
-            status, _ = self.hotel.cancel_hotel_reservation(
-                hotel_name,
-                room,
-                customer_no,
-                start_month,
-                start_day,
-                days
-            )
-            status = [status]
-        else:
-            status = [status_h, status_c]
-
-        return status, None
-
-    def error_message(self, status: int) -> str:
-        '''
-        Metodo para traducir errores.
-        '''
-        return {
-            OK_STATUS: 'OK',
-            DUPLICATE_CUSTOMER: 'Duplicate customer found.',
-            CUSTOMER_NOT_FOUND: 'Customer not found.',
-            CUSTOMER_ERROR_STATUS: 'Error processing customer request.',
-            CUSTOMER_INVALID_FIELD: 'Invalid field values.',
-            DUPLICATE_HOTEL: 'Duplicate hotel found.',
-            HOTEL_NOT_FOUND: 'Hotel not found.',
-            HOTEL_INVALID_FIELD: 'Invalid field values.',
-            HOTEL_ERROR_STATUS: 'Error processing hotel request.',
-            ROOM_NOT_FOUND: 'Room not found',
-            ROOM_NOT_AVAILABLE: 'Room not available.',
-            RESERVATION_NOT_FOUND: 'Reservation not found.'
-        }.get(status)
+'''
+Codigo fuente de la clase Reservation. Esta clase usa las clases Hotel y
+Customer, así como la clase Persistence
+
+La clase reservacion implementa los metodos create_reservation,
+create_reservation_any_room, cancel_reservation y list_reservations, asi como
+sus versiones por lote create_reservations y cancel_reservations
+
+Historia
+Fecha           Descripcion del cambio                      Author
+17-02-2024      Versión inicial                             A00260430
+18-10-2026      Consulta de reservaciones por cliente       A00260430
+18-10-2026      Reservaciones y cancelaciones por lote      A00260430
+18-10-2026      Reservaciones en cualquier anio             A00260430
+18-10-2026      Almacenamiento configurable (store)         A00260430
+18-10-2026      Reservacion con asignacion de habitacion    A00260430
+'''
+import datetime
+from hotel import Hotel, BEST_FIT
+from customer import Customer
+
+
+OK_STATUS = 0
+
+DUPLICATE_CUSTOMER = -101
+CUSTOMER_NOT_FOUND = -102
+CUSTOMER_ERROR_STATUS = -109
+CUSTOMER_INVALID_FIELD = -110
+CUSTOMER_VERSION_CONFLICT = -150
+DUPLICATE_HOTEL = -201
+HOTEL_NOT_FOUND = -202
+HOTEL_INVALID_FIELD = -210
+HOTEL_ERROR_STATUS = -209
+ROOM_NOT_FOUND = -220
+ROOM_NOT_AVAILABLE = -230
+RESERVATION_NOT_FOUND = -240
+VERSION_CONFLICT = -250
+
+
+class Reservation():
+    '''
+    Clase Reservation implementa los metodos publicos:
+    - create_reservation
+    - create_reservation_any_room
+    - cancel_reservation
+    - list_reservations
+    - create_reservations
+    - cancel_reservations
+    - is_dropped
+
+    Si no se reciben hotel o customer se crean con el store indicado (por
+    omision el de persistence.set_default_store).
+    '''
+
+    def __init__(
+            self,
+            hotel: Hotel = None,
+            customer: Customer = None,
+            store=None):
+        self.hotel = hotel if hotel is not None else Hotel(store=store)
+        self.customer = (
+            customer if customer is not None else Customer(store=store)
+        )
+
+    def create_reservation(
+            self,
+            customer_no: str,
+            hotel_name: str,
+            room: int,
+            start_month: int,
+            start_day: int,
+            days: int,
+            start_year: int = None) -> tuple[list[int], None]:
+        '''
+        metodo para crear una reservacion usando una estructura con los datos
+        del cliente y una estructura con los datos del hotel. Si no se indica
+        el anio se usa el presente anio.
+
+        Regresa una tupla (err, None)
+        '''
+        status = [OK_STATUS]
+
+        status_h, _ = self.hotel.display_hotel_info(hotel_name)
+        status_c, _ = self.customer.display_customer_info(customer_no)
+
+        if (status_h + status_c) == OK_STATUS:
+            status, _ = self.hotel.reserve_hotel_room(
+                hotel_name,
+                room,
+                customer_no,
+                start_month,
+                start_day,
+                days,
+                start_year
+            )
+            status = [status]
+        else:
+            status = [status_h, status_c]
+
+        return status, None
+
+    def create_reservation_any_room(
+            self,
+            customer_no: str,
+            hotel_name: str,
+            start_month: int,
+            start_day: int,
+            days: int,
+            start_year: int = None,
+            policy=BEST_FIT) -> tuple[list[int], int]:
+        '''
+        metodo para crear una reservacion en una habitacion libre elegida por
+        el hotel con la politica indicada ('first_fit', 'best_fit' o una
+        función, ver Hotel.reserve_any_room). Si no se indica el anio se usa
+        el presente anio.
+
+        Regresa una tupla (err, habitacion reservada o None)
+        '''
+        room = None
+
+        status_h, _ = self.hotel.display_hotel_info(hotel_name)
+        status_c, _ = self.customer.display_customer_info(customer_no)
+
+        if (status_h + status_c) == OK_STATUS:
+            status, room = self.hotel.reserve_any_room(
+                hotel_name,
+                customer_no,
+                start_month,
+                start_day,
+                days,
+                start_year,
+                policy
+            )
+            status = [status]
+        else:
+            status = [status_h, status_c]
+
+        return status, room
+
+    def cancel_reservation(
+            self,
+            customer_no: str,
+            hotel_name: str,
+            room: int,
+            start_month: int,
+            start_day: int,
+            days: int,
+            start_year: int = None) -> tuple[list[int], None]:
+        '''
+        metodo para crear una reservacio usando una estructura con los datos
+        del cliente y una estructura con los datos del hotel.
+
+        Regresa una tupla (err, None)
+        '''
+        status = [OK_STATUS]
+
+        status_h, _ = self.hotel.display_hotel_info(hotel_name)
+        status_c, _ = self.customer.display_customer_info(customer_no)
+
+        if (status_h + status_c) == OK_STATUS:
+            status, _ = self.hotel.cancel_hotel_reservation(
+                hotel_name,
+                room,
+                customer_no,
+                start_month,
+                start_day,
+                days,
+                start_year
+            )
+            status = [status]
+        else:
+            status = [status_h, status_c]
+
+        return status, None
+
+    def list_reservations(self, customer_no: str) -> tuple[list[int], list]:
+        '''
+        metodo para obtener las reservaciones de un cliente. La consulta usa
+        el indice inverso de clientes del hotel.
+
+        Regresa una tupla (err, lista de reservaciones)
+        '''
+        reservations = []
+
+        status_c, _ = self.customer.display_customer_info(customer_no)
+
+        if status_c == OK_STATUS:
+            status, reservations = self.hotel.list_customer_reservations(
+                customer_no
+            )
+            status = [status]
+        else:
+            status = [status_c]
+
+        return status, reservations
+
+    def create_reservations(self, reservations) -> tuple[list[list[int]], None]:
+        '''
+        metodo para crear un lote de reservaciones. Cada elemento es una
+        tupla con los argumentos de create_reservation (customer_no,
+        hotel_name, room, start_month, start_day, days y opcionalmente
+        start_year).
+
+        Todas las reservaciones se validan y aplican en memoria y se guardan
+        con una sola escritura al final.
+
+        Regresa una tupla (lista con el err de cada reservacion, None)
+        '''
+        return self._apply_batch(self.create_reservation, reservations)
+
+    def cancel_reservations(self, reservations) -> tuple[list[list[int]], None]:
+        '''
+        metodo para cancelar un lote de reservaciones. Cada elemento es una
+        tupla con los argumentos de cancel_reservation.
+
+        Regresa una tupla (lista con el err de cada cancelacion, None)
+        '''
+        return self._apply_batch(self.cancel_reservation, reservations)
+
+    def _apply_batch(self, operation, reservations) -> tuple[list[list[int]], None]:
+        '''
+        metodo privado para aplicar una operacion a cada elemento del lote
+        dentro de un lote de cambios del hotel. Si la escritura final falla su
+        err se reporta en los elementos que habian sido exitosos y el hotel
+        descarta los cambios del lote (ver Hotel.commit_batch). Si al
+        guardar se descartaron reservaciones que otro proceso ocupo (ver
+        Hotel.flush) solo esas se reportan como no disponibles.
+        '''
+        statuses = []
+        reservations = list(reservations)
+
+        self.hotel.begin_batch()
+        try:
+            for reservation in reservations:
+                status, _ = operation(*reservation)
+                statuses.append(status)
+        finally:
+            status_persist, dropped = self.hotel.commit_batch()
+
+        if status_persist == ROOM_NOT_AVAILABLE:
+            statuses = [
+                [ROOM_NOT_AVAILABLE]
+                if (status == [OK_STATUS] and operation == self.create_reservation
+                    and self.is_dropped(dropped, *reservation))
+                else status
+                for status, reservation in zip(statuses, reservations)
+            ]
+        elif status_persist != OK_STATUS:
+            statuses = [
+                [status_persist] if status == [OK_STATUS] else status
+                for status in statuses
+            ]
+
+        return statuses, None
+
+    @staticmethod
+    def is_dropped(
+            dropped: list,
+            customer_no: str,
+            hotel_name: str,
+            room: int,
+            start_month: int,
+            start_day: int,
+            days: int,
+            start_year: int = None) -> bool:
+        '''
+        metodo que indica si la reservacion (con los argumentos de
+        create_reservation) esta en la lista de reservaciones descartadas al
+        guardar un lote (ver Hotel.flush).
+        '''
+        if start_year is None:
+            start_year = datetime.date.today().year
+        start = datetime.date(start_year, start_month, start_day).toordinal()
+        for stay in dropped or []:
+            stay_start = datetime.date(
+                stay['year'], stay['start_month'], stay['start_day']
+            ).toordinal()
+            if ((stay['customer_no'], stay['hotel'], stay['room'])
+                    == (customer_no, hotel_name, room)
+                    and stay_start < start + days
+                    and start < stay_start + stay['days']):
+                return True
+        return False
+
+    def error_message(self, status: int) -> str:
+        '''
+        Metodo para traducir errores.
+        '''
+        return {
+            OK_STATUS: 'OK',
+            DUPLICATE_CUSTOMER: 'Duplicate customer found.',
+            CUSTOMER_NOT_FOUND: 'Customer not found.',
+            CUSTOMER_ERROR_STATUS: 'Error processing customer request.',
+            CUSTOMER_INVALID_FIELD: 'Invalid field values.',
+            CUSTOMER_VERSION_CONFLICT: 'Concurrent update, try again.',
+            DUPLICATE_HOTEL: 'Duplicate hotel found.',
+            HOTEL_NOT_FOUND: 'Hotel not found.',
+            HOTEL_INVALID_FIELD: 'Invalid field values.',
+            HOTEL_ERROR_STATUS: 'Error processing hotel request.',
+            ROOM_NOT_FOUND: 'Room not found',
+            ROOM_NOT_AVAILABLE: 'Room not available.',
+            RESERVATION_NOT_FOUND: 'Reservation not found.',
+            VERSION_CONFLICT: 'Concurrent update, try again.'
+        }.get(status)
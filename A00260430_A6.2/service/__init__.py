@@ -0,0 +1,5 @@
+'''
+Inicializando modulo.
+'''
+from .service import BookingService, BookingServer
+from .client import BookingClient
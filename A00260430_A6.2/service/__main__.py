@@ -0,0 +1,59 @@
+'''
+Punto de entrada del servicio de reservaciones:
+
+    python -m service --socket booking.sock
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+18-10-2026      Error si el socket no se puede abrir        A00260430
+'''
+import argparse
+import signal
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+from .service import BookingService, BookingServer, DEFAULT_SOCKET
+
+
+def _terminate(*_):
+    '''
+    Función que atiende SIGTERM igual que Ctrl-C.
+    '''
+    raise KeyboardInterrupt
+
+
+def main():
+    '''
+    Función principal: atiende solicitudes hasta recibir Ctrl-C (o SIGTERM)
+    y al terminar guarda los cambios pendientes.
+    '''
+    parser = argparse.ArgumentParser(description='Booking service')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET)
+    parser.add_argument('--shards', type=int, default=0)
+    parser.add_argument('--journaled', action='store_true')
+    arguments = parser.parse_args()
+    signal.signal(signal.SIGTERM, _terminate)
+
+    service = BookingService(Reservation(
+        Hotel(shards=arguments.shards, journaled=arguments.journaled),
+        Customer()
+    ))
+    try:
+        server = BookingServer(arguments.socket, service)
+    except OSError as error:
+        print(
+            '[ERROR] - An exception ocurred',
+            f'while opening socket {arguments.socket}: {error}'
+        )
+        return
+    with server:
+        print(f'[INFO] - Listening on {arguments.socket}')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == '__main__':
+    main()
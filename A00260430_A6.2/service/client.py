@@ -0,0 +1,93 @@
+'''
+Codigo fuente de la clase BookingClient, cliente del servicio de
+reservaciones (ver service.service para el protocolo).
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+'''
+import itertools
+import json
+import socket
+from .service import DEFAULT_SOCKET, METHODS, RECV_BYTES
+
+
+class BookingClient():
+    '''
+    Clase BookingClient. Cada metodo del servicio (create_reservation,
+    create_hotel, find_available_rooms, ...) se puede llamar como metodo del
+    cliente y regresa la misma tupla (err, valor) que el metodo local, con
+    las tuplas convertidas en listas por JSON.
+
+    Metodos publicos
+    + call - envia una solicitud y espera su respuesta
+    + call_many - envia varias solicitudes juntas y espera sus respuestas
+    + close - cierra la conexion
+    '''
+    def __init__(self, socket_path: str = DEFAULT_SOCKET):
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(socket_path)
+        self._ids = itertools.count(1)
+        self._buffer = b''
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getattr__(self, method: str):
+        if method not in METHODS:
+            raise AttributeError(method)
+        return lambda *args: self.call(method, *args)
+
+    def _read_response(self) -> list:
+        '''
+        Metodo privado que lee la siguiente linea de respuesta.
+        '''
+        while b'\n' not in self._buffer:
+            data = self.socket.recv(RECV_BYTES)
+            if not data:
+                raise ConnectionError('booking service closed the connection')
+            self._buffer += data
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return json.loads(line)
+
+    def call(self, method: str, *args) -> tuple:
+        '''
+        Metodo publico que envia una solicitud y espera su respuesta.
+
+        Regresa una tupla (err, valor)
+        '''
+        return self.call_many([(method, args)])[0]
+
+    def call_many(self, requests) -> list:
+        '''
+        Metodo publico que envia varias solicitudes (metodo, argumentos) sin
+        esperar entre ellas; el servicio las ejecuta como un grupo y las
+        guarda con una sola escritura.
+
+        Regresa la lista de tuplas (err, valor) en el orden de requests
+        '''
+        ids = []
+        lines = []
+        for method, args in requests:
+            request_id = next(self._ids)
+            ids.append(request_id)
+            lines.append(json.dumps(
+                [request_id, method, list(args)], separators=(',', ':')
+            ).encode('UTF-8') + b'\n')
+        self.socket.sendall(b''.join(lines))
+
+        responses = {}
+        for _ in ids:
+            request_id, status, value = self._read_response()
+            responses[request_id] = (status, value)
+
+        return [responses.get(request_id) for request_id in ids]
+
+    def close(self):
+        '''
+        Metodo publico para cerrar la conexion.
+        '''
+        self.socket.close()
@@ -0,0 +1,309 @@
+'''
+Codigo fuente del servicio de reservaciones. Un proceso de larga duracion es
+el unico dueño de los datos en memoria (Hotel, Customer y Reservation) y
+atiende solicitudes por un socket de dominio Unix, en lugar de que cada
+proceso cliente lea los archivos completos y compita por sus candados.
+
+Protocolo: una solicitud por linea, en JSON compacto
+    [id, metodo, [argumentos]]
+y una respuesta por linea, en el mismo orden
+    [id, err, valor]
+Un cliente puede enviar varias solicitudes sin esperar respuesta
+(pipelining). Las solicitudes que llegan juntas se ejecutan dentro de un
+lote de cambios del hotel y sus respuestas se envian despues de guardar el
+lote con una sola escritura. Una linea de mas de MAX_LINE_BYTES bytes no se
+ejecuta: se responde [null, REQUEST_TOO_LARGE, null] y se descarta.
+
+Historia
+Fecha           Descripcion del cambio                      Author
+18-10-2026      Version inicial                             A00260430
+18-10-2026      Reservacion con asignacion de habitacion    A00260430
+18-10-2026      Limite de linea y archivo del socket        A00260430
+'''
+import json
+import os
+import socketserver
+import stat
+from reservation import Reservation
+
+
+OK_STATUS = 0
+ROOM_NOT_AVAILABLE = -230
+UNKNOWN_METHOD = -301
+BAD_REQUEST = -302
+REQUEST_TOO_LARGE = -303
+DEFAULT_SOCKET = 'booking.sock'
+RECV_BYTES = 65536
+MAX_LINE_BYTES = 1048576
+
+# Metodos del servicio: objeto que lo atiende y si cambia hoteles (y por lo
+# tanto forma parte del lote de cambios)
+METHODS = {
+    'create_reservation': ('reservation', True),
+    'create_reservation_any_room': ('reservation', True),
+    'cancel_reservation': ('reservation', True),
+    'list_reservations': ('reservation', False),
+    'create_reservations': ('reservation', True),
+    'cancel_reservations': ('reservation', True),
+    'create_hotel': ('hotel', True),
+    'delete_hotel': ('hotel', True),
+    'display_hotel_info': ('hotel', False),
+    'modify_hotel_info': ('hotel', True),
+    'find_available_rooms': ('hotel', False),
+    'create_customer': ('customer', False),
+    'delete_customer': ('customer', False),
+    'display_customer_info': ('customer', False),
+    'modify_customer_info': ('customer', False),
+}
+
+
+def _failed_status(status, status_persist):
+    '''
+    Función privada que reemplaza los err exitosos de una respuesta (un err,
+    una lista con el err o una lista de listas en los lotes) por el err de la
+    escritura fallida.
+    '''
+    if status == OK_STATUS:
+        return status_persist
+    if status == [OK_STATUS]:
+        return [status_persist]
+    if isinstance(status, list) and status and isinstance(status[0], list):
+        return [_failed_status(item, status_persist) for item in status]
+    return status
+
+
+def _dropped_status(method: str, args: list, status, value, dropped: list):
+    '''
+    Función privada que regresa el err de una respuesta exitosa de
+    reservacion cuya reservacion se descarto al guardar el lote porque otro
+    proceso ocupo la habitacion (ver Hotel.flush).
+    '''
+    if method == 'create_reservation':
+        if status == [OK_STATUS] and Reservation.is_dropped(dropped, *args):
+            return [ROOM_NOT_AVAILABLE]
+    elif method == 'create_reservation_any_room':
+        if status == [OK_STATUS] and Reservation.is_dropped(
+                dropped, args[0], args[1], value, *args[2:6]):
+            return [ROOM_NOT_AVAILABLE]
+    elif method == 'create_reservations' and isinstance(status, list):
+        return [
+            [ROOM_NOT_AVAILABLE]
+            if (item == [OK_STATUS]
+                and Reservation.is_dropped(dropped, *reservation))
+            else item
+            for item, reservation in zip(status, args[0])
+        ]
+    return status
+
+
+class BookingService():
+    '''
+    Clase BookingService. Ejecuta las solicitudes del protocolo sobre una
+    instancia de Reservation (y sus Hotel y Customer).
+
+    Metodos publicos
+    + execute - ejecuta un grupo de solicitudes y regresa sus respuestas
+    + handle_lines - ejecuta lineas del protocolo y regresa las respuestas
+    + flush - guarda los cambios pendientes
+    '''
+    def __init__(self, reservation: Reservation = None, store=None):
+        self.reservation = (
+            reservation if reservation is not None else Reservation(store=store)
+        )
+        self.targets = {
+            'reservation': self.reservation,
+            'hotel': self.reservation.hotel,
+            'customer': self.reservation.customer
+        }
+
+    def _call(self, method, args) -> tuple:
+        '''
+        Metodo privado que ejecuta un metodo del servicio.
+
+        Regresa una tupla (err, valor)
+        '''
+        if method not in METHODS:
+            return UNKNOWN_METHOD, None
+        target, _ = METHODS[method]
+        try:
+            return getattr(self.targets[target], method)(*args)
+        except (TypeError, ValueError, KeyError, IndexError) as error:
+            print(
+                '[ERROR] - An exception ocurred',
+                f'while executing {method}: {error}'
+            )
+            return BAD_REQUEST, None
+
+    def execute(self, requests: list) -> list:
+        '''
+        Metodo publico que ejecuta un grupo de solicitudes [id, metodo,
+        argumentos] dentro de un lote de cambios del hotel, guardado con una
+        sola escritura al final. Si la escritura falla, su err se reporta en
+        las solicitudes que cambiaron hoteles y habian sido exitosas; si solo
+        se descartaron reservaciones que otro proceso ocupo, el err se reporta
+        solo en esas reservaciones.
+
+        Regresa la lista de respuestas [id, err, valor]
+        '''
+        responses = []
+        writes = []
+        calls = []
+        hotel = self.reservation.hotel
+
+        hotel.begin_batch()
+        try:
+            for request in requests:
+                if (not isinstance(request, list) or len(request) != 3
+                        or not isinstance(request[1], str)
+                        or not isinstance(request[2], list)):
+                    responses.append([None, BAD_REQUEST, None])
+                    writes.append(False)
+                    calls.append((None, None))
+                    continue
+                request_id, method, args = request
+                status, value = self._call(method, args)
+                responses.append([request_id, status, value])
+                writes.append(METHODS.get(method, (None, False))[1])
+                calls.append((method, args))
+        finally:
+            status_persist, dropped = hotel.commit_batch()
+
+        if status_persist == ROOM_NOT_AVAILABLE:
+            for response, (method, args) in zip(responses, calls):
+                response[1] = _dropped_status(
+                    method, args, response[1], response[2], dropped
+                )
+        elif status_persist != OK_STATUS:
+            for response, write in zip(responses, writes):
+                if write:
+                    response[1] = _failed_status(response[1], status_persist)
+
+        return responses
+
+    def handle_lines(self, lines: list) -> bytes:
+        '''
+        Metodo publico que ejecuta lineas del protocolo (bytes, una solicitud
+        por linea) como un grupo.
+
+        Regresa las lineas de respuesta
+        '''
+        requests = []
+        for line in lines:
+            try:
+                requests.append(json.loads(line))
+            except ValueError:
+                requests.append(None)
+
+        responses = self.execute(requests)
+
+        return b''.join(
+            json.dumps(response, separators=(',', ':')).encode('UTF-8') + b'\n'
+            for response in responses
+        )
+
+    def flush(self) -> tuple[int, None]:
+        '''
+        Metodo publico para guardar los cambios pendientes del hotel y de los
+        clientes.
+        '''
+        status_hotel, _ = self.reservation.hotel.flush()
+        status_customer, _ = self.reservation.customer.flush()
+        return min(status_hotel, status_customer), None
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    '''
+    Clase privada que atiende una conexion: cada vez que llegan datos se
+    ejecutan juntas todas las lineas completas recibidas. Si un grupo falla
+    con una excepcion se responde BAD_REQUEST a cada linea y la conexion
+    sigue abierta. Una linea de mas de MAX_LINE_BYTES se responde con
+    REQUEST_TOO_LARGE y se descarta hasta su fin de linea, sin guardarla
+    completa en memoria.
+    '''
+    def handle(self):
+        buffer = b''
+        skipping = False
+        while True:
+            data = self.request.recv(RECV_BYTES)
+            if not data:
+                break
+            buffer += data
+            *lines, buffer = buffer.split(b'\n')
+            if skipping:
+                # Resto de una linea demasiado larga ya respondida
+                if not lines:
+                    buffer = b''
+                    continue
+                lines = lines[1:]
+                skipping = False
+            group = []
+            for line in lines:
+                if len(line) > MAX_LINE_BYTES:
+                    self._respond(group)
+                    group = []
+                    self._reject(REQUEST_TOO_LARGE, 1)
+                elif line.strip():
+                    group.append(line)
+            self._respond(group)
+            if len(buffer) > MAX_LINE_BYTES:
+                self._reject(REQUEST_TOO_LARGE, 1)
+                buffer = b''
+                skipping = True
+
+    def _respond(self, lines: list):
+        '''
+        Ejecuta un grupo de lineas y envia sus respuestas.
+        '''
+        if not lines:
+            return
+        try:
+            responses = self.server.service.handle_lines(lines)
+        except Exception as error:
+            print(
+                '[ERROR] - An exception ocurred',
+                f'while handling requests: {error}'
+            )
+            self._reject(BAD_REQUEST, len(lines))
+            return
+        self.request.sendall(responses)
+
+    def _reject(self, status: int, count: int):
+        '''
+        Envia count respuestas [null, err, null].
+        '''
+        rejected = json.dumps(
+            [None, status, None], separators=(',', ':')
+        ).encode('UTF-8') + b'\n'
+        self.request.sendall(rejected * count)
+
+
+class BookingServer(socketserver.ThreadingUnixStreamServer):
+    '''
+    Clase BookingServer. Servidor de socket Unix, con un hilo por conexion,
+    que atiende las solicitudes con un BookingService compartido (Hotel y
+    Customer se pueden usar desde varios hilos).
+
+    Si ya existe un socket en socket_path (por ejemplo, de un servidor que
+    no termino bien) se borra; si existe otro tipo de archivo no se toca y
+    se lanza FileExistsError.
+    '''
+    daemon_threads = True
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, service=None):
+        if os.path.lexists(socket_path):
+            if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+                raise FileExistsError(f'{socket_path} exists and is not a socket')
+            os.remove(socket_path)
+        self.socket_path = socket_path
+        self.service = service if service is not None else BookingService()
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_close(self):
+        '''
+        Cierra el socket, borra su archivo y guarda los cambios pendientes.
+        '''
+        super().server_close()
+        if (os.path.lexists(self.socket_path)
+                and stat.S_ISSOCK(os.lstat(self.socket_path).st_mode)):
+            os.remove(self.socket_path)
+        self.service.flush()
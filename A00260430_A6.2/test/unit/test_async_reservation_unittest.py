@@ -0,0 +1,120 @@
+'''
+Programa de pruebas para la Clase AsyncReservation
+'''
+import asyncio
+import sys
+import threading
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import MemoryStore, new_executor, run_blocking
+from reservation import AsyncReservation
+
+
+class TestAsyncReservations(unittest.IsolatedAsyncioTestCase):
+    '''
+    Clase para probar reservaciones asincronas usando unittest
+    '''
+    async def asyncSetUp(self):
+        '''
+        Metodo para crear el ambiente para cada prueba
+        '''
+        self._reservation = AsyncReservation(store=MemoryStore())
+        await self._reservation.hotel.create_hotel('Async Inn', '9 Main St', 20)
+        _, self._cust_no = await self._reservation.customer.create_customer(
+            'JC', 'Romo', 'ID1', '5551', 1966
+        )
+
+    async def asyncTearDown(self):
+        '''
+        Metodo para limpiar la ejecucion de cada prueba
+        '''
+        self._reservation.close()
+
+    async def test_01_create_and_cancel(self):
+        '''
+        Metodo para probar creacion y cancelacion de reservacion
+        '''
+        self.assertEqual(
+            await self._reservation.create_reservation(
+                self._cust_no, 'Async Inn', 1, 1, 1, 5, 2026
+            ),
+            ([0], None)
+        )
+        status, reservations = await self._reservation.list_reservations(
+            self._cust_no
+        )
+        self.assertEqual((status, len(reservations)), ([0], 1))
+        self.assertEqual(
+            await self._reservation.cancel_reservation(
+                self._cust_no, 'Async Inn', 1, 1, 1, 5, 2026
+            ),
+            ([0], None)
+        )
+        self.assertEqual(
+            await self._reservation.hotel.find_available_rooms(
+                'Async Inn', 1, 1, 5, 2026
+            ),
+            (0, list(range(1, 21)))
+        )
+
+    async def test_02_concurrent_requests(self):
+        '''
+        Metodo para probar solicitudes concurrentes: una por habitacion y
+        varias por la misma habitacion, de las que solo una tiene exito.
+        '''
+        results = await asyncio.gather(*(
+            self._reservation.create_reservation(
+                self._cust_no, 'Async Inn', room, 2, 1, 3, 2026
+            )
+            for room in range(1, 21)
+        ), *(
+            self._reservation.create_reservation(
+                self._cust_no, 'Async Inn', 1, 3, 1, 3, 2026
+            )
+            for _ in range(10)
+        ))
+        self.assertEqual(results[:20], [([0], None)] * 20)
+        self.assertEqual(
+            sorted(status[0] for status, _ in results[20:]),
+            [-230] * 9 + [0]
+        )
+
+    async def test_03_executor_thread(self):
+        '''
+        Metodo para probar que las llamadas se ejecutan fuera del hilo del
+        ciclo de eventos.
+        '''
+        self.assertNotEqual(
+            await run_blocking(self._reservation.executor, threading.get_ident),
+            threading.get_ident()
+        )
+
+    async def test_04_parallel_calls(self):
+        '''
+        Metodo para probar que el executor ejecuta varias llamadas en
+        paralelo: cada una espera en la barrera a que lleguen las demas.
+        '''
+        barrier = threading.Barrier(4, timeout=5)
+        results = await asyncio.gather(*(
+            run_blocking(self._reservation.executor, barrier.wait)
+            for _ in range(4)
+        ))
+        self.assertEqual(sorted(results), [0, 1, 2, 3])
+
+    async def test_05_own_executor(self):
+        '''
+        Metodo para probar que se puede pasar un executor propio
+        '''
+        executor = new_executor('own', workers=2)
+        reservation = AsyncReservation(store=MemoryStore(), executor=executor)
+        self.assertIs(reservation.hotel.executor, executor)
+        self.assertIs(reservation.customer.executor, executor)
+        self.assertEqual(
+            await reservation.hotel.create_hotel('Own Inn', '1 Main St', 2),
+            (0, None)
+        )
+        reservation.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+'''
+Programa de pruebas para el formato binario de snapshots
+'''
+import os
+import sys
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import update_data_store, load_data_store
+from persistence import convert_data_store, BinarySnapshot
+from persistence.binary_snapshot import encode_snapshot, decode_snapshot
+from hotel import Hotel
+
+TEST_ENTITY = 'binary_test'
+TEST_DATA = {
+    'Pretoria Deluxe': {
+        'address': '125 Delmas Rd',
+        'rooms': 3,
+        '2026': {'1': [[0, 5, 'K1'], [10, 2, 'K2']], '3': [[364, 2, 'K1']]},
+        '2027': {'2': [[0, 1, 'K2']]}
+    },
+    'Durban Inn': {'address': '1 Beach Rd', 'rooms': 2}
+}
+
+
+class TestBinarySnapshot(unittest.TestCase):
+    '''
+    Clase para probar el formato binario de snapshots usando unittest
+    '''
+    def test_01_round_trip(self):
+        '''
+        Metodo para probar la conversion al formato binario y de regreso
+        '''
+        self.assertEqual(decode_snapshot(encode_snapshot(TEST_DATA)), TEST_DATA)
+        self.assertEqual(decode_snapshot(b''), {})
+
+    def test_02_mmap_queries(self):
+        '''
+        Metodo para probar las consultas directas con mmap
+        '''
+        update_data_store(TEST_ENTITY, TEST_DATA, 'binary')
+        with BinarySnapshot(TEST_ENTITY + '.bin') as snapshot:
+            self.assertEqual(
+                snapshot.hotel_info('Durban Inn'),
+                {'address': '1 Beach Rd', 'rooms': 2}
+            )
+            self.assertIsNone(snapshot.hotel_info('Missing'))
+            self.assertFalse(snapshot.is_free('Pretoria Deluxe', 2026, 1, 4, 2))
+            self.assertTrue(snapshot.is_free('Pretoria Deluxe', 2026, 1, 5, 5))
+            self.assertFalse(snapshot.is_free('Pretoria Deluxe', 2026, 3, 365, 1))
+            self.assertTrue(snapshot.is_free('Pretoria Deluxe', 2028, 1, 0, 366))
+
+    def test_03_convert(self):
+        '''
+        Metodo para probar la conversion de archivos entre JSON y binario
+        '''
+        update_data_store(TEST_ENTITY, TEST_DATA)
+        os.remove(TEST_ENTITY + '.bin')
+        self.assertEqual(convert_data_store(TEST_ENTITY, 'json', 'binary'), (0, None))
+        self.assertEqual(load_data_store(TEST_ENTITY, fmt='binary'), (0, TEST_DATA))
+        os.remove(TEST_ENTITY + '.json')
+        self.assertEqual(convert_data_store(TEST_ENTITY, 'binary', 'json'), (0, None))
+        self.assertEqual(load_data_store(TEST_ENTITY), (0, TEST_DATA))
+
+    def test_04_hotel_binary(self):
+        '''
+        Metodo para probar Hotel con snapshots en formato binario
+        '''
+        hotel = Hotel(fmt='binary')
+        self.assertEqual(hotel.create_hotel('Binary Inn', '7 Main St', 4), (0, None))
+        self.assertEqual(
+            hotel.reserve_hotel_room('Binary Inn', 2, 'K1', 3, 1, 4),
+            (0, None)
+        )
+        self.assertEqual(
+            Hotel(fmt='binary').find_available_rooms('Binary Inn', 3, 1, 4),
+            (0, [1, 3, 4])
+        )
+        self.assertEqual(hotel.delete_hotel('Binary Inn'), (0, None))
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        for file_name in (TEST_ENTITY + '.json', TEST_ENTITY + '.bin',
+                          TEST_ENTITY + '.lock', TEST_ENTITY + '.version',
+                          'hotel.bin'):
+            if os.path.isfile(file_name):
+                os.remove(file_name)
+
+if __name__ == '__main__':
+    unittest.main()
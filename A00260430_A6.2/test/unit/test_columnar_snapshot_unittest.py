@@ -0,0 +1,104 @@
+'''
+Programa de pruebas para el formato en columnas de clientes
+'''
+import os
+import sys
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import update_data_store, load_data_store, is_columns
+from persistence import convert_data_store, MemoryStore
+from persistence.columnar_snapshot import encode_columns, decode_columns
+from customer import Customer
+from customer.customer_columns import CustomerColumns
+
+TEST_ENTITY = 'columnar_test'
+TEST_DATA = {
+    'ID1|5551|1950': {
+        'names': 'Ana', 'surname': 'Lopez', 'id_doc_no': 'ID1',
+        'phone_no': '5551', 'year_dob': 1950
+    },
+    'ID2|5552|1990': {
+        'names': 'Luis', 'surname': 'Lopez', 'id_doc_no': 'ID2',
+        'phone_no': '5552', 'year_dob': 1990
+    },
+    'ID3|5553|1955': {
+        'names': 'Ana', 'surname': 'Núñez', 'id_doc_no': 'ID3',
+        'phone_no': '5553', 'year_dob': 1955
+    }
+}
+
+
+class TestColumnarSnapshot(unittest.TestCase):
+    '''
+    Clase para probar el formato en columnas usando unittest
+    '''
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        for extension in ('.json', '.col', '.lock', '.version'):
+            if os.path.exists(TEST_ENTITY + extension):
+                os.remove(TEST_ENTITY + extension)
+
+    def test_01_round_trip(self):
+        '''
+        Metodo para probar la conversion al formato en columnas y de regreso
+        '''
+        columns = decode_columns(encode_columns(TEST_DATA))
+        self.assertTrue(is_columns(columns))
+        self.assertEqual(columns['surname'], ['Lopez', 'Núñez'])
+        self.assertEqual(list(columns['surname_codes']), [0, 0, 1])
+        table = CustomerColumns.from_columns(columns)
+        self.assertEqual(
+            {key: record.to_dict() for key, record in table.items()}, TEST_DATA
+        )
+        empty = CustomerColumns.from_columns(decode_columns(encode_columns({})))
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(decode_columns(b''), {})
+
+    def test_02_convert(self):
+        '''
+        Metodo para probar la conversion de customer.json al formato en
+        columnas.
+        '''
+        update_data_store(TEST_ENTITY, TEST_DATA)
+        self.assertEqual(
+            convert_data_store(TEST_ENTITY, 'json', 'columnar'), (0, None)
+        )
+        status, columns = load_data_store(TEST_ENTITY, fmt='columnar')
+        self.assertEqual((status, columns['keys']), (0, list(TEST_DATA)))
+
+    def test_03_customer(self):
+        '''
+        Metodo para probar Customer con columnas: cambios, borrados,
+        consulta por anio de nacimiento y lectura del snapshot.
+        '''
+        store = MemoryStore()
+        customer = Customer(fmt='columnar', store=store)
+        self.assertIsInstance(customer.customer_dicc, CustomerColumns)
+        for customer_data in TEST_DATA.values():
+            customer.create_customer(*customer_data.values())
+        customer.modify_customer_info(
+            'ID2|5552|1990', 'Luis', 'Paz', 'ID2', '5552', 1990
+        )
+        customer.delete_customer('ID1|5551|1950')
+        self.assertEqual(
+            list(customer.list_customers_born_before(1960)[1]),
+            ['ID3|5553|1955']
+        )
+        self.assertTrue(is_columns(store.load('customer')[1]))
+
+        other = Customer(fmt='columnar', store=store)
+        self.assertEqual(
+            other.display_customer_info('ID2|5552|1990')[1]['surname'], 'Paz'
+        )
+        self.assertEqual(len(other.customer_dicc), 2)
+        self.assertEqual(
+            Customer(store=store).list_customers_born_before(1960),
+            (0, {'ID3|5553|1955': TEST_DATA['ID3|5553|1955']})
+        )
+
+if __name__ == '__main__':
+    unittest.main()
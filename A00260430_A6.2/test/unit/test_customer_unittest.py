@@ -1,133 +1,387 @@
-'''
-Programa de pruebas para la Clase Customer
-'''
-import sys
-import unittest
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from customer import Customer
-
-class TestCustomer(unittest.TestCase):
-    '''
-    Clase para probar Customer usando unittest
-    '''
-    @classmethod
-    def setUpClass(cls):
-        '''
-        Metodo para crear el ambiente para las pruebas
-        '''
-        cls._customer = Customer()
-
-    def test_01_create_customer(self):
-        '''
-        Metodo para probar creacion de cliente
-        '''
-        self.assertEqual(
-            self._customer.create_customer(
-                'JC',
-                'Romo',
-                'ID660616185',
-                '27832629691',
-                1966),
-            (0, 'ID660616185|27832629691|1966')
-        )
-
-    def test_02_create_duplicate_customer(self):
-        '''
-        Metodo para probar creacion de cliente duplicado
-        '''
-        self.assertEqual(
-            self._customer.create_customer(
-                'JC',
-                'Romo',
-                'ID660616185',
-                '27832629691',
-                1966),
-            (-101, None)
-        )
-
-    def test_03_modify_customer(self):
-        '''
-        Metodo para probar modificacion del cliente
-        ''' 
-        self.assertEqual(
-            self._customer.modify_customer_info(
-                'ID660616185|27832629691|1966',
-                'Juan Carlos',
-                'Romo',
-                'ID660616185',
-                '27832629691',
-                1966
-            ),
-            (
-                0,
-                {
-                    'names': 'Juan Carlos',
-                    'surname': 'Romo',
-                    'id_doc_no': 'ID660616185',
-                    'phone_no': '27832629691',
-                    'year_dob': 1966
-                }
-            )
-        )
-
-    def test_04_display_customer(self):
-        '''
-        Metodo para probar desplegado del cliente
-        '''
-        self.assertEqual(
-            self._customer.display_customer_info(
-                'ID660616185|27832629691|1966'
-            ),
-            (
-                0,
-                {
-                    'names': 'Juan Carlos',
-                    'surname': 'Romo',
-                    'id_doc_no': 'ID660616185',
-                    'phone_no': '27832629691',
-                    'year_dob': 1966
-                }
-            )
-        )
-
-    def test_05_modify_missing_customer(self):
-        '''
-        Metodo para probar modificacion de cliente no existente.
-        '''
-        self.assertEqual(
-            self._customer.modify_customer_info(
-                'ID660616184|27832629691|1966',
-                'Juan Carlos',
-                'Romo',
-                'ID660616185',
-                '27832629691',
-                1966),
-            (-102, {})
-        )
-
-    def test_06_display_missing_customer(self):
-        '''
-        Metodo para probar desplegado de cliente no existente.
-        '''
-
-        self.assertEqual(
-            self._customer.display_customer_info(
-                'ID660616184|27832629691|1966'
-            ),
-            (-102, {})
-        )
-
-    def test_07_delete_customer(self):
-        '''
-        Metodo para probar desplegado de cliente no existente.
-        '''
-        self.assertEqual(
-                self._customer.delete_customer(
-                    'ID660616185|27832629691|1966'
-                ),
-            (0, None)
-        )
-
-if __name__ == '__main__':
-    unittest.main()
+'''
+Programa de pruebas para la Clase Customer
+'''
+import os
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from customer import Customer
+from persistence import MemoryStore
+
+class TestCustomer(unittest.TestCase):
+    '''
+    Clase para probar Customer usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        cls._customer = Customer()
+
+    def test_01_create_customer(self):
+        '''
+        Metodo para probar creacion de cliente
+        '''
+        self.assertEqual(
+            self._customer.create_customer(
+                'JC',
+                'Romo',
+                'ID660616185',
+                '27832629691',
+                1966),
+            (0, 'ID660616185|27832629691|1966')
+        )
+
+    def test_02_create_duplicate_customer(self):
+        '''
+        Metodo para probar creacion de cliente duplicado
+        '''
+        self.assertEqual(
+            self._customer.create_customer(
+                'JC',
+                'Romo',
+                'ID660616185',
+                '27832629691',
+                1966),
+            (-101, None)
+        )
+
+    def test_03_modify_customer(self):
+        '''
+        Metodo para probar modificacion del cliente
+        ''' 
+        self.assertEqual(
+            self._customer.modify_customer_info(
+                'ID660616185|27832629691|1966',
+                'Juan Carlos',
+                'Romo',
+                'ID660616185',
+                '27832629691',
+                1966
+            ),
+            (
+                0,
+                {
+                    'names': 'Juan Carlos',
+                    'surname': 'Romo',
+                    'id_doc_no': 'ID660616185',
+                    'phone_no': '27832629691',
+                    'year_dob': 1966
+                }
+            )
+        )
+
+    def test_04_display_customer(self):
+        '''
+        Metodo para probar desplegado del cliente
+        '''
+        self.assertEqual(
+            self._customer.display_customer_info(
+                'ID660616185|27832629691|1966'
+            ),
+            (
+                0,
+                {
+                    'names': 'Juan Carlos',
+                    'surname': 'Romo',
+                    'id_doc_no': 'ID660616185',
+                    'phone_no': '27832629691',
+                    'year_dob': 1966
+                }
+            )
+        )
+
+    def test_05_modify_missing_customer(self):
+        '''
+        Metodo para probar modificacion de cliente no existente.
+        '''
+        self.assertEqual(
+            self._customer.modify_customer_info(
+                'ID660616184|27832629691|1966',
+                'Juan Carlos',
+                'Romo',
+                'ID660616185',
+                '27832629691',
+                1966),
+            (-102, {})
+        )
+
+    def test_06_display_missing_customer(self):
+        '''
+        Metodo para probar desplegado de cliente no existente.
+        '''
+
+        self.assertEqual(
+            self._customer.display_customer_info(
+                'ID660616184|27832629691|1966'
+            ),
+            (-102, {})
+        )
+
+    def test_07_delete_customer(self):
+        '''
+        Metodo para probar desplegado de cliente no existente.
+        '''
+        self.assertEqual(
+                self._customer.delete_customer(
+                    'ID660616185|27832629691|1966'
+                ),
+            (0, None)
+        )
+
+    def test_08_changes_from_other_instance(self):
+        '''
+        Metodo para probar que se leen los cambios guardados por otra
+        instancia (otro proceso).
+        '''
+        other = Customer()
+        self.assertEqual(
+            other.create_customer('Ana', 'Lopez', 'ID1', '5551', 1990),
+            (0, 'ID1|5551|1990')
+        )
+        self.assertEqual(
+            self._customer.display_customer_info('ID1|5551|1990')[1]['names'],
+            'Ana'
+        )
+        self.assertEqual(
+            self._customer.delete_customer('ID1|5551|1990'),
+            (0, None)
+        )
+        self.assertEqual(
+            other.display_customer_info('ID1|5551|1990'),
+            (-102, {})
+        )
+
+    def test_09_shared_between_threads(self):
+        '''
+        Metodo para probar una instancia compartida por varios hilos.
+        '''
+        customer = Customer(store=MemoryStore())
+        results = []
+
+        def create(thread_no):
+            for number in range(20):
+                results.append(customer.create_customer(
+                    'Ana', 'Lopez', 'ID%d' % number, '555%d' % thread_no, 1990
+                )[0])
+
+        threads = [
+            threading.Thread(target=create, args=(thread_no,))
+            for thread_no in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [0] * 80)
+        self.assertEqual(len(customer.customer_dicc), 80)
+
+    def test_10_import_customers(self):
+        '''
+        Metodo para probar la importacion masiva desde un archivo CSV con
+        renglones no validos y duplicados, validada en varios procesos.
+        '''
+        store = MemoryStore()
+        customer = Customer(store=store)
+        customer.create_customer('Ana', 'Lopez', 'ID0', '5550', 1990)
+        with open('import_test.csv', 'w', encoding='UTF-8') as file:
+            file.write('names,surname,id_doc_no,phone_no,year_dob\n')
+            for number in range(50):
+                file.write(f' Ana  Maria ,Lopez,ID{number},555{number},1990\n')
+            file.write('Ana,Lopez,ID-1,5551,1990\n')
+            file.write('Ana,Lopez,ID1,5551,1990\n')
+        try:
+            status, result = customer.import_customers(
+                'import_test.csv', workers=2, chunk_rows=8
+            )
+        finally:
+            os.remove('import_test.csv')
+
+        self.assertEqual(status, 0)
+        self.assertEqual(result, {
+            'created': 49,
+            'errors': [[1, -101], [51, -110], [52, -101]]
+        })
+        self.assertEqual(
+            Customer(store=store).display_customer_info('ID7|5557|1990')[1],
+            {
+                'names': 'Ana Maria',
+                'surname': 'Lopez',
+                'id_doc_no': 'ID7',
+                'phone_no': '5557',
+                'year_dob': 1990
+            }
+        )
+        self.assertEqual(
+            customer.import_customers([('Luis', 'Sol', 'ID9', '1', '1980')]),
+            (0, {'created': 1, 'errors': []})
+        )
+
+    def test_10_import_customers_errors(self):
+        '''
+        Metodo para probar la importacion desde JSON lines con un renglon mal
+        formado y desde un archivo que no existe.
+        '''
+        customer = Customer(store=MemoryStore())
+        with open('import_test.jsonl', 'w', encoding='UTF-8') as file:
+            file.write('["Ana", "Lopez", "ID1", "5551", 1990]\n')
+            file.write('{"names": "Luis", "surname"\n')
+            file.write('["Luis", "Sol", "ID2", "5552", 1980]\n')
+        try:
+            status, result = customer.import_customers('import_test.jsonl')
+        finally:
+            os.remove('import_test.jsonl')
+
+        self.assertEqual(
+            (status, result), (0, {'created': 2, 'errors': [[2, -110]]})
+        )
+        self.assertEqual(
+            customer.import_customers('missing_import_test.csv'),
+            (-109, {'created': 0, 'errors': []})
+        )
+
+    def test_10_import_customers_failed_write(self):
+        '''
+        Metodo para probar que si no se guarda la importacion no se reporta
+        ningun cliente creado y los clientes no quedan en memoria.
+        '''
+        store = MemoryStore()
+        customer = Customer(store=store)
+        customer._backoff = lambda attempt: None
+        commit = store.commit
+        store.commit = lambda *args, **kwargs: (-8, None)
+        self.assertEqual(
+            customer.import_customers([
+                ['Ana', 'Lopez', 'ID1', '5551', 1990],
+                ['Luis', 'Sol', 'ID2', '5552', 1980]
+            ]),
+            (-150, {'created': 0, 'errors': []})
+        )
+        store.commit = commit
+        self.assertEqual(customer.find_customers(surname='sol'), (0, {}))
+        self.assertEqual(customer.flush(), (0, None))
+        self.assertEqual(store.load('customer'), (0, {}))
+
+    def test_11_find_customers(self):
+        '''
+        Metodo para probar la busqueda por indices secundarios despues de
+        crear, modificar y borrar clientes.
+        '''
+        customer = Customer(store=MemoryStore())
+        _, romo = customer.create_customer('JC', 'Romo', 'ID1', '5551', 1966)
+        _, romo2 = customer.create_customer('Ana', 'Romo ', 'ID2', '5551', 1990)
+        _, paz = customer.create_customer('Luis', 'Páz', 'ID3', '5553', 1980)
+
+        self.assertEqual(
+            sorted(customer.find_customers(surname='ROMO')[1]), [romo, romo2]
+        )
+        self.assertEqual(
+            list(customer.find_customers(phone_no='5551', id_doc_no='ID2')[1]),
+            [romo2]
+        )
+        self.assertEqual(list(customer.find_customers(surname='paz')[1]), [paz])
+        self.assertEqual(customer.find_customers(names='JC'), (-110, {}))
+
+        customer.modify_customer_info(romo, 'JC', 'Lopez', 'ID1', '5551', 1966)
+        customer.delete_customer(paz)
+        self.assertEqual(list(customer.find_customers(surname='romo')[1]), [romo2])
+        self.assertEqual(list(customer.find_customers(surname='lopez')[1]), [romo])
+        self.assertEqual(customer.find_customers(phone_no='5553'), (0, {}))
+
+    def test_12_compact_records(self):
+        '''
+        Metodo para probar que en memoria los clientes son registros
+        compactos y que se guardan y regresan como diccionarios.
+        '''
+        store = MemoryStore()
+        customer = Customer(store=store)
+        _, customer_no = customer.create_customer('JC', 'Romo', 'ID1', '5551', 1966)
+        self.assertFalse(hasattr(customer.customer_dicc[customer_no], '__dict__'))
+        self.assertEqual(
+            store.load('customer')[1][customer_no]['surname'], 'Romo'
+        )
+        self.assertEqual(
+            Customer(store=store).display_customer_info(customer_no),
+            (0, {
+                'names': 'JC',
+                'surname': 'Romo',
+                'id_doc_no': 'ID1',
+                'phone_no': '5551',
+                'year_dob': 1966
+            })
+        )
+
+    def test_13_failed_write_discarded(self):
+        '''
+        Metodo para probar que un cambio que no se pudo guardar se descarta
+        de la memoria y no se guarda despues
+        '''
+        store = MemoryStore()
+        customer = Customer(store=store)
+        commit = store.commit
+        store.commit = lambda *args, **kwargs: (-9, None)
+        status, customer_no = customer.create_customer(
+            'JC', 'Romo', 'ID1', '5551', 1966
+        )
+        self.assertEqual(status, -9)
+        store.commit = commit
+        self.assertEqual(customer.display_customer_info(customer_no), (-102, {}))
+        self.assertEqual(customer.find_customers(surname='romo'), (0, {}))
+        self.assertEqual(customer.flush(), (0, None))
+        self.assertEqual(store.load('customer'), (0, {}))
+
+    def test_14_timed_flush_and_close(self):
+        '''
+        Metodo para probar que con flush_ms los cambios se guardan sin
+        esperar otro cambio y que close guarda los cambios pendientes.
+        '''
+        store = MemoryStore()
+        customer = Customer(flush_every=100, flush_ms=20, store=store)
+        _, first_no = customer.create_customer('JC', 'Romo', 'ID1', '5551', 1966)
+        self.assertEqual(store.load('customer'), (0, {}))
+        for _ in range(100):
+            if store.load('customer')[1]:
+                break
+            time.sleep(0.01)
+        self.assertIn(first_no, store.load('customer')[1])
+
+        customer = Customer(flush_every=100, store=store)
+        _, second_no = customer.create_customer('Ana', 'Paz', 'ID2', '5552', 1990)
+        self.assertNotIn(second_no, store.load('customer')[1])
+        self.assertEqual(customer.close(), (0, None))
+        self.assertIn(second_no, store.load('customer')[1])
+
+    def test_15_deferred_concurrent_writes(self):
+        '''
+        Metodo para probar que la escritura diferida de clientes no
+        reemplaza los clientes que otra instancia guardo despues
+        '''
+        store = MemoryStore()
+        deferred = Customer(flush_every=10, store=store)
+        _, first_no = deferred.create_customer('JC', 'Romo', 'ID1', '5551', 1966)
+        _, second_no = Customer(store=store).create_customer(
+            'Ana', 'Paz', 'ID2', '5552', 1990
+        )
+        self.assertEqual(deferred.flush(), (0, None))
+        customer = Customer(store=store)
+        self.assertEqual(customer.display_customer_info(first_no)[0], 0)
+        self.assertEqual(customer.display_customer_info(second_no)[0], 0)
+        self.assertEqual(deferred.display_customer_info(second_no)[0], 0)
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        for file_name in ('customer.lock', 'customer.version'):
+            if os.path.isfile(file_name):
+                os.remove(file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
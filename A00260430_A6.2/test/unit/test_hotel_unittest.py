@@ -1,132 +1,615 @@
-'''
-Programa de pruebas para la Clase Hotel
-'''
-import sys
-import unittest
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from hotel import Hotel
-
-class TestCustomer(unittest.TestCase):
-    '''
-    Clase para probar Customer usando unittest
-    '''
-    @classmethod
-    def setUpClass(cls):
-        '''
-        Metodo para crear el ambiente para las pruebas
-        '''
-        cls._hotel = Hotel()
-
-    def test_01_create_hotel(self):
-        '''
-        Metodo para probar creacion de hotel.
-        '''
-        self.assertEqual(
-            self._hotel.create_hotel(
-                'Pretoria Deluxe',
-                '125 Delmas Rd',
-                10
-            ),
-            (0, None)
-        )
-
-    def test_02_display_hotel(self):
-        '''
-        Metodo para probar desplegado de hotel.
-        '''
-        self.assertEqual(
-            self._hotel.display_hotel_info('Pretoria Deluxe'),
-            (
-                0,
-                {
-                    'name': 'Pretoria Deluxe',
-                    'address': '125 Delmas Rd',
-                    'rooms': 10
-                }
-            )
-        )
-
-    def test_03_display_hotel_missing(self):
-        '''
-        Metodo para probar desplegado de hotel no existente.
-        '''
-        self.assertEqual(
-            self._hotel.display_hotel_info('Pretoria Gen Z'),
-            (-202, {})
-        )
-
-    def test_04_modify_hotel(self):
-        '''
-        Metodo para probar modificacion de hotel.
-        '''
-        self.assertEqual(
-            self._hotel.modify_hotel_info('Pretoria Deluxe','135 Delmas Rd'),
-            (
-                0,
-                {
-                    'name': 'Pretoria Deluxe',
-                    'rooms': 10,
-                    'address': '135 Delmas Rd'
-                }
-            )
-        )
-
-    def test_05_reserve_room(self):
-        '''
-        Metodo para probar reservar habitacion de hotel.
-        '''
-        self.assertEqual(
-            self._hotel.reserve_hotel_room(
-                'Pretoria Deluxe',
-                1,
-                'ID660616185|27832629691|1966',
-                1,
-                1,
-                5
-            ),
-            (0, None)
-        )
-
-    def test_05_reserve_room_duplicate(self):
-        '''
-        Metodo para probar reservar habitacion de hotel duplicada.
-        '''
-        self.assertEqual(
-            self._hotel.reserve_hotel_room(
-                'Pretoria Deluxe',
-                1,
-                'ID660616185|27832629691|1966',
-                1,
-                1,
-                5
-            ),
-            (-230, None)
-        )
-
-    def test_05_reserve_room_duplicate(self):
-        '''
-        Metodo para probar reservar habitacion de hotel duplicada.
-        '''
-        self.assertEqual(
-            self._hotel.cancel_hotel_reservation(
-                'Pretoria Deluxe',
-                1,
-                'ID660616185|27832629691|1966',
-                1,
-                1,
-                5
-            ),
-            (0, None)
-        )
-
-    @classmethod
-    def tearDownClass(cls):
-        '''
-        Metodo para limpiar la ejecucion de las pruebas
-        '''
-        result, _ = cls._hotel.delete_hotel('Pretoria Deluxe')
-        print('\nHotel deletion', result, '\n')
-
-if __name__ == '__main__':
-    unittest.main()
+'''
+Programa de pruebas para la Clase Hotel
+'''
+import os
+import shutil
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from hotel import Hotel
+from persistence import MemoryStore
+
+
+class _CheckpointStore(MemoryStore):
+    '''
+    MemoryStore que pide compactar en cada escritura y que ejecuta
+    after_commit (una sola vez) despues de un commit, para simular la
+    escritura de otro proceso entre el commit y el checkpoint.
+    '''
+    def __init__(self):
+        super().__init__()
+        self.after_commit = None
+
+    def checkpoint_due(self, stamp: tuple) -> bool:
+        return True
+
+    def commit(self, *args, **kwargs) -> tuple[int, tuple]:
+        result = super().commit(*args, **kwargs)
+        after_commit, self.after_commit = self.after_commit, None
+        if after_commit is not None:
+            after_commit()
+        return result
+
+
+class TestCustomer(unittest.TestCase):
+    '''
+    Clase para probar Customer usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        cls._hotel = Hotel()
+
+    def test_01_create_hotel(self):
+        '''
+        Metodo para probar creacion de hotel.
+        '''
+        self.assertEqual(
+            self._hotel.create_hotel(
+                'Pretoria Deluxe',
+                '125 Delmas Rd',
+                10
+            ),
+            (0, None)
+        )
+
+    def test_02_display_hotel(self):
+        '''
+        Metodo para probar desplegado de hotel.
+        '''
+        self.assertEqual(
+            self._hotel.display_hotel_info('Pretoria Deluxe'),
+            (
+                0,
+                {
+                    'name': 'Pretoria Deluxe',
+                    'address': '125 Delmas Rd',
+                    'rooms': 10
+                }
+            )
+        )
+
+    def test_03_display_hotel_missing(self):
+        '''
+        Metodo para probar desplegado de hotel no existente.
+        '''
+        self.assertEqual(
+            self._hotel.display_hotel_info('Pretoria Gen Z'),
+            (-202, {})
+        )
+
+    def test_04_modify_hotel(self):
+        '''
+        Metodo para probar modificacion de hotel.
+        '''
+        self.assertEqual(
+            self._hotel.modify_hotel_info('Pretoria Deluxe','135 Delmas Rd'),
+            (
+                0,
+                {
+                    'name': 'Pretoria Deluxe',
+                    'rooms': 10,
+                    'address': '135 Delmas Rd'
+                }
+            )
+        )
+
+    def test_05_reserve_room(self):
+        '''
+        Metodo para probar reservar habitacion de hotel.
+        '''
+        self.assertEqual(
+            self._hotel.reserve_hotel_room(
+                'Pretoria Deluxe',
+                1,
+                'ID660616185|27832629691|1966',
+                1,
+                1,
+                5
+            ),
+            (0, None)
+        )
+
+    def test_05_reserve_room_duplicate(self):
+        '''
+        Metodo para probar reservar habitacion de hotel duplicada.
+        '''
+        self.assertEqual(
+            self._hotel.reserve_hotel_room(
+                'Pretoria Deluxe',
+                1,
+                'ID660616185|27832629691|1966',
+                1,
+                1,
+                5
+            ),
+            (-230, None)
+        )
+
+    def test_05_reserve_room_duplicate(self):
+        '''
+        Metodo para probar reservar habitacion de hotel duplicada.
+        '''
+        self.assertEqual(
+            self._hotel.cancel_hotel_reservation(
+                'Pretoria Deluxe',
+                1,
+                'ID660616185|27832629691|1966',
+                1,
+                1,
+                5
+            ),
+            (0, None)
+        )
+
+    def test_06_find_available_rooms(self):
+        '''
+        Metodo para probar consulta de habitaciones disponibles.
+        '''
+        self._hotel.reserve_hotel_room(
+            'Pretoria Deluxe',
+            2,
+            'ID660616185|27832629691|1966',
+            2,
+            1,
+            3
+        )
+        self.assertEqual(
+            self._hotel.find_available_rooms('Pretoria Deluxe', 2, 3, 5),
+            (0, [1, 3, 4, 5, 6, 7, 8, 9, 10])
+        )
+        self.assertEqual(
+            self._hotel.find_available_rooms('Pretoria Deluxe', 2, 4, 5),
+            (0, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+        )
+
+    def test_07_find_available_rooms_missing(self):
+        '''
+        Metodo para probar consulta de habitaciones de hotel no existente.
+        '''
+        self.assertEqual(
+            self._hotel.find_available_rooms('Pretoria Gen Z', 2, 1, 3),
+            (-202, [])
+        )
+
+    def test_08_failed_reserve_skips_write(self):
+        '''
+        Metodo para probar que una reservacion fallida no guarda cambios.
+        '''
+        version = self._hotel.version
+        self.assertEqual(
+            self._hotel.reserve_hotel_room(
+                'Pretoria Deluxe',
+                11,
+                'ID660616185|27832629691|1966',
+                2,
+                1,
+                3
+            ),
+            (-220, None)
+        )
+        self.assertEqual(self._hotel.version, version)
+
+    def test_09_deferred_flush(self):
+        '''
+        Metodo para probar la escritura diferida.
+        '''
+        self._hotel.flush_every = 2
+        self._hotel.modify_hotel_info('Pretoria Deluxe', '145 Delmas Rd')
+        self.assertEqual(Hotel().hotel_dicc['Pretoria Deluxe']['address'],
+                         '135 Delmas Rd')
+        self.assertEqual(self._hotel.flush(), (0, None))
+        self.assertEqual(Hotel().hotel_dicc['Pretoria Deluxe']['address'],
+                         '145 Delmas Rd')
+        self._hotel.flush_every = 1
+
+    def test_10_reserve_room_across_years(self):
+        '''
+        Metodo para probar reservar habitacion entre dos anios.
+        '''
+        self.assertEqual(
+            self._hotel.reserve_hotel_room(
+                'Pretoria Deluxe',
+                3,
+                'ID660616185|27832629691|1966',
+                12,
+                30,
+                4,
+                2030
+            ),
+            (0, None)
+        )
+        self.assertEqual(
+            self._hotel.find_available_rooms('Pretoria Deluxe', 1, 1, 1, 2031),
+            (0, [1, 2, 4, 5, 6, 7, 8, 9, 10])
+        )
+        self.assertEqual(
+            self._hotel.cancel_hotel_reservation(
+                'Pretoria Deluxe',
+                3,
+                'ID660616185|27832629691|1966',
+                12,
+                31,
+                3,
+                2030
+            ),
+            (0, None)
+        )
+        self.assertNotIn('2029', self._hotel.hotel_dicc['Pretoria Deluxe'])
+
+    def test_11_changes_from_other_instance(self):
+        '''
+        Metodo para probar que se leen los cambios guardados por otra
+        instancia (otro proceso).
+        '''
+        other = Hotel()
+        self.assertEqual(
+            other.reserve_hotel_room(
+                'Pretoria Deluxe',
+                5,
+                'ID660616185|27832629691|1966',
+                1,
+                1,
+                2,
+                2032
+            ),
+            (0, None)
+        )
+        self.assertEqual(
+            self._hotel.find_available_rooms('Pretoria Deluxe', 1, 1, 2, 2032),
+            (0, [1, 2, 3, 4, 6, 7, 8, 9, 10])
+        )
+        self.assertEqual(
+            self._hotel.modify_hotel_info('Pretoria Deluxe', '155 Delmas Rd')[0],
+            0
+        )
+        self.assertEqual(
+            other.display_hotel_info('Pretoria Deluxe')[1]['address'],
+            '155 Delmas Rd'
+        )
+        self.assertEqual(
+            other.find_available_rooms('Pretoria Deluxe', 1, 1, 2, 2032),
+            (0, [1, 2, 3, 4, 6, 7, 8, 9, 10])
+        )
+
+    def test_12_concurrent_writes(self):
+        '''
+        Metodo para probar que los cambios de dos instancias no se pierden
+        cuando escriben el mismo archivo sin volver a leerlo.
+        '''
+        deferred = Hotel(flush_every=10)
+        self.assertEqual(
+            deferred.reserve_hotel_room(
+                'Pretoria Deluxe', 7, 'K1', 2, 1, 3, 2032
+            ),
+            (0, None)
+        )
+        self.assertEqual(
+            self._hotel.reserve_hotel_room(
+                'Pretoria Deluxe', 8, 'K2', 2, 1, 3, 2032
+            ),
+            (0, None)
+        )
+        # El archivo cambio desde que deferred lo leyo: conflicto de version,
+        # se vuelve a leer y se aplica de nuevo el cambio pendiente
+        self.assertEqual(deferred.flush(), (0, None))
+        self.assertEqual(
+            Hotel().find_available_rooms('Pretoria Deluxe', 2, 1, 3, 2032),
+            (0, [1, 2, 3, 4, 5, 6, 9, 10])
+        )
+        self.assertEqual(
+            self._hotel.reserve_hotel_room(
+                'Pretoria Deluxe', 7, 'K2', 2, 2, 1, 2032
+            ),
+            (-230, None)
+        )
+
+    def test_13_reserve_room_year_limits(self):
+        '''
+        Metodo para probar reservaciones al final del ultimo anio valido.
+        '''
+        hotel = Hotel(store=MemoryStore())
+        hotel.create_hotel('Pretoria Deluxe', '125 Delmas Rd', 2)
+        self.assertEqual(
+            hotel.reserve_hotel_room('Pretoria Deluxe', 1, 'K1', 12, 31, 2, 9998),
+            (0, None)
+        )
+        self.assertEqual(
+            hotel.reserve_hotel_room('Pretoria Deluxe', 1, 'K1', 12, 30, 2, 9999),
+            (0, None)
+        )
+        self.assertEqual(
+            hotel.reserve_hotel_room('Pretoria Deluxe', 2, 'K1', 12, 31, 2, 9999),
+            (-210, None)
+        )
+        self.assertEqual(
+            hotel.reserve_hotel_room('Pretoria Deluxe', 2, 'K1', 1, 1, 1, 10000),
+            (-210, None)
+        )
+
+    def test_14_reserve_any_room_bad_policy(self):
+        '''
+        Metodo para probar que se rechaza la habitacion de una politica que
+        no es una de las habitaciones libres.
+        '''
+        hotel = Hotel(store=MemoryStore())
+        hotel.create_hotel('Pretoria Deluxe', '125 Delmas Rd', 2)
+        hotel.reserve_hotel_room('Pretoria Deluxe', 1, 'K1', 1, 1, 2, 2030)
+        for room in (0, 1, 3, None):
+            self.assertEqual(
+                hotel.reserve_any_room(
+                    'Pretoria Deluxe', 'K2', 1, 1, 2, 2030,
+                    policy=lambda *args, room=room: room
+                ),
+                (-230, None)
+            )
+        self.assertEqual(hotel.list_customer_reservations('K2'), (0, []))
+        self.assertEqual(
+            hotel.find_available_rooms('Pretoria Deluxe', 1, 1, 2, 2030),
+            (0, [2])
+        )
+
+    def test_15_timed_flush_and_close(self):
+        '''
+        Metodo para probar que con flush_ms los cambios se guardan sin
+        esperar otro cambio y que close guarda los cambios pendientes.
+        '''
+        store = MemoryStore()
+        hotel = Hotel(flush_every=100, flush_ms=20, store=store)
+        hotel.create_hotel('Pretoria Deluxe', '125 Delmas Rd', 2)
+        self.assertEqual(store.load('hotel'), (0, {}))
+        for _ in range(100):
+            if store.load('hotel')[1]:
+                break
+            time.sleep(0.01)
+        self.assertIn('Pretoria Deluxe', store.load('hotel')[1])
+
+        hotel = Hotel(flush_every=100, store=store)
+        hotel.modify_hotel_info('Pretoria Deluxe', '135 Delmas Rd')
+        self.assertEqual(hotel._timer, None)
+        self.assertEqual(
+            store.load('hotel')[1]['Pretoria Deluxe']['address'],
+            '125 Delmas Rd'
+        )
+        self.assertEqual(hotel.close(), (0, None))
+        self.assertEqual(
+            store.load('hotel')[1]['Pretoria Deluxe']['address'],
+            '135 Delmas Rd'
+        )
+
+    def test_16_checkpoint_after_other_write(self):
+        '''
+        Metodo para probar que el checkpoint no reemplaza lo que otra
+        instancia escribio despues del commit
+        '''
+        store = _CheckpointStore()
+        first = Hotel(journaled=True, store=store)
+        first.create_hotel('Memory Inn', '5 Main St', 3)
+        second = Hotel(journaled=True, store=store)
+        store.after_commit = lambda: second.reserve_hotel_room(
+            'Memory Inn', 2, 'C2', 3, 10, 5, 2026
+        )
+        self.assertEqual(
+            first.reserve_hotel_room('Memory Inn', 1, 'C1', 3, 10, 5, 2026),
+            (0, None)
+        )
+        self.assertEqual(
+            Hotel(journaled=True, store=store).find_available_rooms(
+                'Memory Inn', 3, 10, 5, 2026
+            ),
+            (0, [3])
+        )
+        self.assertEqual(
+            first.find_available_rooms('Memory Inn', 3, 10, 5, 2026), (0, [3])
+        )
+
+    def test_17_stale_customer_index(self):
+        '''
+        Metodo para probar que el indice de clientes se crea de nuevo si no
+        corresponde a los calendarios guardados
+        '''
+        for shards in (0, 4):
+            store = MemoryStore()
+            hotel = Hotel(shards=shards, store=store)
+            hotel.create_hotel('Memory Inn', '5 Main St', 3)
+            hotel.reserve_hotel_room('Memory Inn', 1, 'K1', 3, 10, 2, 2026)
+            entity = hotel._entity('Memory Inn')
+            index_entity = 'hotel_customer' if not shards else \
+                hotel.index_shards[entity]
+            _, index_data = store.load(index_entity)
+            self.assertEqual(index_data['stamp'], list(store.stamp(entity)))
+            # Otro programa cambia los calendarios sin cambiar el indice
+            _, data = store.load(entity)
+            data['Memory Inn']['2026'] = {'2': [[70, 2, 'K2']]}
+            store.update(entity, data)
+            for lazy in (False, True):
+                other = Hotel(shards=shards, lazy=lazy, store=store)
+                self.assertEqual(other.list_customer_reservations('K1'), (0, []))
+                self.assertEqual(
+                    len(other.list_customer_reservations('K2')[1]), 1
+                )
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        result, _ = cls._hotel.delete_hotel('Pretoria Deluxe')
+        print('\nHotel deletion', result, '\n')
+        for file_name in ('hotel.lock', 'hotel.version', 'hotel_customer.json',
+                          'hotel_customer.lock', 'hotel_customer.version'):
+            if os.path.isfile(file_name):
+                os.remove(file_name)
+
+class TestShardedHotel(unittest.TestCase):
+    '''
+    Clase para probar Hotel con archivos divididos en shards
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        cls._hotel = Hotel(shards=4)
+
+    def test_01_create_hotels(self):
+        '''
+        Metodo para probar creacion de hoteles en shards.
+        '''
+        for name in ('Pretoria Deluxe', 'Pretoria Gen Z', 'Durban Inn'):
+            self.assertEqual(
+                self._hotel.create_hotel(name, '125 Delmas Rd', 10),
+                (0, None)
+            )
+
+    def test_02_reserve_room(self):
+        '''
+        Metodo para probar que una reservacion se lee desde los shards.
+        '''
+        self.assertEqual(
+            self._hotel.reserve_hotel_room(
+                'Durban Inn',
+                1,
+                'ID660616185|27832629691|1966',
+                1,
+                1,
+                5
+            ),
+            (0, None)
+        )
+        hotel = Hotel(shards=4)
+        self.assertEqual(
+            sorted(hotel.hotel_dicc),
+            ['Durban Inn', 'Pretoria Deluxe', 'Pretoria Gen Z']
+        )
+        self.assertEqual(
+            hotel.find_available_rooms('Durban Inn', 1, 1, 5),
+            (0, [2, 3, 4, 5, 6, 7, 8, 9, 10])
+        )
+
+    def test_03_lazy_loading(self):
+        '''
+        Metodo para probar la carga bajo demanda de los shards.
+        '''
+        hotel = Hotel(shards=4, lazy=True)
+        self.assertEqual(
+            hotel.display_hotel_info('Durban Inn'),
+            (0, {'name': 'Durban Inn', 'address': '125 Delmas Rd', 'rooms': 10})
+        )
+        self.assertEqual(len(hotel._loaded_shards), 0)
+        self.assertEqual(
+            hotel.find_available_rooms('Durban Inn', 1, 1, 5),
+            (0, [2, 3, 4, 5, 6, 7, 8, 9, 10])
+        )
+        self.assertEqual(len(hotel._loaded_shards), 1)
+
+    def test_04_changes_from_other_instance(self):
+        '''
+        Metodo para probar que se vuelve a leer el shard que cambio otra
+        instancia (otro proceso).
+        '''
+        other = Hotel(shards=4)
+        self.assertEqual(
+            self._hotel.reserve_hotel_room(
+                'Durban Inn',
+                2,
+                'ID660616185|27832629691|1966',
+                1,
+                1,
+                5
+            ),
+            (0, None)
+        )
+        self.assertEqual(
+            other.find_available_rooms('Durban Inn', 1, 1, 5),
+            (0, [3, 4, 5, 6, 7, 8, 9, 10])
+        )
+        self.assertEqual(
+            len(other.list_customer_reservations(
+                'ID660616185|27832629691|1966'
+            )[1]),
+            2
+        )
+
+    def test_05_shared_between_threads(self):
+        '''
+        Metodo para probar una instancia compartida por varios hilos: cada
+        hilo reserva su habitacion en todos los hoteles y todos compiten por
+        la habitacion 1; ninguna reservacion se pierde ni se duplica.
+        '''
+        store = MemoryStore()
+        hotel = Hotel(shards=4, store=store)
+        names = ['Hotel %d' % number for number in range(6)]
+        for name in names:
+            hotel.create_hotel(name, '125 Delmas Rd', 10)
+        results = []
+
+        def book(thread_no):
+            for day, name in enumerate(names * 3, 1):
+                results.append(hotel.reserve_hotel_room(
+                    name, 1, 'K%d' % thread_no, 3, day, 1, 2030
+                )[0])
+                results.append(hotel.reserve_hotel_room(
+                    name, thread_no + 2, 'K%d' % thread_no, 3, day, 1, 2030
+                )[0])
+                hotel.find_available_rooms(name, 3, day, 1, 2030)
+
+        threads = [
+            threading.Thread(target=book, args=(thread_no,))
+            for thread_no in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results.count(0), 8 * 18 + 18)
+        self.assertEqual(results.count(-230), 7 * 18)
+        other = Hotel(shards=4, store=store)
+        for name in names:
+            self.assertEqual(
+                other.find_available_rooms(name, 3, 1, 18, 2030),
+                (0, [10])
+            )
+        self.assertEqual(
+            sum(len(other.list_customer_reservations('K%d' % thread_no)[1])
+                for thread_no in range(8)),
+            8 * 18 + 18
+        )
+
+    def test_06_header_from_two_instances(self):
+        '''
+        Metodo para probar que dos instancias que crean hoteles en shards
+        distintos no se borran los datos generales en hotel_header.json.
+        '''
+        first = Hotel(shards=4)
+        second = Hotel(shards=4)
+        self.assertEqual(first.create_hotel('Alpha', '1 Main St', 5), (0, None))
+        self.assertEqual(second.create_hotel('Beta', '2 Main St', 5), (0, None))
+        hotel = Hotel(shards=4, lazy=True)
+        for name in ('Alpha', 'Beta'):
+            self.assertEqual(hotel.display_hotel_info(name)[0], 0)
+        self.assertEqual(
+            hotel.find_available_rooms('Alpha', 1, 1, 5),
+            (0, [1, 2, 3, 4, 5])
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        shutil.rmtree('hotel.d', ignore_errors=True)
+        shutil.rmtree('hotel_customer.d', ignore_errors=True)
+        for file_name in ('hotel_header.json', 'hotel_header.lock',
+                          'hotel_header.version'):
+            if os.path.isfile(file_name):
+                os.remove(file_name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+'''
+Programa de pruebas para la Clase IntervalIndex
+'''
+import sys
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from hotel.interval_index import IntervalIndex
+
+class TestIntervalIndex(unittest.TestCase):
+    '''
+    Clase para probar IntervalIndex usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        cls._index = IntervalIndex(3)
+        cls._index.add(1, 10, 15)
+        cls._index.add(1, 20, 25)
+        cls._index.add(2, 12, 13)
+
+    def test_01_is_free(self):
+        '''
+        Metodo para probar la consulta de una habitacion
+        '''
+        self.assertTrue(self._index.is_free(1, 15, 20))
+        self.assertFalse(self._index.is_free(1, 14, 16))
+        self.assertFalse(self._index.is_free(1, 5, 30))
+        self.assertTrue(self._index.is_free(3, 0, 400))
+
+    def test_02_free_rooms(self):
+        '''
+        Metodo para probar la consulta de habitaciones libres
+        '''
+        self.assertEqual(self._index.free_rooms(12, 13), [3])
+        self.assertEqual(self._index.free_rooms(15, 20), [1, 2, 3])
+
+    def test_03_remove_partial(self):
+        '''
+        Metodo para probar quitar parte de un rango
+        '''
+        self._index.remove(1, 11, 13)
+        self.assertEqual(self._index.starts[0], [10, 13, 20])
+        self.assertEqual(self._index.ends[0], [11, 15, 25])
+        self.assertTrue(self._index.is_free(1, 11, 13))
+
+if __name__ == '__main__':
+    unittest.main()
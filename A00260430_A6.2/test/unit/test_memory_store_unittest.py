@@ -0,0 +1,108 @@
+'''
+Programa de pruebas para el store en memoria
+'''
+import sys
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import MemoryStore, VERSION_CONFLICT
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+
+
+class TestMemoryStore(unittest.TestCase):
+    '''
+    Clase para probar MemoryStore usando unittest
+    '''
+    def setUp(self):
+        '''
+        Metodo para crear un store vacio para cada prueba
+        '''
+        self._store = MemoryStore()
+
+    def test_01_reservation(self):
+        '''
+        Metodo para probar Hotel, Customer y Reservation en memoria
+        '''
+        reservation = Reservation(store=self._store)
+        self.assertEqual(
+            reservation.hotel.create_hotel('Memory Inn', '5 Main St', 3),
+            (0, None)
+        )
+        status, customer_no = reservation.customer.create_customer(
+            'JC', 'Romo', 'ID1', '5551', 1966
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            reservation.create_reservation(
+                customer_no, 'Memory Inn', 2, 3, 10, 5, 2026
+            ),
+            ([0], None)
+        )
+        self.assertEqual(
+            Hotel(store=self._store).find_available_rooms(
+                'Memory Inn', 3, 10, 5, 2026
+            ),
+            (0, [1, 3])
+        )
+        self.assertEqual(
+            Customer(store=self._store).display_customer_info(customer_no)[0],
+            0
+        )
+        self.assertEqual(
+            Hotel(store=MemoryStore()).display_hotel_info('Memory Inn')[0],
+            -202
+        )
+
+    def test_02_concurrent_writes(self):
+        '''
+        Metodo para probar que los cambios de dos instancias con el mismo
+        store no se pierden.
+        '''
+        hotel = Hotel(store=self._store)
+        hotel.create_hotel('Memory Inn', '5 Main St', 3)
+        deferred = Hotel(flush_every=10, store=self._store)
+        deferred.reserve_hotel_room('Memory Inn', 1, 'K1', 2, 1, 3, 2026)
+        hotel.reserve_hotel_room('Memory Inn', 2, 'K2', 2, 1, 3, 2026)
+        self.assertEqual(deferred.flush(), (0, None))
+        self.assertEqual(
+            Hotel(store=self._store).find_available_rooms(
+                'Memory Inn', 2, 1, 3, 2026
+            ),
+            (0, [3])
+        )
+
+    def test_03_journaled_and_shards(self):
+        '''
+        Metodo para probar los modos con diario y con shards en memoria
+        '''
+        hotel = Hotel(journaled=True, shards=4, store=self._store)
+        for name in ('Memory Inn', 'Memory Lodge'):
+            self.assertEqual(hotel.create_hotel(name, '5 Main St', 2), (0, None))
+        hotel.reserve_hotel_room('Memory Lodge', 2, 'K1', 1, 1, 2, 2026)
+        self.assertEqual(
+            Hotel(journaled=True, shards=4, store=self._store).find_available_rooms(
+                'Memory Lodge', 1, 1, 2, 2026
+            ),
+            (0, [1])
+        )
+
+    def test_04_commit_conflict(self):
+        '''
+        Metodo para probar la escritura condicional y la copia de los datos
+        '''
+        data = {'a': {'b': 1}}
+        stamp = self._store.stamp('memory_test')
+        status, new_stamp = self._store.commit('memory_test', stamp, data=data)
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            self._store.commit('memory_test', stamp, data={}),
+            (VERSION_CONFLICT, new_stamp)
+        )
+        data['a']['b'] = 2
+        self.assertEqual(self._store.load('memory_test'), (0, {'a': {'b': 1}}))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+'''
+Programa de pruebas para la Clase OccupancyAnalytics
+'''
+import sys
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import MemoryStore
+from hotel import Hotel
+from analytics import OccupancyAnalytics
+from analytics.occupancy import numpy
+
+
+class TestOccupancyAnalytics(unittest.TestCase):
+    '''
+    Clase para probar los reportes de ocupacion usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas: un hotel de 4
+        cuartos con reservaciones en 2026 y una que cruza a 2027.
+        '''
+        hotel = Hotel(store=MemoryStore())
+        hotel.create_hotel('Stats Inn', '1 Main St', 4)
+        hotel.create_hotel('Empty Inn', '2 Main St', 2)
+        hotel.reserve_hotel_room('Stats Inn', 1, 'K1', 1, 1, 7, 2026)
+        hotel.reserve_hotel_room('Stats Inn', 2, 'K2', 1, 3, 2, 2026)
+        hotel.reserve_hotel_room('Stats Inn', 3, 'K1', 1, 3, 2, 2026)
+        hotel.reserve_hotel_room('Stats Inn', 4, 'K2', 12, 30, 4, 2026)
+        cls._analytics = OccupancyAnalytics(hotel)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_01_occupancy_rates(self):
+        '''
+        Metodo para probar las tasas de ocupacion por dia, semana y mes
+        '''
+        status, days = self._analytics.occupancy_by_day('Stats Inn', 2026)
+        self.assertEqual((status, len(days)), (0, 365))
+        self.assertEqual(days[:8], [0.25, 0.25, 0.75, 0.75, 0.25, 0.25, 0.25, 0])
+        self.assertEqual(days[-2:], [0.25, 0.25])
+        status, weeks = self._analytics.occupancy_by_week('Stats Inn', 2026)
+        self.assertEqual((status, len(weeks)), (0, 53))
+        self.assertEqual(weeks[0], 11 / 28)
+        self.assertEqual(weeks[-1], 0.25)
+        status, months = self._analytics.occupancy_by_month('Stats Inn', 2026)
+        self.assertEqual(months[0], 11 / 124)
+        self.assertEqual(months[11], 2 / 124)
+        self.assertEqual(self._analytics.nights_sold('Stats Inn', 2027), (0, 2))
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_02_stays_and_customers(self):
+        '''
+        Metodo para probar dias pico, estancias y noches por cliente
+        '''
+        self.assertEqual(
+            self._analytics.peak_days('Stats Inn', 2026, 3),
+            (0, [['2026-01-03', 3], ['2026-01-04', 3], ['2026-01-01', 1]])
+        )
+        self.assertEqual(
+            self._analytics.length_of_stay_histogram('Stats Inn', 2026),
+            (0, {2: 3, 7: 1})
+        )
+        self.assertEqual(
+            self._analytics.customer_nights('Stats Inn', 2026),
+            (0, {'K1': 9, 'K2': 4})
+        )
+        self.assertEqual(
+            self._analytics.utilization(2026),
+            (0, {'Empty Inn': 0.0, 'Stats Inn': 13 / 1460})
+        )
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_03_errors(self):
+        '''
+        Metodo para probar hotel inexistente y anio no valido
+        '''
+        self.assertEqual(self._analytics.nights_sold('Missing', 2026), (-202, 0))
+        self.assertEqual(self._analytics.occupancy_by_day('Stats Inn', 0), (-410, []))
+
+    @unittest.skipIf(numpy is not None, 'numpy is installed')
+    def test_04_numpy_not_available(self):
+        '''
+        Metodo para probar los reportes sin numpy
+        '''
+        self.assertEqual(self._analytics.nights_sold('Stats Inn', 2026), (-401, 0))
+
+if __name__ == '__main__':
+    unittest.main()
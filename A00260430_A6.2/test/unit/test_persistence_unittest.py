@@ -0,0 +1,202 @@
+'''
+Programa de pruebas para el modulo Persistence
+'''
+import os
+import sys
+import threading
+import unittest
+from pathlib import Path
+from filelock import FileLock, Timeout
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import update_data_store, load_data_store
+from persistence import append_journal, checkpoint_data_store
+from persistence import set_fsync_policy, FSYNC_NONE, FSYNC_COMMIT, FSYNC_GROUP
+from persistence import read_lock, data_store_stamp, commit_data_store
+from persistence import FileStore, JOURNAL_MAX_BYTES
+
+TEST_ENTITY = 'persistence_test'
+
+
+def rebuild(data, records):
+    '''
+    Funcion para reconstruir el estado con registros ['put', llave, valor]
+    '''
+    for record in records:
+        data[record[1]] = record[2]
+    return data
+
+
+class TestPersistence(unittest.TestCase):
+    '''
+    Clase para probar Persistence usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        update_data_store(TEST_ENTITY, {'a': 1})
+
+    def test_01_append_journal(self):
+        '''
+        Metodo para probar agregar registros al diario
+        '''
+        status, size = append_journal(TEST_ENTITY, [['put', 'b', 2]])
+        self.assertEqual(status, 0)
+        self.assertGreater(size, 0)
+
+    def test_02_load_with_journal(self):
+        '''
+        Metodo para probar la reconstruccion desde snapshot y diario
+        '''
+        self.assertEqual(
+            load_data_store(TEST_ENTITY, rebuild),
+            (0, {'a': 1, 'b': 2})
+        )
+        self.assertEqual(load_data_store(TEST_ENTITY), (0, {'a': 1}))
+
+    def test_03_checkpoint(self):
+        '''
+        Metodo para probar la compactacion del diario
+        '''
+        status, thread = checkpoint_data_store(TEST_ENTITY, {'a': 1, 'b': 2})
+        self.assertEqual(status, 0)
+        thread.join()
+        self.assertFalse(os.path.isfile(TEST_ENTITY + '.journal'))
+        self.assertFalse(os.path.isfile(TEST_ENTITY + '.journal.1'))
+        self.assertEqual(load_data_store(TEST_ENTITY), (0, {'a': 1, 'b': 2}))
+
+    def test_04_fsync_commit(self):
+        '''
+        Metodo para probar la escritura con fsync en cada cambio
+        '''
+        self.assertEqual(set_fsync_policy(FSYNC_COMMIT), (0, None))
+        self.assertEqual(update_data_store(TEST_ENTITY, {'c': 3}), (0, None))
+        self.assertEqual(append_journal(TEST_ENTITY, [['put', 'd', 4]])[0], 0)
+        self.assertEqual(
+            load_data_store(TEST_ENTITY, rebuild),
+            (0, {'c': 3, 'd': 4})
+        )
+        self.assertFalse(os.path.isfile(TEST_ENTITY + '.json.tmp'))
+        self.assertEqual(set_fsync_policy('always'), (-9, None))
+
+    def test_05_group_commit(self):
+        '''
+        Metodo para probar el group commit con escrituras concurrentes
+        '''
+        self.assertEqual(set_fsync_policy(FSYNC_GROUP, 20), (0, None))
+        entities = [f'{TEST_ENTITY}_{number}' for number in range(4)]
+        threads = [
+            threading.Thread(
+                target=update_data_store, args=(entity, {'entity': entity})
+            )
+            for entity in entities
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        set_fsync_policy(FSYNC_NONE, 2)
+        for entity in entities:
+            self.assertEqual(load_data_store(entity), (0, {'entity': entity}))
+            for suffix in ('.json', '.lock', '.version'):
+                os.remove(entity + suffix)
+
+    def test_06_shared_readers(self):
+        '''
+        Metodo para probar que los lectores comparten el candado y que una
+        escritura espera a que terminen
+        '''
+        with read_lock(TEST_ENTITY):
+            self.assertEqual(load_data_store(TEST_ENTITY), (0, {'c': 3}))
+            with self.assertRaises(Timeout):
+                FileLock(TEST_ENTITY + '.lock', timeout=0.05).acquire()
+        lock = FileLock(TEST_ENTITY + '.lock', timeout=0.05)
+        with lock:
+            self.assertTrue(lock.is_locked)
+
+    def test_07_compare_and_swap(self):
+        '''
+        Metodo para probar que la escritura condicional falla si la entidad
+        cambio desde que se leyo
+        '''
+        stamp = data_store_stamp(TEST_ENTITY)
+        status, new_stamp = commit_data_store(TEST_ENTITY, stamp, data={'e': 5})
+        self.assertEqual(status, 0)
+        self.assertNotEqual(new_stamp, stamp)
+        self.assertEqual(
+            commit_data_store(TEST_ENTITY, stamp, records=[['put', 'f', 6]]),
+            (-8, new_stamp)
+        )
+        self.assertEqual(
+            commit_data_store(TEST_ENTITY, new_stamp, records=[['put', 'f', 6]])[0],
+            0
+        )
+        self.assertEqual(
+            load_data_store(TEST_ENTITY, rebuild),
+            (0, {'e': 5, 'f': 6})
+        )
+
+    def test_08_checkpoint_conflict(self):
+        '''
+        Metodo para probar que no se compacta un diario con registros que
+        no se leyeron
+        '''
+        stamp = data_store_stamp(TEST_ENTITY)
+        append_journal(TEST_ENTITY, [['put', 'g', 7]])
+        self.assertEqual(
+            checkpoint_data_store(
+                TEST_ENTITY, {'e': 5, 'f': 6}, expected_stamp=stamp
+            ),
+            (-8, None)
+        )
+        self.assertEqual(
+            load_data_store(TEST_ENTITY, rebuild),
+            (0, {'e': 5, 'f': 6, 'g': 7})
+        )
+        status, thread = checkpoint_data_store(
+            TEST_ENTITY, {'e': 5, 'f': 6, 'g': 7},
+            expected_stamp=data_store_stamp(TEST_ENTITY)
+        )
+        thread.join()
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            load_data_store(TEST_ENTITY), (0, {'e': 5, 'f': 6, 'g': 7})
+        )
+
+    def test_09_checkpoint_due(self):
+        '''
+        Metodo para probar que se pide compactar segun el tamaño del diario
+        y no segun el del snapshot
+        '''
+        store = FileStore()
+        entity = TEST_ENTITY + '_due'
+        try:
+            append_journal(entity, [['put', 'a', 'x' * JOURNAL_MAX_BYTES]])
+            self.assertFalse(os.path.isfile(entity + '.json'))
+            self.assertTrue(store.checkpoint_due(store.stamp(entity)))
+            _, thread = checkpoint_data_store(
+                entity, load_data_store(entity, rebuild)[1]
+            )
+            thread.join()
+            self.assertFalse(store.checkpoint_due(store.stamp(entity)))
+            append_journal(entity, [['put', 'b', 1]])
+            self.assertFalse(store.checkpoint_due(store.stamp(entity)))
+        finally:
+            for suffix in ('.json', '.lock', '.journal', '.journal.1',
+                           '.version'):
+                if os.path.isfile(entity + suffix):
+                    os.remove(entity + suffix)
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        set_fsync_policy(FSYNC_NONE)
+        for suffix in ('.json', '.lock', '.journal', '.journal.1', '.version'):
+            if os.path.isfile(TEST_ENTITY + suffix):
+                os.remove(TEST_ENTITY + suffix)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,108 +1,294 @@
-'''
-Programa de pruebas para la Clase Reservation
-'''
-import sys
-import unittest
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent.parent))
-from hotel import Hotel
-from customer import Customer
-from reservation import Reservation
-
-class TestReservations(unittest.TestCase):
-    '''
-    Clase para probar reservaciones usando unittest
-    '''
-    @classmethod
-    def setUpClass(cls):
-        '''
-        Metodo para crear el ambiente para las pruebas
-        '''
-        cls._hotel = Hotel()
-        cls._customer = Customer()
-        cls._reservation = Reservation(cls._hotel, cls._customer)
-        result, hotel_data = cls._hotel.create_hotel(
-            'Pretoria Deluxe','125 Delmas Rd',10
-        )
-        print('Hotel creation', result, hotel_data, '\n')
-        result, cls._cust_no = cls._customer.create_customer(
-            'JC','Romo','ID660616185','27832629691',1966
-        )
-        print('Customer creation', result, cls._cust_no, '\n')
-
-    def test_01_create_reservation(self):
-        '''
-        Metodo para probar creacion de reservacion
-        '''
-        self.assertEqual(
-            self._reservation.create_reservation(
-                self._cust_no,
-                'Pretoria Deluxe',
-                1,
-                1,
-                1,
-                5
-            ),
-            ([0], None)
-        )
-
-    def test_02_create_reservation_duplicate(self):
-        '''
-        Metodo para probar creacion de reservacion duplicada
-        '''
-        self.assertEqual(
-            self._reservation.create_reservation(
-                self._cust_no,
-                'Pretoria Deluxe',
-                1,
-                1,
-                1,
-                5
-            ),
-            ([-230], None)
-        )
-
-    def test_03_cancel_reservation(self):
-        '''
-        Metodo para probar cancelacion de reservacion
-        '''
-        self.assertEqual(
-            self._reservation.cancel_reservation(
-                self._cust_no,
-                'Pretoria Deluxe',
-                1,
-                1,
-                1,
-                5
-            ),
-            ([0], None)
-        )
-
-    def test_04_cancel_reservation_missing(self):
-        '''
-        Metodo para probar cancelacion de reservacion no existente
-        '''
-        self.assertEqual(
-            self._reservation.cancel_reservation(
-                self._cust_no,
-                'Pretoria Deluxe',
-                1,
-                1,
-                1,
-                5
-            ),
-            ([-220], None)
-    )
-
-    @classmethod
-    def tearDownClass(cls):
-        '''
-        Metodo para limpiar la ejecucion de las pruebas
-        '''
-        result, _ = cls._hotel.delete_hotel('Pretoria Deluxe')
-        print('\nHotel deletion', result, '\n')
-        result, _ = cls._customer.delete_customer(cls._cust_no)
-        print('Customer deletion', result, '\n')
-
-if __name__ == '__main__':
-    unittest.main()
+'''
+Programa de pruebas para la Clase Reservation
+'''
+import datetime
+import os
+import sys
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import MemoryStore
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+
+class TestReservations(unittest.TestCase):
+    '''
+    Clase para probar reservaciones usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        cls._hotel = Hotel()
+        cls._customer = Customer()
+        cls._reservation = Reservation(cls._hotel, cls._customer)
+        result, hotel_data = cls._hotel.create_hotel(
+            'Pretoria Deluxe','125 Delmas Rd',10
+        )
+        print('Hotel creation', result, hotel_data, '\n')
+        result, cls._cust_no = cls._customer.create_customer(
+            'JC','Romo','ID660616185','27832629691',1966
+        )
+        print('Customer creation', result, cls._cust_no, '\n')
+
+    def test_01_create_reservation(self):
+        '''
+        Metodo para probar creacion de reservacion
+        '''
+        self.assertEqual(
+            self._reservation.create_reservation(
+                self._cust_no,
+                'Pretoria Deluxe',
+                1,
+                1,
+                1,
+                5
+            ),
+            ([0], None)
+        )
+
+    def test_02_create_reservation_duplicate(self):
+        '''
+        Metodo para probar creacion de reservacion duplicada
+        '''
+        self.assertEqual(
+            self._reservation.create_reservation(
+                self._cust_no,
+                'Pretoria Deluxe',
+                1,
+                1,
+                1,
+                5
+            ),
+            ([-230], None)
+        )
+
+    def test_02_list_reservations(self):
+        '''
+        Metodo para probar consulta de reservaciones del cliente
+        '''
+        status, reservations = self._reservation.list_reservations(self._cust_no)
+        self.assertEqual(status, [0])
+        self.assertEqual(
+            reservations,
+            [{
+                'hotel': 'Pretoria Deluxe',
+                'room': 1,
+                'year': datetime.date.today().year,
+                'start_month': 1,
+                'start_day': 1,
+                'days': 5
+            }]
+        )
+
+    def test_03_cancel_reservation(self):
+        '''
+        Metodo para probar cancelacion de reservacion
+        '''
+        self.assertEqual(
+            self._reservation.cancel_reservation(
+                self._cust_no,
+                'Pretoria Deluxe',
+                1,
+                1,
+                1,
+                5
+            ),
+            ([0], None)
+        )
+
+    def test_04_cancel_reservation_missing(self):
+        '''
+        Metodo para probar cancelacion de reservacion no existente
+        '''
+        self.assertEqual(
+            self._reservation.cancel_reservation(
+                self._cust_no,
+                'Pretoria Deluxe',
+                1,
+                1,
+                1,
+                5
+            ),
+            ([-220], None)
+    )
+
+    def test_05_list_reservations_empty(self):
+        '''
+        Metodo para probar consulta de reservaciones despues de cancelar
+        '''
+        self.assertEqual(
+            self._reservation.list_reservations(self._cust_no),
+            ([0], [])
+        )
+
+    def test_06_create_reservations_batch(self):
+        '''
+        Metodo para probar creacion de reservaciones por lote
+        '''
+        self.assertEqual(
+            self._reservation.create_reservations([
+                (self._cust_no, 'Pretoria Deluxe', 1, 2, 1, 3),
+                (self._cust_no, 'Pretoria Deluxe', 1, 2, 2, 3),
+                (self._cust_no, 'Pretoria Deluxe', 2, 2, 2, 3),
+                (self._cust_no, 'Pretoria Gen Z', 1, 2, 1, 3)
+            ]),
+            ([[0], [-230], [0], [-202, 0]], None)
+        )
+
+    def test_07_cancel_reservations_batch(self):
+        '''
+        Metodo para probar cancelacion de reservaciones por lote
+        '''
+        self.assertEqual(
+            self._reservation.cancel_reservations([
+                (self._cust_no, 'Pretoria Deluxe', 1, 2, 1, 3),
+                (self._cust_no, 'Pretoria Deluxe', 2, 2, 2, 3),
+                (self._cust_no, 'Pretoria Deluxe', 2, 2, 2, 3)
+            ]),
+            ([[0], [0], [-220]], None)
+        )
+
+    def test_08_create_reservation_any_room(self):
+        '''
+        Metodo para probar la asignacion automatica de habitacion con las
+        politicas first_fit, best_fit y una función propia
+        '''
+        reservation = Reservation(store=MemoryStore())
+        reservation.hotel.create_hotel('Fit Inn', '1 Main St', 3)
+        _, cust_no = reservation.customer.create_customer(
+            'JC', 'Romo', 'ID660616185', '27832629691', 1966
+        )
+        reservation.create_reservation(cust_no, 'Fit Inn', 1, 1, 1, 2, 2026)
+        reservation.create_reservation(cust_no, 'Fit Inn', 2, 1, 8, 3, 2026)
+
+        # La habitacion 2 queda sin huecos; la 1 dejaria 3 dias sueltos
+        self.assertEqual(
+            reservation.create_reservation_any_room(
+                cust_no, 'Fit Inn', 1, 6, 2, 2026
+            ),
+            ([0], 2)
+        )
+        self.assertEqual(
+            reservation.create_reservation_any_room(
+                cust_no, 'Fit Inn', 1, 6, 2, 2026, 'first_fit'
+            ),
+            ([0], 1)
+        )
+        self.assertEqual(
+            reservation.create_reservation_any_room(
+                cust_no, 'Fit Inn', 1, 6, 2, 2026,
+                lambda room_index, rooms, start, end: rooms[-1]
+            ),
+            ([0], 3)
+        )
+        self.assertEqual(
+            reservation.create_reservation_any_room(
+                cust_no, 'Fit Inn', 1, 7, 1, 2026
+            ),
+            ([-230], None)
+        )
+        self.assertEqual(
+            reservation.create_reservation_any_room(
+                cust_no, 'Fit Inn', 1, 20, 1, 2026, 'worst_fit'
+            ),
+            ([-210], None)
+        )
+        self.assertEqual(
+            reservation.create_reservation_any_room(
+                cust_no, 'Missing Inn', 1, 20, 1, 2026
+            ),
+            ([-202, 0], None)
+        )
+        self.assertEqual(
+            reservation.hotel.find_available_rooms('Fit Inn', 1, 6, 2, 2026),
+            (0, [])
+        )
+
+    def test_09_batch_conflict(self):
+        '''
+        Metodo para probar que una reservacion pendiente de un lote que otra
+        instancia ocupo antes de guardarlo se descarta y se reporta
+        '''
+        store = MemoryStore()
+        Hotel(store=store).create_hotel('Memory Inn', '5 Main St', 3)
+        first = Hotel(store=store)
+        second = Hotel(store=store)
+        first.begin_batch()
+        second.begin_batch()
+        first.reserve_hotel_room('Memory Inn', 1, 'C1', 3, 10, 5, 2026)
+        second.reserve_hotel_room('Memory Inn', 1, 'C2', 3, 10, 5, 2026)
+        second.reserve_hotel_room('Memory Inn', 2, 'C2', 3, 10, 5, 2026)
+        self.assertEqual(first.commit_batch(), (0, None))
+        status, dropped = second.commit_batch()
+        self.assertEqual(status, -230)
+        self.assertEqual(dropped, [{
+            'hotel': 'Memory Inn', 'room': 1, 'customer_no': 'C2',
+            'year': 2026, 'start_month': 3, 'start_day': 10, 'days': 5
+        }])
+        self.assertTrue(Reservation.is_dropped(
+            dropped, 'C2', 'Memory Inn', 1, 3, 12, 1, 2026
+        ))
+        self.assertFalse(Reservation.is_dropped(
+            dropped, 'C2', 'Memory Inn', 2, 3, 10, 5, 2026
+        ))
+        hotel = Hotel(store=store)
+        self.assertEqual(len(hotel.list_customer_reservations('C1')[1]), 1)
+        self.assertEqual(
+            hotel.list_customer_reservations('C2'),
+            (0, [{'hotel': 'Memory Inn', 'room': 2, 'year': 2026,
+                  'start_month': 3, 'start_day': 10, 'days': 5}])
+        )
+
+    def test_10_failed_batch_rollback(self):
+        '''
+        Metodo para probar que los cambios de un lote cuya escritura falla
+        se descartan y no se guardan despues
+        '''
+        store = MemoryStore()
+        reservation = Reservation(store=store)
+        reservation.hotel.create_hotel('Memory Inn', '5 Main St', 3)
+        _, customer_no = reservation.customer.create_customer(
+            'JC', 'Romo', 'ID1', '5551', 1966
+        )
+        commit = store.commit
+        store.commit = lambda *args, **kwargs: (-9, None)
+        self.assertEqual(
+            reservation.create_reservations([
+                (customer_no, 'Memory Inn', 1, 3, 10, 2, 2026),
+                (customer_no, 'Memory Inn', 2, 3, 10, 2, 2026)
+            ]),
+            ([[-9], [-9]], None)
+        )
+        store.commit = commit
+        self.assertEqual(
+            reservation.hotel.find_available_rooms('Memory Inn', 3, 10, 2, 2026),
+            (0, [1, 2, 3])
+        )
+        self.assertEqual(reservation.hotel.flush(), (0, None))
+        self.assertEqual(
+            Hotel(store=store).find_available_rooms(
+                'Memory Inn', 3, 10, 2, 2026
+            ),
+            (0, [1, 2, 3])
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        result, _ = cls._hotel.delete_hotel('Pretoria Deluxe')
+        print('\nHotel deletion', result, '\n')
+        result, _ = cls._customer.delete_customer(cls._cust_no)
+        print('Customer deletion', result, '\n')
+        for file_name in ('hotel.lock', 'hotel.version', 'hotel_customer.json',
+                          'hotel_customer.lock', 'hotel_customer.version',
+                          'customer.lock', 'customer.version'):
+            if os.path.isfile(file_name):
+                os.remove(file_name)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+'''
+Programa de pruebas para la Clase RoomCalendar
+'''
+import sys
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from hotel.room_calendar import RoomCalendar
+
+class TestRoomCalendar(unittest.TestCase):
+    '''
+    Clase para probar RoomCalendar usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        cls._calendar = RoomCalendar()
+
+    def test_01_book(self):
+        '''
+        Metodo para probar reservar un rango de dias
+        '''
+        self.assertTrue(self._calendar.is_free(10, 5))
+        self._calendar.book(10, 5, 'K1')
+        self.assertFalse(self._calendar.is_free(12, 10))
+        self.assertTrue(self._calendar.is_booked_by(10, 5, 'K1'))
+        self.assertFalse(self._calendar.is_booked_by(10, 5, 'K2'))
+        self.assertEqual(self._calendar.customer_at(14), 'K1')
+
+    def test_02_release_partial(self):
+        '''
+        Metodo para probar liberar parte de un rango reservado
+        '''
+        self._calendar.release(11, 2)
+        self.assertEqual(self._calendar.encode(), [[10, 1, 'K1'], [13, 2, 'K1']])
+        self.assertEqual(self._calendar.customer_at(11), '')
+
+    def test_03_decode(self):
+        '''
+        Metodo para probar la conversion desde el formato del archivo
+        '''
+        calendar = RoomCalendar.decode(self._calendar.encode())
+        self.assertEqual(calendar.occupied, self._calendar.occupied)
+        legacy = [[False, '']] * 366
+        legacy[3:5] = [[True, 'K1']] * 2
+        self.assertEqual(RoomCalendar.decode(legacy).encode(), [[3, 2, 'K1']])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+'''
+Programa de pruebas para el servicio de reservaciones
+'''
+import os
+import socket
+import sys
+import threading
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import MemoryStore
+from reservation import Reservation
+from service import BookingService, BookingServer, BookingClient
+from service.service import MAX_LINE_BYTES
+
+TEST_SOCKET = 'service_test.sock'
+
+
+class TestBookingService(unittest.TestCase):
+    '''
+    Clase para probar el servicio y su cliente usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        cls._server = BookingServer(
+            TEST_SOCKET, BookingService(Reservation(store=MemoryStore()))
+        )
+        cls._thread = threading.Thread(target=cls._server.serve_forever)
+        cls._thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        cls._server.shutdown()
+        cls._thread.join()
+        cls._server.server_close()
+
+    def test_01_crud(self):
+        '''
+        Metodo para probar altas, consultas y cambios de hoteles y clientes
+        '''
+        with BookingClient(TEST_SOCKET) as client:
+            self.assertEqual(
+                client.create_hotel('Socket Inn', '1 Main St', 5), (0, None)
+            )
+            self.assertEqual(client.create_hotel('Socket Inn', 'x', 5)[0], -201)
+            status, hotel = client.display_hotel_info('Socket Inn')
+            self.assertEqual((status, hotel['rooms']), (0, 5))
+            status, customer_no = client.create_customer(
+                'JC', 'Romo', 'ID1', '5551', 1966
+            )
+            self.assertEqual(status, 0)
+            status, customer = client.display_customer_info(customer_no)
+            self.assertEqual((status, customer['surname']), (0, 'Romo'))
+
+    def test_02_reservation(self):
+        '''
+        Metodo para probar creacion y cancelacion de reservacion
+        '''
+        with BookingClient(TEST_SOCKET) as client:
+            client.create_hotel('Pipe Inn', '2 Main St', 3)
+            _, customer_no = client.create_customer(
+                'Ana', 'Paz', 'ID2', '5552', 1990
+            )
+            self.assertEqual(
+                client.create_reservation(
+                    customer_no, 'Pipe Inn', 1, 4, 1, 3, 2026
+                ),
+                ([0], None)
+            )
+            self.assertEqual(
+                client.find_available_rooms('Pipe Inn', 4, 2, 1, 2026),
+                (0, [2, 3])
+            )
+            self.assertEqual(
+                client.cancel_reservation(
+                    customer_no, 'Pipe Inn', 1, 4, 1, 3, 2026
+                ),
+                ([0], None)
+            )
+
+    def test_03_pipelined_requests(self):
+        '''
+        Metodo para probar solicitudes enviadas juntas por la misma
+        habitacion, de las que solo una tiene exito.
+        '''
+        with BookingClient(TEST_SOCKET) as client:
+            client.create_hotel('Batch Inn', '3 Main St', 2)
+            _, customer_no = client.create_customer(
+                'Luis', 'Sol', 'ID3', '5553', 1980
+            )
+            results = client.call_many([
+                ('create_reservation',
+                 (customer_no, 'Batch Inn', 1, 5, 1, 2, 2026))
+                for _ in range(5)
+            ])
+            self.assertEqual(
+                sorted(status[0] for status, _ in results), [-230] * 4 + [0]
+            )
+
+    def test_04_bad_requests(self):
+        '''
+        Metodo para probar metodos desconocidos y argumentos erroneos
+        '''
+        with BookingClient(TEST_SOCKET) as client:
+            self.assertEqual(client.call('flush'), (-301, None))
+            self.assertEqual(client.call('create_hotel', 'x'), (-302, None))
+            with self.assertRaises(AttributeError):
+                client.flush()
+
+    def test_06_malformed_method(self):
+        '''
+        Metodo para probar que un metodo que no es texto se rechaza sin
+        cerrar la conexion
+        '''
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as raw:
+            raw.connect(TEST_SOCKET)
+            raw.sendall(b'[1,["x"],[]]\n[2,{},[]]\n')
+            raw.sendall(b'[3,"display_hotel_info",["Nowhere Inn"]]\n')
+            data = b''
+            while data.count(b'\n') < 3:
+                data += raw.recv(4096)
+        self.assertEqual(
+            data.splitlines(),
+            [b'[null,-302,null]', b'[null,-302,null]', b'[3,-202,{}]']
+        )
+
+    def test_05_socket_file(self):
+        '''
+        Metodo para probar que el servidor crea el archivo del socket
+        '''
+        self.assertTrue(os.path.exists(TEST_SOCKET))
+
+    def test_07_line_too_long(self):
+        '''
+        Metodo para probar que una linea demasiado larga se rechaza sin
+        cerrar la conexion
+        '''
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as raw:
+            raw.connect(TEST_SOCKET)
+            raw.sendall(b'[1,"display_hotel_info",["Nowhere Inn"]]\n')
+            raw.sendall(b'x' * (MAX_LINE_BYTES + 2) + b'\n')
+            raw.sendall(b'[2,"display_hotel_info",["Nowhere Inn"]]\n')
+            data = b''
+            while data.count(b'\n') < 3:
+                data += raw.recv(4096)
+        self.assertEqual(
+            data.splitlines(),
+            [b'[1,-202,{}]', b'[null,-303,null]', b'[2,-202,{}]']
+        )
+
+    def test_08_existing_file(self):
+        '''
+        Metodo para probar que el servidor no borra un archivo que no es
+        un socket
+        '''
+        path = 'service_test.txt'
+        with open(path, 'w', encoding='UTF-8') as file:
+            file.write('keep')
+        try:
+            with self.assertRaises(FileExistsError):
+                BookingServer(path, BookingService(Reservation(store=MemoryStore())))
+            with open(path, encoding='UTF-8') as file:
+                self.assertEqual(file.read(), 'keep')
+        finally:
+            os.remove(path)
+
+if __name__ == '__main__':
+    unittest.main()
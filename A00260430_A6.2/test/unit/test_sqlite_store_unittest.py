@@ -0,0 +1,132 @@
+'''
+Programa de pruebas para el store SQLite
+'''
+import os
+import sys
+import unittest
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from persistence import SQLiteStore, VERSION_CONFLICT
+from hotel import Hotel
+from customer import Customer
+from reservation import Reservation
+
+TEST_DB = 'sqlite_test.db'
+
+
+class TestSQLiteStore(unittest.TestCase):
+    '''
+    Clase para probar SQLiteStore usando unittest
+    '''
+    @classmethod
+    def setUpClass(cls):
+        '''
+        Metodo para crear el ambiente para las pruebas
+        '''
+        cls._store = SQLiteStore(TEST_DB)
+
+    def test_01_hotel(self):
+        '''
+        Metodo para probar Hotel con SQLite
+        '''
+        hotel = Hotel(store=self._store)
+        self.assertEqual(hotel.create_hotel('SQL Inn', '3 Main St', 3), (0, None))
+        self.assertEqual(
+            hotel.reserve_hotel_room('SQL Inn', 2, 'K1', 3, 10, 5, 2026),
+            (0, None)
+        )
+        self.assertEqual(
+            hotel.cancel_hotel_reservation('SQL Inn', 2, 'K1', 3, 12, 1, 2026),
+            (0, None)
+        )
+        other = Hotel(store=SQLiteStore(TEST_DB))
+        self.assertEqual(
+            other.find_available_rooms('SQL Inn', 3, 10, 5, 2026),
+            (0, [1, 3])
+        )
+        self.assertEqual(
+            other.find_available_rooms('SQL Inn', 3, 12, 1, 2026),
+            (0, [1, 2, 3])
+        )
+        self.assertEqual(
+            other.display_hotel_info('SQL Inn'),
+            (0, {'name': 'SQL Inn', 'address': '3 Main St', 'rooms': 3})
+        )
+
+    def test_02_customer(self):
+        '''
+        Metodo para probar Customer con SQLite
+        '''
+        customer = Customer(store=self._store)
+        status, customer_no = customer.create_customer(
+            'JC', 'Romo', 'ID1', '5551', 1966
+        )
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            customer.modify_customer_info(
+                customer_no, 'Juan', 'Romo', 'ID1', '5551', 1966
+            )[0],
+            0
+        )
+        self.assertEqual(
+            Customer(store=SQLiteStore(TEST_DB)).display_customer_info(customer_no),
+            (0, {'names': 'Juan', 'surname': 'Romo', 'id_doc_no': 'ID1',
+                 'phone_no': '5551', 'year_dob': 1966})
+        )
+        self.assertEqual(customer.delete_customer(customer_no), (0, None))
+        self.assertEqual(
+            Customer(store=SQLiteStore(TEST_DB)).display_customer_info(customer_no)[0],
+            -102
+        )
+
+    def test_03_reservation(self):
+        '''
+        Metodo para probar Reservation con SQLite
+        '''
+        reservation = Reservation(store=self._store)
+        reservation.hotel.create_hotel('SQL Lodge', '4 Main St', 2)
+        _, customer_no = reservation.customer.create_customer(
+            'Ana', 'Diaz', 'ID2', '5552', 1990
+        )
+        self.assertEqual(
+            reservation.create_reservation(
+                customer_no, 'SQL Lodge', 1, 5, 2, 3, 2026
+            ),
+            ([0], None)
+        )
+        self.assertEqual(
+            Hotel(store=SQLiteStore(TEST_DB)).find_available_rooms(
+                'SQL Lodge', 5, 2, 3, 2026
+            ),
+            (0, [2])
+        )
+
+    def test_04_commit_conflict(self):
+        '''
+        Metodo para probar la escritura condicional y una entidad generica
+        '''
+        stamp = self._store.stamp('sqlite_test')
+        status, new_stamp = self._store.commit('sqlite_test', stamp, data={'a': 1})
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            self._store.commit('sqlite_test', stamp, data={'a': 2}),
+            (VERSION_CONFLICT, new_stamp)
+        )
+        self.assertEqual(
+            self._store.append('sqlite_test', [['put', 'b', 2]]),
+            (0, 0)
+        )
+        self.assertEqual(self._store.load('sqlite_test'), (0, {'a': 1}))
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+        Metodo para limpiar la ejecucion de las pruebas
+        '''
+        cls._store.close()
+        for file_name in (TEST_DB, TEST_DB + '-wal', TEST_DB + '-shm'):
+            if os.path.isfile(file_name):
+                os.remove(file_name)
+
+if __name__ == '__main__':
+    unittest.main()